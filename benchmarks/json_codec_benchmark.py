@@ -0,0 +1,88 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compares the JSON codecs on payloads similar to the ones exchanged with IBM Cloud services.
+
+Run this command from the project root:
+    python -m benchmarks.json_codec_benchmark
+"""
+
+# pylint: disable=missing-docstring
+import timeit
+
+from ibm_cloud_sdk_core import JsonCodec
+from ibm_cloud_sdk_core.json_codec import OrjsonCodec, orjson
+
+
+def resource(i: int) -> dict:
+    return {
+        'id': 'crn:v1:bluemix:public:resource-controller:global:a/1234567890abcdef::resource-instance:{0}'.format(i),
+        'name': 'resource-{0}'.format(i),
+        'description': 'Ressource numéro {0}, créée par le test de performance'.format(i),
+        'created_at': '2026-01-01T00:00:00.000Z',
+        'state': 'active',
+        'tags': ['env:test', 'team:core', 'region:us-south'],
+        'limits': {'cpu': 4, 'memory_gb': 16.5, 'replicas': i % 7},
+        'enabled': i % 2 == 0,
+        'parent': None,
+    }
+
+
+PAYLOADS = {
+    'single resource (~0.5 KB)': resource(1),
+    'list page of 200 resources (~100 KB)': {'total_count': 200, 'resources': [resource(i) for i in range(200)]},
+    'bulk request of 5000 resources (~2.5 MB)': {'documents': [resource(i) for i in range(5000)]},
+}
+
+
+def bench(function, budget: float = 0.5) -> float:
+    """Returns the average time of a call to `function`, in microseconds."""
+    timer = timeit.Timer(function)
+    number, _ = timer.autorange()
+    repeat = max(int(budget / max(timer.timeit(number) / number, 1e-9) / number), 1)
+    return min(timer.repeat(repeat=min(repeat, 5), number=number)) / number * 1e6
+
+
+def main() -> None:
+    codecs = [JsonCodec()]
+    if orjson is not None:
+        codecs.append(OrjsonCodec())
+    else:
+        print('orjson is not installed, only the json package is measured.\n')
+
+    print('{0:<42} {1:<8} {2:>12} {3:>12} {4:>10}'.format('payload', 'codec', 'dumps (us)', 'loads (us)', 'size (B)'))
+    for payload_name, payload in PAYLOADS.items():
+        baseline = None
+        for codec in codecs:
+            encoded = codec.dumps(payload)
+            dumps_time = bench(lambda codec=codec, payload=payload: codec.dumps(payload))
+            loads_time = bench(lambda codec=codec, encoded=encoded: codec.loads(encoded))
+            speedup = ''
+            if baseline is None:
+                baseline = (dumps_time, loads_time)
+            else:
+                speedup = '  (x{0:.1f} dumps, x{1:.1f} loads)'.format(
+                    baseline[0] / dumps_time, baseline[1] / loads_time
+                )
+            print(
+                '{0:<42} {1:<8} {2:>12.1f} {3:>12.1f} {4:>10}{5}'.format(
+                    payload_name, codec.name, dumps_time, loads_time, len(encoded), speedup
+                )
+            )
+
+
+if __name__ == '__main__':
+    main()
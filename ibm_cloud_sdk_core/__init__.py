@@ -16,12 +16,26 @@
 
 classes:
     BaseService: Abstract class for common functionality between each service.
+    AsyncBaseService: Asyncio counterpart of BaseService, used by asynchronous generated SDKs.
     DetailedResponse: The object returned from successful service operations.
     IAMTokenManager: Requests and refreshes IAM tokens using an apikey, and optionally a client_id and client_secret.
     IAMAssumeTokenManager: Requests and refreshes IAM tokens using an apikey and a trusted profile.
     JWTTokenManager: Abstract class for common functionality between each JWT token manager.
     CP4DTokenManager: Requests and refreshes CP4D tokens given a username and password.
+    TokenRefreshScheduler: Refreshes the tokens of many token managers in the background.
+    SessionRegistry: Shares pooled HTTP sessions between clients that send requests to the same host.
+    JsonCodec: Serializes request bodies to JSON and parses JSON response bodies.
+    Pager: Iterates over the items of a paginated list operation, prefetching the next pages.
+    AsyncPager: Asyncio counterpart of Pager.
+    RateLimiter: Limits the rate of the requests sent to each host, adapting it to 429 responses.
+    RetryPolicy: The retry configuration set by enable_retries, with jittered backoff strategies.
+    RetryBudget: Limits retries to a proportion of the requests.
+    CircuitBreaker: Fails requests fast while their host is failing.
+    HedgingPolicy: Sends a copy of the idempotent requests that are slow to respond.
+    HookEvent: A step of a call, passed to the hooks registered with BaseService.add_hook().
     ApiException: Custom exception class for errors returned from service operations.
+    CircuitBreakerOpenException: The ApiException raised while the circuit breaker of a host is open.
+    DeadlineExceededException: The ApiException raised when a call did not complete within its total timeout.
 
 functions:
     datetime_to_string: Serializes a datetime to a string.
@@ -35,9 +49,11 @@ functions:
     get_query_param: Return a query parameter value from a URL
     read_external_sources: Get config object from external sources.
     get_authenticator_from_environment: Get authenticator from external sources.
+    deadline_scope: Bound the time taken by the calls made in a `with` block, token fetches included.
 """
 
 from .base_service import BaseService
+from .async_base_service import AsyncBaseService
 from .detailed_response import DetailedResponse
 from .token_managers.iam_token_manager import IAMTokenManager
 from .token_managers.iam_assume_token_manager import IAMAssumeTokenManager
@@ -47,7 +63,17 @@ from .token_managers.container_token_manager import ContainerTokenManager
 from .token_managers.vpc_instance_token_manager import VPCInstanceTokenManager
 from .token_managers.mcsp_token_manager import MCSPTokenManager
 from .token_managers.mcspv2_token_manager import MCSPV2TokenManager
+from .token_managers.token_refresh_scheduler import TokenRefreshScheduler
+from .session_registry import SessionRegistry
+from .json_codec import JsonCodec, OrjsonCodec
+from .pager import Pager, AsyncPager
+from .rate_limiter import RateLimiter
+from .retry_policy import RetryPolicy, RetryBudget
 from .api_exception import ApiException
+from .circuit_breaker import CircuitBreaker, CircuitBreakerOpenException
+from .hedging import HedgingPolicy
+from .deadline import DeadlineExceededException, deadline_scope
+from .hooks import HookEvent
 from .utils import datetime_to_string, string_to_datetime, read_external_sources
 from .utils import datetime_to_string_list, string_to_datetime_list
 from .utils import date_to_string, string_to_date
@@ -0,0 +1,675 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import io
+import time
+from functools import partial
+from typing import Any, AsyncIterable, AsyncIterator, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple, Union
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE
+from urllib3.util.retry import Retry
+
+from ibm_cloud_sdk_core.authenticators import Authenticator
+from .api_exception import ApiException
+from .base_service import BaseService
+from .deadline import Deadline, DeadlineExceededException, deadline_scope, get_deadline, use_deadline
+from .detailed_response import DEFAULT_CHUNK_SIZE, DetailedResponse
+from .hooks import POST_AUTHENTICATE, PRE_PREPARE, PRE_SEND, RESPONSE_RECEIVED
+from .pager import AsyncPager
+from .retry_policy import EXPONENTIAL, RetryPolicy, compute_backoff
+from .http_adapter import create_ssl_context, get_ssl_context
+from .token_managers.token_manager import TokenManager
+from .utils import is_json_mimetype
+from .logger import get_logger
+
+logger = get_logger()
+
+
+# pylint: disable=invalid-overridden-method,too-many-branches,too-many-locals
+class AsyncBaseService(BaseService):
+    """Common functionality shared by generated asynchronous service classes.
+
+    AsyncBaseService has the same configuration surface as BaseService (service url, authenticator,
+    default headers, http config, gzip compression, retries and external configuration), but its
+    `prepare_request` and `send` methods are coroutines and requests are sent with an asyncio-native
+    `httpx.AsyncClient`, so a single event loop can keep many requests in flight.
+
+    The `httpx` package is an optional dependency and can be installed with:
+    `pip install "ibm-cloud-sdk-core[async]"`
+
+    Keyword Arguments:
+        service_url: Url to the service endpoint. Defaults to None.
+        authenticator: Adds authentication data to service requests. Defaults to None.
+        disable_ssl_verification: A flag that indicates whether verification of the server's SSL
+            certificate should be disabled or not. Defaults to False.
+        enable_gzip_compression: A flag that indicates whether to enable gzip compression on request bodies
+        pool_connections: Not used by the asynchronous http client, which keeps a single pool.
+        pool_maxsize: The maximum number of idle keep-alive connections. Defaults to 10.
+        pool_block: A flag that indicates whether pool_maxsize also limits the number of open
+            connections, so that requests wait for a free connection. Defaults to False.
+
+    Attributes:
+        async_http_client (httpx.AsyncClient): The client used to send requests. It is created
+            on first use from the current ssl and http config settings.
+
+    Raises:
+        ImportError: If the httpx package is not installed.
+        ValueError: If Authenticator is not provided or invalid type.
+    """
+
+    def __init__(
+        self,
+        *,
+        service_url: str = None,
+        authenticator: Optional[Authenticator] = None,
+        disable_ssl_verification: bool = False,
+        enable_gzip_compression: bool = False,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+    ) -> None:
+        if httpx is None:
+            raise ImportError(
+                'AsyncBaseService requires the "httpx" package. '
+                'Install it with: pip install "ibm-cloud-sdk-core[async]"'
+            )
+        self.async_http_client = None
+        self._owns_async_http_client = True
+        self._retired_http_clients = []
+        super().__init__(
+            service_url=service_url,
+            authenticator=authenticator,
+            disable_ssl_verification=disable_ssl_verification,
+            enable_gzip_compression=enable_gzip_compression,
+            pool_connections=pool_connections,
+            pool_maxsize=pool_maxsize,
+            pool_block=pool_block,
+        )
+
+    async def __aenter__(self) -> 'AsyncBaseService':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        """Close the asynchronous http client(s) owned by this service instance."""
+        clients = self._retired_http_clients
+        self._retired_http_clients = []
+        if self._owns_async_http_client and self.async_http_client is not None:
+            clients.append(self.async_http_client)
+            self.async_http_client = None
+        for http_client in clients:
+            await http_client.aclose()
+
+    def get_async_http_client(self) -> 'httpx.AsyncClient':
+        """Get the asynchronous http client currently used by the service.
+
+        Returns:
+            The httpx.AsyncClient instance used to send requests.
+        """
+        if self.async_http_client is None:
+            self.async_http_client = self._build_async_http_client()
+            self._owns_async_http_client = True
+        return self.async_http_client
+
+    def set_async_http_client(self, http_client: 'httpx.AsyncClient') -> None:
+        """Set the asynchronous http client used to send requests.
+
+        The caller remains responsible for closing a client set with this method.
+
+        Arguments:
+            http_client: A new httpx.AsyncClient instance
+        """
+        if not isinstance(http_client, httpx.AsyncClient):
+            raise TypeError("http_client parameter must be an httpx.AsyncClient")
+        self._retire_async_http_client()
+        self.async_http_client = http_client
+        self._owns_async_http_client = False
+
+    def set_http_config(self, http_config: dict) -> None:
+        """Sets the http config dictionary.
+
+        The 'timeout' and 'allow_redirects' values are applied to each request, while the
+        'verify', 'cert' and 'proxies' values are applied to the asynchronous http client.
+
+        Arguments:
+            http_config: Configuration values to customize HTTP behaviors.
+
+        Raises:
+            TypeError: http_config is not a dict.
+        """
+        super().set_http_config(http_config)
+        self._retire_async_http_client()
+
+    def set_disable_ssl_verification(self, status: bool = False) -> None:
+        """Set the flag that indicates whether verification of
+        the server's SSL certificate should be disabled or not.
+
+        Keyword Arguments:
+            status: set to true to disable ssl verification (default: {False})
+        """
+        if self.disable_ssl_verification == status:
+            return
+        super().set_disable_ssl_verification(status)
+        self._retire_async_http_client()
+
+    def set_connection_pool_config(
+        self,
+        *,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+    ) -> None:
+        """Set the sizing and blocking policy of the connection pool used by the service.
+
+        The new settings are applied to a new asynchronous http client, built on the next request.
+
+        Keyword Arguments:
+            pool_connections: Not used by the asynchronous http client.
+            pool_maxsize: The maximum number of idle keep-alive connections.
+            pool_block: A flag that indicates whether pool_maxsize also limits the number of open connections.
+        """
+        super().set_connection_pool_config(
+            pool_connections=pool_connections, pool_maxsize=pool_maxsize, pool_block=pool_block
+        )
+        self._retire_async_http_client()
+
+    def _retire_async_http_client(self) -> None:
+        # Clients can only be closed from a coroutine, so clients we own are kept around
+        # until close() is called and a new one is built on the next request.
+        if self.async_http_client is not None and self._owns_async_http_client:
+            self._retired_http_clients.append(self.async_http_client)
+        self.async_http_client = None
+        self._owns_async_http_client = True
+
+    def _build_async_http_client(self) -> 'httpx.AsyncClient':
+        verify = self.http_config.get('verify')
+        disable_ssl_verification = self.disable_ssl_verification or verify is False
+        ca_certs = verify if isinstance(verify, str) and not disable_ssl_verification else None
+        cert = self.http_config.get('cert')
+        if cert:
+            # A client certificate is loaded into the context, so it can't be a shared one.
+            ssl_context = create_ssl_context(disable_ssl_verification, ca_certs)
+            ssl_context.load_cert_chain(*((cert,) if isinstance(cert, str) else cert))
+        else:
+            ssl_context = get_ssl_context(disable_ssl_verification, ca_certs)
+
+        limits = httpx.Limits(
+            max_connections=self.pool_maxsize if self.pool_block else None,
+            max_keepalive_connections=self.pool_maxsize,
+        )
+
+        mounts = None
+        proxies = self.http_config.get('proxies')
+        if proxies:
+            mounts = {
+                scheme + '://': httpx.AsyncHTTPTransport(verify=ssl_context, limits=limits, proxy=proxy)
+                for scheme, proxy in proxies.items()
+                if proxy
+            }
+        return httpx.AsyncClient(verify=ssl_context, limits=limits, mounts=mounts, cookies=self.jar)
+
+    def send_many(
+        self,
+        requests_to_send: Union[Iterable[dict], AsyncIterable[dict]],
+        *,
+        max_in_flight: Optional[int] = None,
+        ordered: bool = True,
+        **kwargs,
+    ) -> AsyncIterator[Tuple[int, Union[DetailedResponse, Exception]]]:
+        """Send many independent requests concurrently, with a bounded number of requests in flight.
+
+        The requests are sent with send(), through the service's client. They can be an iterable or
+        an asynchronous iterable, for example an async generator of prepare_request() calls, which is
+        consumed as requests complete. See BaseService.send_many for the arguments.
+
+        Returns:
+            An asynchronous iterator of (index, result) tuples, where index is the position of the request
+            and result is its DetailedResponse, or the exception (usually an ApiException) raised by send().
+
+        Raises:
+            ValueError: `max_in_flight` is less than 1.
+        """
+        if max_in_flight is None:
+            max_in_flight = self.pool_maxsize
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1')
+        return self._send_many(requests_to_send, max_in_flight, ordered, kwargs)
+
+    async def _send_many(
+        self,
+        requests_to_send: Union[Iterable[dict], AsyncIterable[dict]],
+        max_in_flight: int,
+        ordered: bool,
+        kwargs: dict,
+    ) -> AsyncIterator[Tuple[int, Union[DetailedResponse, Exception]]]:
+        if hasattr(requests_to_send, '__aiter__'):
+            queued = aiter(requests_to_send)
+        else:
+            queued = self._aiter_requests(requests_to_send)
+        pending = {}
+        completed = {}
+        index = 0
+        next_index = 0
+        try:
+            while True:
+                # Completed results waiting for an earlier request count against the limit.
+                while queued is not None and len(pending) + len(completed) < max_in_flight:
+                    try:
+                        request = await anext(queued)
+                    except StopAsyncIteration:
+                        queued = None
+                        break
+                    pending[asyncio.ensure_future(self._send_or_error(request, kwargs))] = index
+                    index += 1
+                if not pending:
+                    return
+                done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if ordered:
+                        completed[pending.pop(task)] = task.result()
+                    else:
+                        yield pending.pop(task), task.result()
+                while next_index in completed:
+                    yield next_index, completed.pop(next_index)
+                    next_index += 1
+        finally:
+            # Stop sending if the caller doesn't consume all the results.
+            for task in pending:
+                task.cancel()
+
+    async def _send_or_error(self, request: dict, kwargs: dict) -> Union[DetailedResponse, Exception]:
+        try:
+            return await self.send(request, **kwargs)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return err
+
+    @staticmethod
+    async def _aiter_requests(requests_to_send: Iterable[dict]) -> AsyncIterator[dict]:
+        for request in requests_to_send:
+            yield request
+
+    def paginate(
+        self,
+        operation: Callable[..., Awaitable[DetailedResponse]],
+        items_key: str,
+        *,
+        page_param: str = 'start',
+        prefetch: int = 1,
+        next_token: Optional[Callable[[dict], Any]] = None,
+        **params,
+    ) -> AsyncPager:
+        """Returns a pager that iterates over the items of a paginated list operation of this service.
+
+        The pager is an asynchronous iterator over the items of all the pages, and fetches the next
+        pages in a task while the current one is consumed. See BaseService.paginate for the arguments.
+
+        Raises:
+            ValueError: `prefetch` is negative.
+        """
+        return AsyncPager(
+            operation, items_key, page_param=page_param, prefetch=prefetch, next_token=next_token, **params
+        )
+
+    async def prepare_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        data: Optional[Union[str, dict]] = None,
+        files: Optional[Union[Dict[str, Tuple[str]], List[Tuple[str, Tuple[str, ...]]]]] = None,
+        **kwargs,
+    ) -> dict:
+        """Build a dict that represents an HTTP service request.
+
+        This is the asynchronous counterpart of BaseService.prepare_request(); token based
+        authenticators fetch their access token without blocking the event loop.
+
+        Args:
+            method: The HTTP method of the request ex. GET, POST, etc.
+            url: The origin + pathname according to WHATWG spec.
+
+        Keyword Arguments:
+            headers: A dictionary containing the headers to be included in the request.
+                    Entries with a value of None will be ignored (excluded).
+            params: A dictionary containing the query parameters to be included in the request.
+                    Entries with a value of None will be ignored (excluded).
+            data: The request body. Converted to json if a dict.
+            files: 'files' can be a dictionary (i.e { '<part-name>': (<tuple>)}),
+                or a list of tuples [ (<part-name>, (<tuple>))... ]
+
+        Returns:
+            Prepared request dictionary.
+        """
+        # pylint: disable=unused-argument; necessary for kwargs
+        if self._hooks:
+            self._run_hooks(PRE_PREPARE, method, url)
+        request = self._build_request(method, url, headers=headers, params=params, data=data)
+
+        start = time.monotonic()
+        try:
+            with deadline_scope(self.total_timeout) as deadline:
+                await self._authenticate(request)
+        except Exception as err:
+            if self._hooks:
+                self._run_error_hooks(request, start, err)
+            raise
+        if self._hooks:
+            self._run_hooks(POST_AUTHENTICATE, method, request['url'], start=start, request=request)
+        if deadline is not None:
+            self._remember_deadline(request, deadline, start)
+
+        return self._complete_request(request, files)
+
+    async def _authenticate(self, request: dict) -> None:
+        token_manager = getattr(self.authenticator, 'token_manager', None)
+        if isinstance(token_manager, TokenManager):
+            # Make sure a valid token is cached without blocking the event loop,
+            # so that the authenticator below only has to read it.
+            await token_manager.async_get_token()
+        self.authenticator.authenticate(request)
+
+    async def send(self, request: dict, **kwargs) -> DetailedResponse:
+        """Send a request and wrap the response in a DetailedResponse or APIException.
+
+        If the 'stream' argument is True, the result of the DetailedResponse is an unread
+        httpx.Response; the caller should consume it with `aiter_bytes()` and then `aclose()` it.
+
+        Args:
+            request: The request to send to the service endpoint.
+
+        Keyword Arguments:
+            total_timeout: The maximum number of seconds the call may take, including its retries
+                (see set_total_timeout). It is counted from the start of the prepare_request() call
+                if the request has a deadline, else from now. Defaults to the deadline set by
+                prepare_request(), or the total_timeout of the service. The deadline of an
+                enclosing deadline_scope() still applies if it's earlier.
+            kwargs: The other arguments of the request, like timeout and stream.
+
+        Raises:
+            ApiException: The exception from the API.
+            DeadlineExceededException: The call did not complete within its total timeout.
+
+        Returns:
+            The response from the request.
+        """
+        start = time.monotonic()
+        try:
+            return await self._send_and_process(request, **kwargs)
+        except Exception as err:
+            if self._hooks:
+                self._run_error_hooks(request, start, err)
+            raise
+
+    async def _send_and_process(self, request: dict, **kwargs) -> DetailedResponse:
+        # Use a one minute timeout when our caller doesn't give a timeout.
+        kwargs = dict({"timeout": 60}, **kwargs)
+        kwargs = dict(kwargs, **self.http_config)
+
+        deadline = self._pop_deadline(request, kwargs.pop('total_timeout', None))
+        stream_response = kwargs.pop('stream', None) or False
+        follow_redirects = kwargs.pop('allow_redirects', True)
+        timeout = self._to_httpx_timeout(kwargs.pop('timeout'))
+
+        # Remove the keys we set manually, don't let the user overwrite these.
+        reserved_keys = ['method', 'url', 'headers', 'params', 'cookies']
+        silent_keys = ['headers']
+        for key in reserved_keys:
+            if key in kwargs:
+                del kwargs[key]
+                if key not in silent_keys:
+                    logger.warning('"%s" has been removed from the request', key)
+        # These are applied to the http client (see set_http_config) rather than to each request.
+        for key in ['verify', 'cert', 'proxies']:
+            if kwargs.pop(key, None) is not None and key not in self.http_config:
+                logger.warning('"%s" is not supported per request, use set_http_config() instead', key)
+        for key in kwargs:
+            logger.warning('"%s" is not supported by the asynchronous http client', key)
+
+        try:
+            logger.debug('Sending HTTP request message')
+
+            sent_at = None
+            if self._hooks:
+                sent_at = self._run_hooks(
+                    PRE_SEND, request['method'], request['url'], request=request, size=self._get_request_size(request)
+                )
+            send_request = partial(self._send_with_retries, request, timeout, follow_redirects, stream_response)
+            with use_deadline(deadline):
+                response = await self._send_and_reauthenticate(request, send_request)
+
+            logger.debug('Received HTTP response message, status code %d', response.status_code)
+            if self._hooks:
+                self._run_hooks(
+                    RESPONSE_RECEIVED,
+                    request['method'],
+                    request['url'],
+                    start=sent_at,
+                    request=request,
+                    response=response,
+                    size=self._get_response_size(response, stream_response),
+                    elapsed=self._get_elapsed(response),
+                )
+
+            # Process a "success" response.
+            if 200 <= response.status_code <= 299:
+                if response.status_code == 204 or request['method'] == 'HEAD':
+                    # There is no body content for a HEAD response or a 204 response.
+                    result = None
+                elif stream_response:
+                    result = response
+                elif not response.content:
+                    result = None
+                elif is_json_mimetype(response.headers.get('Content-Type')):
+                    # If this is a JSON response, then try to unmarshal it.
+                    if self.lazy_response_parsing:
+                        return DetailedResponse(
+                            result_loader=partial(self._decode_json_response, request, response),
+                            headers=response.headers,
+                            status_code=response.status_code,
+                            json_codec=self.json_codec,
+                        )
+                    result = self._decode_json_response(request, response)
+                else:
+                    # Non-JSON response, just use response body as-is.
+                    result = response
+
+                return DetailedResponse(
+                    response=result,
+                    headers=response.headers,
+                    status_code=response.status_code,
+                    json_codec=self.json_codec,
+                )
+
+            # Received error status code from server, raise an APIException.
+            if stream_response:
+                await response.aread()
+                await response.aclose()
+            raise ApiException(response.status_code, http_response=response)
+        except httpx.ConnectError as err:
+            if 'CERTIFICATE_VERIFY_FAILED' in str(err):
+                logger.exception(self.ERROR_MSG_DISABLE_SSL)
+            raise
+
+    async def _send_and_reauthenticate(
+        self, request: dict, send_request: Callable[[], Awaitable['httpx.Response']]
+    ) -> 'httpx.Response':
+        """Send the request, hedging it if enabled, and send it again with a new token if it is rejected with a 401
+        (see set_reauthenticate_on_401)."""
+        body_positions = self._get_body_positions(request) if self.reauthenticate_on_401 else None
+        self._record_request_in_retry_budget()
+        if self.hedging_policy is not None and self._is_replayable(request):
+            # Each copy of a hedged request has its own retries.
+            response = await self.hedging_policy.call_async(request['method'], send_request)
+        else:
+            response = await send_request()
+
+        if response.status_code == 401 and body_positions is not None and self._invalidate_token(request):
+            logger.debug('Sending the request again with a new access token')
+            await response.aclose()
+            await self._authenticate(request)
+            self._rewind_body(body_positions)
+            response = await send_request()
+        return response
+
+    async def _send_with_retries(
+        self, request: dict, timeout: 'httpx.Timeout', follow_redirects: bool, stream: bool
+    ) -> 'httpx.Response':
+        """Send the request, retrying it as described by `retry_config` (see `enable_retries`).
+
+        Requests with a streamed (file-like) body or multipart files can't be replayed and are sent only once.
+        When the call has a deadline, each attempt gets no more than the time left, and a
+        DeadlineExceededException is raised rather than waiting for a retry that would start too late.
+        """
+        http_client = self.get_async_http_client()
+        retry = self.retry_config
+        deadline = get_deadline()
+        replayable = self._is_replayable(request)
+        method = request['method'].upper()
+        attempt = 0
+        delay = 0.0
+        while True:
+            http_request = http_client.build_request(
+                method,
+                request['url'],
+                headers=request['headers'],
+                params=request['params'],
+                timeout=timeout if deadline is None else self._cap_httpx_timeout(timeout, deadline),
+                **self._httpx_body(request),
+            )
+            can_retry = retry is not None and replayable and attempt < retry.total and method in retry.allowed_methods
+            attempt += 1
+            send = partial(http_client.send, http_request, stream=stream, follow_redirects=follow_redirects)
+            if self.circuit_breaker is not None:
+                # A CircuitBreakerOpenException ends the retries.
+                send = partial(self.circuit_breaker.call_async, request['url'], send)
+            try:
+                response = await self._call_before_deadline(partial(self._send_attempt, request['url'], send), deadline)
+            except httpx.TransportError as err:
+                if deadline is not None and deadline.expired():
+                    raise DeadlineExceededException(deadline.total_timeout) from err
+                if not can_retry or not self._acquire_retry(retry):
+                    raise
+                logger.debug('Retrying HTTP request after error: %s', err)
+                delay = self._retry_backoff(retry, attempt, delay)
+                self._check_retry_deadline(delay, deadline)
+                await asyncio.sleep(delay)
+                continue
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_response(request['url'], response.status_code, response.headers)
+
+            retry_after = response.headers.get('Retry-After')
+            if (
+                not can_retry
+                or not retry.is_retry(method, response.status_code, retry_after is not None)
+                or not self._acquire_retry(retry)
+            ):
+                return response
+
+            if stream:
+                await response.aclose()
+            delay = self._retry_backoff(retry, attempt, delay)
+            if retry_after is not None and retry.respect_retry_after_header:
+                delay = retry.parse_retry_after(retry_after)
+            self._check_retry_deadline(delay, deadline)
+            logger.debug('Retrying HTTP request after status code %d', response.status_code)
+            await asyncio.sleep(delay)
+
+    async def _send_attempt(self, url: str, send: Callable[[], Awaitable['httpx.Response']]) -> 'httpx.Response':
+        # The token is acquired before the circuit breaker starts timing the attempt.
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire_async(url)
+        return await send()
+
+    @staticmethod
+    async def _call_before_deadline(send: Callable[[], Awaitable[Any]], deadline: Optional[Deadline]) -> Any:
+        if deadline is None:
+            return await send()
+        remaining = deadline.cap(None)
+        try:
+            return await asyncio.wait_for(send(), remaining)
+        except asyncio.TimeoutError as err:
+            raise DeadlineExceededException(deadline.total_timeout) from err
+
+    @staticmethod
+    def _check_retry_deadline(delay: float, deadline: Optional[Deadline]) -> None:
+        # Give up now rather than waiting for a retry that would start after the deadline.
+        if deadline is not None and delay >= deadline.remaining():
+            logger.debug('Not retrying, the deadline would be exceeded')
+            raise DeadlineExceededException(deadline.total_timeout)
+
+    @staticmethod
+    def _retry_backoff(retry: Retry, attempt: int, previous: float) -> float:
+        if isinstance(retry, RetryPolicy):
+            return compute_backoff(
+                retry.backoff_strategy, attempt, retry.backoff_factor, retry.backoff_max, previous=previous
+            )
+        # Mirror urllib3's exponential backoff: no wait before the first retry.
+        return compute_backoff(EXPONENTIAL, attempt, retry.backoff_factor, retry.backoff_max)
+
+    @staticmethod
+    def _acquire_retry(retry: Retry) -> bool:
+        return not isinstance(retry, RetryPolicy) or retry.acquire_retry()
+
+    @classmethod
+    def _httpx_body(cls, request: dict) -> dict:
+        data = request.get('data')
+        files = request.get('files')
+        body = {}
+        if files:
+            body['files'] = files
+        if isinstance(data, io.IOBase):
+            body['content'] = cls._aiter_body(data)
+        elif isinstance(data, dict):
+            if data:
+                body['data'] = data
+        elif data is not None:
+            body['content'] = data
+        return body
+
+    @classmethod
+    async def _aiter_body(cls, data: io.IOBase) -> AsyncIterator[bytes]:
+        # Read fixed-size chunks (not lines) in a thread, so that reading the file doesn't block the event loop.
+        while True:
+            chunk = await asyncio.to_thread(data.read, DEFAULT_CHUNK_SIZE)
+            if not chunk:
+                return
+            # Encode text like streams (e.g. TextIOWrapper) to bytes.
+            yield chunk.encode() if isinstance(chunk, str) else chunk
+
+    @staticmethod
+    def _cap_httpx_timeout(timeout: 'httpx.Timeout', deadline: Deadline) -> 'httpx.Timeout':
+        return httpx.Timeout(
+            connect=deadline.cap(timeout.connect),
+            read=deadline.cap(timeout.read),
+            write=deadline.cap(timeout.write),
+            pool=deadline.cap(timeout.pool),
+        )
+
+    @staticmethod
+    def _to_httpx_timeout(timeout: Union[None, float, Tuple[float, float]]) -> 'httpx.Timeout':
+        # requests accepts either a single value or a (connect, read) tuple.
+        if isinstance(timeout, tuple):
+            return httpx.Timeout(timeout[1], connect=timeout[0])
+        return httpx.Timeout(timeout)
@@ -14,24 +14,57 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import gzip
+# pylint: disable=too-many-lines
 import io
 import logging
 import json as json_import
+import os
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from functools import partial
 from http.cookiejar import CookieJar
 from http import client
 from os.path import basename
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from urllib3.util.retry import Retry
 
 import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
+from requests.cookies import extract_cookies_to_jar
 from requests.structures import CaseInsensitiveDict
-from requests.exceptions import JSONDecodeError
 
 from ibm_cloud_sdk_core.authenticators import Authenticator
 from .api_exception import ApiException
+from .circuit_breaker import CircuitBreaker
 from .detailed_response import DetailedResponse
+from .compression import get_codec
+from .deadline import (
+    Deadline,
+    DeadlineExceededException,
+    DeadlineTimeout,
+    deadline_scope,
+    earliest_deadline,
+    get_deadline,
+    use_deadline,
+)
+from .hedging import HedgingPolicy
 from .http_adapter import SSLHTTPAdapter
+from .hooks import (
+    ERROR,
+    HOOK_EVENTS,
+    POST_AUTHENTICATE,
+    POST_DECODE,
+    PRE_PREPARE,
+    PRE_SEND,
+    RESPONSE_RECEIVED,
+    HookEvent,
+)
+from .json_codec import JSON_CODECS, JsonCodec, get_json_codec as get_default_json_codec
+from .pager import Pager
+from .rate_limiter import RateLimiter, rate_limited_request
+from .retry_policy import EXPONENTIAL, RetryBudget, RetryPolicy
+from .session_registry import SessionRegistry
 from .token_managers.token_manager import TokenManager
 from .utils import (
     has_bad_first_or_last_char,
@@ -40,7 +73,6 @@ from .utils import (
     cleanup_values,
     read_external_sources,
     strip_extra_slashes,
-    GzipStream,
 )
 from .private_helpers import _build_user_agent
 from .logger import (
@@ -53,6 +85,9 @@ logger = get_logger()
 
 # pylint: disable=too-many-instance-attributes
 # pylint: disable=too-many-locals
+# pylint: disable=too-many-branches
+# pylint: disable=too-many-public-methods
+# pylint: disable=too-many-statements
 class BaseService:
     """Common functionality shared by generated service classes.
 
@@ -65,6 +100,12 @@ class BaseService:
         disable_ssl_verification: A flag that indicates whether verification of the server's SSL
             certificate should be disabled or not. Defaults to False.
         enable_gzip_compression: A flag that indicates whether to enable gzip compression on request bodies
+        pool_connections: The number of connection pools (one per host) to cache. Defaults to 10.
+        pool_maxsize: The maximum number of connections to keep in each pool. This should be at least
+            the number of threads that send requests concurrently through the service. Defaults to 10.
+        pool_block: A flag that indicates whether requests should wait for a free connection when a pool
+            has pool_maxsize connections in use, rather than opening a connection that is discarded
+            after the request. Defaults to False.
 
     Attributes:
         service_url (str): Url to the service endpoint.
@@ -77,6 +118,23 @@ class BaseService:
         http_client (Session): A configurable session which can use Transport Adapters to configure retries, timeouts,
             proxies, etc. globally for all requests.
         enable_gzip_compression (bool): A flag that indicates whether to enable gzip compression on request bodies
+            (or, more generally, compression with the coding set by set_request_compression).
+        compression_encoding (str): The content coding used to compress request bodies. Defaults to 'gzip'.
+        compression_level (int): The compression level, or None for the coding's default level.
+        compression_min_size (int): Request bodies smaller than this number of bytes are not compressed.
+        json_codec (JsonCodec): The codec used to serialize request bodies and parse response bodies,
+            or None to use the default codec returned by json_codec.get_json_codec().
+        lazy_response_parsing (bool): A flag that indicates whether JSON response bodies are parsed
+            when the result of the DetailedResponse is first accessed. Defaults to False.
+        reauthenticate_on_401 (bool): A flag that indicates whether a request rejected with a 401 status code
+            is sent again once with a new access token. Defaults to False.
+        rate_limiter (RateLimiter): Limits the rate of the requests sent by the service, or None.
+        circuit_breaker (CircuitBreaker): Fails requests fast while their host is failing, or None.
+        hedging_policy (HedgingPolicy): Sends a copy of the idempotent requests that are slow to respond, or None.
+        total_timeout (float): The maximum number of seconds a call may take, including its retries, or None.
+        pool_connections (int): The number of connection pools to cache.
+        pool_maxsize (int): The maximum number of connections to keep in each pool.
+        pool_block (bool): A flag that indicates whether requests wait for a free connection when a pool is full.
     Raises:
         ValueError: If Authenticator is not provided or invalid type.
     """
@@ -95,7 +153,11 @@ class BaseService:
         authenticator: Optional[Authenticator] = None,
         disable_ssl_verification: bool = False,
         enable_gzip_compression: bool = False,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
     ) -> None:
+        self._transport_registry = None
         self.set_service_url(service_url)
         self.http_client = requests.Session()
         self.http_config = {}
@@ -104,9 +166,29 @@ class BaseService:
         self.disable_ssl_verification = disable_ssl_verification
         self.default_headers = None
         self.enable_gzip_compression = enable_gzip_compression
+        self.compression_encoding = 'gzip'
+        self.compression_level = None
+        self.compression_min_size = 0
+        self.json_codec = None
+        self.lazy_response_parsing = False
+        self.reauthenticate_on_401 = False
+        # The hooks of each event, as tuples so that they can be run while others are added.
+        self._hooks: Dict[str, Tuple[Callable[[HookEvent], None], ...]] = {}
+        self.rate_limiter = None
+        self.circuit_breaker = None
+        self.hedging_policy = None
+        # The deadlines of the calls started by prepare_request(), with the request and the start
+        # of the call, by request id until the request is sent.
+        self._prepared_deadlines: Dict[int, Tuple[dict, Deadline, float]] = {}
+        # True if the hedging policy was created by enable_hedging(), and must be closed when it's replaced.
+        self._owns_hedging_policy = False
+        self.total_timeout = None
         self._set_user_agent_header(_build_user_agent())
         self.retry_config = None
-        self.http_adapter = SSLHTTPAdapter(_disable_ssl_verification=self.disable_ssl_verification)
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.pool_block = pool_block
+        self.http_adapter = self._create_http_adapter()
         if not self.authenticator:
             raise ValueError('authenticator must be provided')
         if not isinstance(self.authenticator, Authenticator):
@@ -121,7 +203,14 @@ class BaseService:
             # use the debug logger instead of the bare Python print.
             client.print = lambda *args: logger.debug(LoggingFilter.filter_message(" ".join(args)))
 
-    def enable_retries(self, max_retries: int = 4, retry_interval: float = 30.0) -> None:
+    def enable_retries(
+        self,
+        max_retries: int = 4,
+        retry_interval: float = 30.0,
+        *,
+        backoff_strategy: str = EXPONENTIAL,
+        retry_budget: Optional[RetryBudget] = None,
+    ) -> None:
         """Enable automatic retries on the underlying http client used by the BaseService instance.
 
         Args:
@@ -129,10 +218,22 @@ class BaseService:
           retry_interval: the maximum wait time (in seconds) to use for retry attempts.
             In general, if a response includes the Retry-After header, that will be used for
             the wait time associated with the retry attempt.  If the Retry-After header is not
-            present, then the wait time is based on an exponential backoff policy with a maximum
-            backoff time of "retry_interval".
+            present, then the wait time is based on the backoff strategy, with a base delay of
+            one second and a maximum backoff time of "retry_interval".
+
+        Keyword Arguments:
+          backoff_strategy: how the wait time grows between retries: 'exponential' (without jitter),
+            'full_jitter', 'equal_jitter' or 'decorrelated_jitter' (see retry_policy.compute_backoff).
+            The jittered strategies spread the retries of many clients over time, rather than
+            retrying in lock-step. Defaults to 'exponential'.
+          retry_budget: limits the retries to a proportion of the requests, so that retries fail fast
+            rather than piling onto a failing service. It can be shared by several services.
+            Defaults to None (no limit besides max_retries).
+
+        Raises:
+          ValueError: the backoff strategy is not supported.
         """
-        self.retry_config = Retry(
+        self.retry_config = RetryPolicy(
             total=max_retries,
             backoff_factor=1.0,
             backoff_max=retry_interval,
@@ -141,22 +242,275 @@ class BaseService:
             # List of HTTP methods to retry on
             # Omitting this will default to all methods except POST
             allowed_methods=['HEAD', 'GET', 'PUT', 'DELETE', 'OPTIONS', 'TRACE', 'POST'],
+            backoff_strategy=backoff_strategy,
+            retry_budget=retry_budget,
         )
-        self.http_adapter = SSLHTTPAdapter(
-            max_retries=self.retry_config, _disable_ssl_verification=self.disable_ssl_verification
+        if not self._update_shared_transport():
+            # Swap the retry policy in place, so the adapter keeps its pooled connections.
+            self.http_adapter.max_retries = self.retry_config
+            self._mount_http_adapter()
+        logger.debug(
+            'Enabled retries; max_retries=%d, max_retry_interval=%f, backoff_strategy=%s, retry_budget=%s',
+            max_retries,
+            retry_interval,
+            backoff_strategy,
+            retry_budget is not None,
         )
-        self.http_client.mount('http://', self.http_adapter)
-        self.http_client.mount('https://', self.http_adapter)
-        logger.debug('Enabled retries; max_retries=%d, max_retry_interval=%f', max_retries, retry_interval)
 
     def disable_retries(self):
         """Remove retry config from http_adapter"""
         self.retry_config = None
-        self.http_adapter = SSLHTTPAdapter(_disable_ssl_verification=self.disable_ssl_verification)
-        self.http_client.mount('http://', self.http_adapter)
-        self.http_client.mount('https://', self.http_adapter)
+        if not self._update_shared_transport():
+            self.http_adapter.max_retries = Retry.from_int(DEFAULT_RETRIES)
+            self._mount_http_adapter()
         logger.debug('Disabled retries')
 
+    def enable_rate_limiting(
+        self, rate: float, *, burst: Optional[float] = None, per: str = 'host', min_rate: Optional[float] = None
+    ) -> None:
+        """Limit the rate of the requests sent by the service, on the client.
+
+        Requests wait for their turn before they are sent, so that concurrent callers don't cause
+        429 responses and retry storms. The rate is reduced after 429 responses and follows the
+        Retry-After and X-RateLimit-* headers sent by the server (see RateLimiter).
+
+        Args:
+            rate: The maximum number of requests per second.
+
+        Keyword Arguments:
+            burst: The number of requests that can be sent at once, after a period of inactivity.
+                Defaults to `rate`.
+            per: 'host' to limit the requests to each host, or 'path' to limit the requests to each
+                request path separately. Defaults to 'host'.
+            min_rate: The rate is never reduced below this number of requests per second.
+                Defaults to 1% of `rate`.
+
+        Raises:
+            ValueError: An argument is not valid.
+        """
+        self.set_rate_limiter(RateLimiter(rate, burst=burst, per=per, min_rate=min_rate))
+        logger.debug('Enabled rate limiting; rate=%f, burst=%s, per=%s', rate, burst, per)
+
+    def set_rate_limiter(self, rate_limiter: Optional[RateLimiter]) -> None:
+        """Set the rate limiter of the service, for example to share one with other services.
+
+        Args:
+            rate_limiter: The rate limiter, or None to disable rate limiting.
+        """
+        self.rate_limiter = rate_limiter
+
+    def disable_rate_limiting(self) -> None:
+        """Remove the rate limiter of the service."""
+        self.set_rate_limiter(None)
+
+    def get_rate_limiter(self) -> Optional[RateLimiter]:
+        """Get the rate limiter of the service, to inspect its current rate and queue depth."""
+        return self.rate_limiter
+
+    def enable_circuit_breaker(self, **kwargs) -> None:
+        """Fail requests fast, with a CircuitBreakerOpenException, while their host is failing.
+
+        When too many of the recent requests to a host failed (or were slow), the requests to that
+        host are not sent for a while, then a few probe requests are sent to check whether it recovered.
+        The duration compared with slow_call_duration doesn't include the waits for the rate limiter,
+        nor the waits between retries.
+
+        Keyword Arguments:
+            kwargs: The settings of the breaker, like failure_rate_threshold, slow_call_duration
+                and open_timeout (see CircuitBreaker).
+
+        Raises:
+            ValueError: A setting is not valid.
+        """
+        self.set_circuit_breaker(CircuitBreaker(**kwargs))
+        logger.debug('Enabled circuit breaker; %s', kwargs)
+
+    def set_circuit_breaker(self, circuit_breaker: Optional[CircuitBreaker]) -> None:
+        """Set the circuit breaker of the service, for example to share one with other services.
+
+        Args:
+            circuit_breaker: The circuit breaker, or None to disable it.
+        """
+        self.circuit_breaker = circuit_breaker
+
+    def disable_circuit_breaker(self) -> None:
+        """Remove the circuit breaker of the service."""
+        self.set_circuit_breaker(None)
+
+    def get_circuit_breaker(self) -> Optional[CircuitBreaker]:
+        """Get the circuit breaker of the service, to inspect the state of each host."""
+        return self.circuit_breaker
+
+    def enable_hedging(self, delay: Optional[float] = None, **kwargs) -> None:
+        """Send a copy of the idempotent requests that are slow to respond, and use the first successful response.
+
+        This reduces the latency of the slowest requests, at the cost of sending more requests.
+
+        Args:
+            delay: The number of seconds to wait for a response before sending a copy of the request,
+                or None to use the 95th percentile of the latency of recent requests. Defaults to None.
+
+        Keyword Arguments:
+            kwargs: The other settings of the hedging policy, like percentile, max_hedges
+                and budget (see HedgingPolicy).
+
+        Raises:
+            ValueError: A setting is not valid.
+        """
+        self.set_hedging_policy(HedgingPolicy(delay=delay, **kwargs))
+        self._owns_hedging_policy = True
+        logger.debug('Enabled request hedging; delay: %s, %s', delay, kwargs)
+
+    def set_hedging_policy(self, hedging_policy: Optional[HedgingPolicy]) -> None:
+        """Set the hedging policy of the service, for example to share one with other services.
+
+        Args:
+            hedging_policy: The hedging policy, or None to disable hedging. It is not closed
+                when it's replaced, since it may be shared.
+        """
+        if self._owns_hedging_policy and self.hedging_policy is not hedging_policy:
+            self.hedging_policy.close()
+        self.hedging_policy = hedging_policy
+        self._owns_hedging_policy = False
+
+    def disable_hedging(self) -> None:
+        """Stop hedging requests."""
+        self.set_hedging_policy(None)
+
+    def get_hedging_policy(self) -> Optional[HedgingPolicy]:
+        """Get the hedging policy of the service, to inspect its metrics."""
+        return self.hedging_policy
+
+    def set_total_timeout(self, total_timeout: Optional[float]) -> None:
+        """Set the maximum number of seconds each call may take.
+
+        The timeout bounds the whole call: the attempts, their retries and the waits between them.
+        The connect and read timeouts of each attempt are reduced to the time left, and the call
+        fails with a DeadlineExceededException rather than waiting for a retry that would start too late.
+        The call starts in prepare_request(): its token fetch and send() share the same deadline.
+        To bound several calls with a single deadline, use the deadline_scope() context manager.
+
+        Args:
+            total_timeout: The number of seconds, or None for no limit besides the timeout of each attempt.
+
+        Raises:
+            ValueError: The timeout is not positive.
+        """
+        if total_timeout is not None and total_timeout <= 0:
+            raise ValueError('total_timeout must be positive')
+        self.total_timeout = total_timeout
+
+    def enable_shared_transport(self, registry: Optional[SessionRegistry] = None) -> None:
+        """Send requests through a session and connection pool shared with other service instances.
+
+        Services that send requests to the same host with the same SSL verification mode, retry
+        policy and pool settings share one session from the registry, so they reuse each other's
+        connections instead of each opening their own. When one of these settings is changed later,
+        the service switches to the session that matches the new settings; the shared session itself
+        is never modified.
+
+        Shared sessions don't store cookies, so the cookies received by the service are kept in its
+        `jar` instead, which is not shared with other services. A session set with set_http_client()
+        replaces the shared one and disables the shared transport.
+
+        Args:
+            registry: The registry that holds the shared sessions. Defaults to the
+                process-wide registry returned by SessionRegistry.get_default().
+        """
+        self._transport_registry = registry or SessionRegistry.get_default()
+        self._update_shared_transport()
+        logger.debug('Enabled shared transport')
+
+    def disable_shared_transport(self) -> None:
+        """Go back to a session and connection pool owned by this service instance."""
+        if self._transport_registry is None:
+            return
+        self._transport_registry = None
+        self.http_client = requests.Session()
+        self.http_adapter = self._create_http_adapter()
+        self._mount_http_adapter()
+        logger.debug('Disabled shared transport')
+
+    def is_shared_transport_enabled(self) -> bool:
+        """Returns true if the service sends requests through a shared session, false otherwise."""
+        return self._transport_registry is not None
+
+    def _update_shared_transport(self) -> bool:
+        """Switch to the shared session that matches the current settings.
+
+        Returns:
+            True if the shared transport is enabled, false otherwise.
+        """
+        if self._transport_registry is None:
+            return False
+        self.http_client = self._transport_registry.get_session(
+            self.service_url,
+            disable_ssl_verification=self.disable_ssl_verification,
+            max_retries=self.retry_config,
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+        )
+        self.http_adapter = self.http_client.get_adapter('https://')
+        return True
+
+    def _create_http_adapter(self) -> SSLHTTPAdapter:
+        """Create an adapter, owned by this service instance, with the current settings."""
+        return SSLHTTPAdapter(
+            pool_connections=self.pool_connections,
+            pool_maxsize=self.pool_maxsize,
+            pool_block=self.pool_block,
+            max_retries=self.retry_config or DEFAULT_RETRIES,
+            _disable_ssl_verification=self.disable_ssl_verification,
+        )
+
+    def _mount_http_adapter(self) -> None:
+        """Mount the http adapter on the http client, unless it's already mounted."""
+        for prefix in ['http://', 'https://']:
+            if self.http_client.get_adapter(prefix) is not self.http_adapter:
+                self.http_client.mount(prefix, self.http_adapter)
+
+    def set_connection_pool_config(
+        self,
+        *,
+        pool_connections: Optional[int] = None,
+        pool_maxsize: Optional[int] = None,
+        pool_block: Optional[bool] = None,
+    ) -> None:
+        """Set the sizing and blocking policy of the connection pools used by the service.
+
+        The pools are re-created with the new settings, so this is best called before the
+        first request is sent; connections opened by earlier requests are closed.
+
+        Keyword Arguments:
+            pool_connections: The number of connection pools (one per host) to cache.
+            pool_maxsize: The maximum number of connections to keep in each pool.
+            pool_block: A flag that indicates whether requests should wait for a free connection
+                when a pool is full.
+            Settings that are not specified (or None) are left unchanged.
+
+        Raises:
+            ValueError: If pool_connections or pool_maxsize is less than 1.
+        """
+        for name, value in [('pool_connections', pool_connections), ('pool_maxsize', pool_maxsize)]:
+            if value is not None and value < 1:
+                raise ValueError('{0} must be at least 1'.format(name))
+        if pool_connections is not None:
+            self.pool_connections = pool_connections
+        if pool_maxsize is not None:
+            self.pool_maxsize = pool_maxsize
+        if pool_block is not None:
+            self.pool_block = pool_block
+        if not self._update_shared_transport():
+            self.http_adapter.set_pool_config(self.pool_connections, self.pool_maxsize, self.pool_block)
+            self._mount_http_adapter()
+        logger.debug(
+            'Set connection pool config; pool_connections=%d, pool_maxsize=%d, pool_block=%s',
+            self.pool_connections,
+            self.pool_maxsize,
+            self.pool_block,
+        )
+
     def configure_service(self, service_name: str) -> None:
         """Look for external configuration of a service. Set service properties.
 
@@ -183,6 +537,19 @@ class BaseService:
             self.set_disable_ssl_verification(config.get('DISABLE_SSL').lower() == 'true')
         if config.get('ENABLE_GZIP'):
             self.set_enable_gzip_compression(config.get('ENABLE_GZIP').lower() == 'true')
+        if config.get('COMPRESSION') or config.get('COMPRESSION_LEVEL') or config.get('COMPRESSION_MIN_SIZE'):
+            encoding = (config.get('COMPRESSION') or self.compression_encoding).lower()
+            if encoding == 'none':
+                self.set_enable_gzip_compression(False)
+            else:
+                # The level and minimum size alone don't enable compression, ENABLE_GZIP or COMPRESSION does.
+                enabled = self.get_enable_gzip_compression() or bool(config.get('COMPRESSION'))
+                self.set_request_compression(
+                    encoding,
+                    level=int(config.get('COMPRESSION_LEVEL')) if config.get('COMPRESSION_LEVEL') else None,
+                    min_size=int(config.get('COMPRESSION_MIN_SIZE') or 0),
+                )
+                self.set_enable_gzip_compression(enabled)
         if config.get('ENABLE_RETRIES'):
             if config.get('ENABLE_RETRIES').lower() == 'true':
                 kwargs = {}
@@ -190,7 +557,68 @@ class BaseService:
                     kwargs["max_retries"] = int(config.get('MAX_RETRIES'))
                 if config.get('RETRY_INTERVAL'):
                     kwargs["retry_interval"] = float(config.get('RETRY_INTERVAL'))
+                if config.get('RETRY_BACKOFF'):
+                    kwargs["backoff_strategy"] = config.get('RETRY_BACKOFF').lower()
+                if config.get('RETRY_BUDGET'):
+                    budget_config = {}
+                    if config.get('RETRY_BUDGET_MIN_PER_SECOND'):
+                        budget_config['min_retries_per_second'] = float(config.get('RETRY_BUDGET_MIN_PER_SECOND'))
+                    kwargs["retry_budget"] = RetryBudget(float(config.get('RETRY_BUDGET')), **budget_config)
                 self.enable_retries(**kwargs)
+        pool_config = {}
+        if config.get('POOL_CONNECTIONS'):
+            pool_config['pool_connections'] = int(config.get('POOL_CONNECTIONS'))
+        if config.get('POOL_MAXSIZE'):
+            pool_config['pool_maxsize'] = int(config.get('POOL_MAXSIZE'))
+        if config.get('POOL_BLOCK'):
+            pool_config['pool_block'] = config.get('POOL_BLOCK').lower() == 'true'
+        if pool_config:
+            self.set_connection_pool_config(**pool_config)
+        if config.get('RATE_LIMIT'):
+            rate_limit_config = {}
+            if config.get('RATE_LIMIT_BURST'):
+                rate_limit_config['burst'] = float(config.get('RATE_LIMIT_BURST'))
+            if config.get('RATE_LIMIT_PER'):
+                rate_limit_config['per'] = config.get('RATE_LIMIT_PER').lower()
+            self.enable_rate_limiting(float(config.get('RATE_LIMIT')), **rate_limit_config)
+        if config.get('CIRCUIT_BREAKER'):
+            if config.get('CIRCUIT_BREAKER').lower() == 'true':
+                breaker_config = {}
+                if config.get('CIRCUIT_BREAKER_FAILURE_RATE'):
+                    breaker_config['failure_rate_threshold'] = float(config.get('CIRCUIT_BREAKER_FAILURE_RATE'))
+                if config.get('CIRCUIT_BREAKER_SLOW_CALL_DURATION'):
+                    breaker_config['slow_call_duration'] = float(config.get('CIRCUIT_BREAKER_SLOW_CALL_DURATION'))
+                if config.get('CIRCUIT_BREAKER_OPEN_TIMEOUT'):
+                    breaker_config['open_timeout'] = float(config.get('CIRCUIT_BREAKER_OPEN_TIMEOUT'))
+                self.enable_circuit_breaker(**breaker_config)
+            else:
+                self.disable_circuit_breaker()
+        if config.get('HEDGING'):
+            if config.get('HEDGING').lower() == 'true':
+                hedging_config = {}
+                if config.get('HEDGING_DELAY'):
+                    hedging_config['delay'] = float(config.get('HEDGING_DELAY'))
+                if config.get('HEDGING_PERCENTILE'):
+                    hedging_config['percentile'] = float(config.get('HEDGING_PERCENTILE'))
+                if config.get('HEDGING_BUDGET'):
+                    hedging_config['budget'] = RetryBudget(float(config.get('HEDGING_BUDGET')))
+                self.enable_hedging(**hedging_config)
+            else:
+                self.disable_hedging()
+        if config.get('REAUTHENTICATE_ON_401'):
+            self.set_reauthenticate_on_401(config.get('REAUTHENTICATE_ON_401').lower() == 'true')
+        if config.get('TOTAL_TIMEOUT'):
+            self.set_total_timeout(float(config.get('TOTAL_TIMEOUT')))
+        if config.get('JSON_CODEC'):
+            codec_name = config.get('JSON_CODEC').lower()
+            if codec_name not in JSON_CODECS:
+                raise ValueError('JSON_CODEC must be one of: {0}'.format(', '.join(JSON_CODECS)))
+            self.set_json_codec(JSON_CODECS[codec_name]())
+        if config.get('SHARED_TRANSPORT'):
+            if config.get('SHARED_TRANSPORT').lower() == 'true':
+                self.enable_shared_transport()
+            else:
+                self.disable_shared_transport()
 
     def _set_user_agent_header(self, user_agent_string: str) -> None:
         self.user_agent_header = {'User-Agent': user_agent_string}
@@ -231,11 +659,10 @@ class BaseService:
 
         self.disable_ssl_verification = status
 
-        self.http_adapter = SSLHTTPAdapter(
-            max_retries=self.retry_config, _disable_ssl_verification=self.disable_ssl_verification
-        )
-        self.http_client.mount('http://', self.http_adapter)
-        self.http_client.mount('https://', self.http_adapter)
+        if not self._update_shared_transport():
+            # Update the adapter in place, so its connection pools are kept.
+            self.http_adapter.set_disable_ssl_verification(self.disable_ssl_verification)
+            self._mount_http_adapter()
         logger.debug('Disabled SSL verification in HTTP client')
 
     def set_service_url(self, service_url: str) -> None:
@@ -255,6 +682,7 @@ class BaseService:
         if service_url is not None:
             service_url = service_url.rstrip('/')
         self.service_url = service_url
+        self._update_shared_transport()
         logger.debug('Set service URL: %s', service_url)
 
     def get_http_client(self) -> requests.sessions.Session:
@@ -272,6 +700,10 @@ class BaseService:
             http_client: A new requests session client
         """
         if isinstance(http_client, requests.sessions.Session):
+            if self._transport_registry is not None:
+                # Don't let later configuration changes modify the shared adapter.
+                self._transport_registry = None
+                self.http_adapter = self._create_http_adapter()
             self.http_client = http_client
         else:
             raise TypeError("http_client parameter must be a requests.sessions.Session")
@@ -301,12 +733,32 @@ class BaseService:
         Args:
             request: The request to send to the service endpoint.
 
+        Keyword Arguments:
+            total_timeout: The maximum number of seconds the call may take, including its retries
+                (see set_total_timeout). It is counted from the start of the prepare_request() call
+                if the request has a deadline, else from now. Defaults to the deadline set by
+                prepare_request(), or the total_timeout of the service. The deadline of an
+                enclosing deadline_scope() still applies if it's earlier.
+            kwargs: The other arguments of the request, like timeout and stream.
+
         Raises:
             ApiException: The exception from the API.
+            DeadlineExceededException: The call did not complete within its total timeout.
 
         Returns:
             The response from the request.
         """
+        start = time.monotonic()
+        deadline = self._pop_deadline(request, kwargs.pop('total_timeout', None))
+        with use_deadline(deadline):
+            try:
+                return self._send_before_deadline(request, deadline, **kwargs)
+            except Exception as err:
+                if self._hooks:
+                    self._run_error_hooks(request, start, err)
+                raise
+
+    def _send_before_deadline(self, request: dict, deadline: Optional[Deadline], **kwargs) -> DetailedResponse:
         # Use a one minute timeout when our caller doesn't give a timeout.
         # http://docs.python-requests.org/en/master/user/quickstart/#timeouts
         kwargs = dict({"timeout": 60}, **kwargs)
@@ -315,6 +767,12 @@ class BaseService:
         if self.disable_ssl_verification:
             kwargs['verify'] = False
 
+        if deadline is not None:
+            # The deadline may have passed while the request was prepared.
+            deadline.check()
+            # Each attempt, including the retries, gets no more than the time left.
+            kwargs['timeout'] = DeadlineTimeout(deadline, kwargs['timeout'])
+
         # Check to see if the caller specified the 'stream' argument.
         stream_response = kwargs.get('stream') or False
 
@@ -329,9 +787,46 @@ class BaseService:
         try:
             logger.debug('Sending HTTP request message')
 
-            response = self.http_client.request(**request, cookies=self.jar, **kwargs)
+            sent_at = None
+            if self._hooks:
+                sent_at = self._run_hooks(
+                    PRE_SEND, request['method'], request['url'], request=request, size=self._get_request_size(request)
+                )
+            body_positions = self._get_body_positions(request) if self.reauthenticate_on_401 else None
+            self._record_request_in_retry_budget()
+            send_request = partial(self._send_request, request, cookies=self.jar, **kwargs)
+            if self.hedging_policy is not None and self._is_replayable(request):
+                response = self.hedging_policy.call(request['method'], send_request)
+            else:
+                response = send_request()
+
+            if response.status_code == 401 and body_positions is not None and self._invalidate_token(request):
+                logger.debug('Sending the request again with a new access token')
+                response.close()
+                self.authenticator.authenticate(request)
+                self._rewind_body(body_positions)
+                response = send_request()
 
             logger.debug('Received HTTP response message, status code %d', response.status_code)
+            if self._hooks:
+                self._run_hooks(
+                    RESPONSE_RECEIVED,
+                    request['method'],
+                    request['url'],
+                    start=sent_at,
+                    request=request,
+                    response=response,
+                    size=self._get_response_size(response, stream_response),
+                    elapsed=self._get_elapsed(response),
+                )
+
+            if self.rate_limiter is not None:
+                self.rate_limiter.record_response(request['url'], response.status_code, response.headers)
+
+            if self._transport_registry is not None:
+                # Shared sessions don't store cookies, so keep them in the service's own jar.
+                for received in response.history + [response]:
+                    extract_cookies_to_jar(self.jar, received.request, received.raw)
 
             # Process a "success" response.
             if 200 <= response.status_code <= 299:
@@ -340,34 +835,443 @@ class BaseService:
                     result = None
                 elif stream_response:
                     result = response
-                elif not response.text:
+                elif not response.content:
+                    # Check the raw bytes, decoding them to text could require charset detection.
                     result = None
                 elif is_json_mimetype(response.headers.get('Content-Type')):
                     # If this is a JSON response, then try to unmarshal it.
-                    try:
-                        result = response.json(strict=False)
-                    except JSONDecodeError as err:
-                        raise ApiException(
-                            code=response.status_code,
-                            http_response=response,
-                            message='Error processing the HTTP response',
-                        ) from err
+                    if self.lazy_response_parsing:
+                        return DetailedResponse(
+                            result_loader=partial(self._decode_json_response, request, response),
+                            headers=response.headers,
+                            status_code=response.status_code,
+                            json_codec=self.json_codec,
+                        )
+                    result = self._decode_json_response(request, response)
                 else:
                     # Non-JSON response, just use response body as-is.
                     result = response
 
-                return DetailedResponse(response=result, headers=response.headers, status_code=response.status_code)
+                return DetailedResponse(
+                    response=result,
+                    headers=response.headers,
+                    status_code=response.status_code,
+                    json_codec=self.json_codec,
+                )
 
             # Received error status code from server, raise an APIException.
             raise ApiException(response.status_code, http_response=response)
         except requests.exceptions.SSLError:
             logger.exception(self.ERROR_MSG_DISABLE_SSL)
             raise
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as err:
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceededException(deadline.total_timeout) from err
+            raise
+
+    def _remember_deadline(self, request: dict, deadline: Deadline, start: float) -> None:
+        """Keep the deadline of the call started by prepare_request() until send() is called with the request."""
+        # Forget the requests that were never sent, once their call would fail anyway.
+        for key, (_, prepared_deadline, _) in list(self._prepared_deadlines.items()):
+            if prepared_deadline.expired():
+                self._prepared_deadlines.pop(key, None)
+        # The request is kept, so that its id can't be reused until it's sent.
+        self._prepared_deadlines[id(request)] = (request, deadline, start)
+
+    def _pop_deadline(self, request: dict, total_timeout: Optional[float]) -> Optional[Deadline]:
+        """Returns the deadline of a call, forgetting the one set by prepare_request() for the request."""
+        _, deadline, start = self._prepared_deadlines.pop(id(request), (None, None, None))
+        if total_timeout is not None:
+            # The call started when the request was prepared, if it has a deadline.
+            deadline = Deadline(total_timeout, start=start)
+        elif deadline is None and self.total_timeout is not None:
+            deadline = Deadline(self.total_timeout)
+        return earliest_deadline(deadline, get_deadline())
+
+    def _record_request_in_retry_budget(self) -> None:
+        # Each request sent adds to the budget of retries.
+        retry_budget = getattr(self.retry_config, 'retry_budget', None)
+        if retry_budget is not None:
+            retry_budget.record_request()
+
+    def _send_request(self, request: dict, **kwargs) -> requests.Response:
+        if self.rate_limiter is None:
+            return self._send_through_circuit_breaker(request, **kwargs)
+        # The token is acquired before the circuit breaker starts timing the request.
+        self.rate_limiter.acquire(request['url'])
+        # The responses retried by urllib3 are recorded, and the retries acquired, by the retry policy.
+        with rate_limited_request(self.rate_limiter, request['url']):
+            return self._send_through_circuit_breaker(request, **kwargs)
+
+    @staticmethod
+    def _is_replayable(request: dict) -> bool:
+        # Requests with a streamed body (a file-like object, generator or iterator) or multipart files
+        # can only be sent once.
+        data = request.get('data')
+        return not request.get('files') and (data is None or isinstance(data, (bytes, str, dict)))
+
+    def _invalidate_token(self, request: dict) -> bool:
+        # Returns true if the request can be sent again with a new token.
+        token_manager = getattr(self.authenticator, 'token_manager', None)
+        if not isinstance(token_manager, TokenManager):
+            return False
+        authorization = request['headers'].get('Authorization') or ''
+        return token_manager.invalidate_token(authorization.rpartition(' ')[2])
+
+    @staticmethod
+    def _get_body_positions(request: dict) -> Optional[List[Tuple[io.IOBase, int]]]:
+        """Returns the streams of the request body with their current position,
+        or None if one of them can't be rewound."""
+        streams = [request.get('data')]
+        for _, file_tuple in request.get('files') or ():
+            streams.append(file_tuple[1] if isinstance(file_tuple, tuple) else file_tuple)
+        positions = []
+        for stream in streams:
+            if stream is None or isinstance(stream, (bytes, str, dict)):
+                continue
+            # Generators, iterators and streams that can't seek are consumed by the first attempt.
+            if not (hasattr(stream, 'seekable') and stream.seekable()):
+                return None
+            positions.append((stream, stream.tell()))
+        return positions
+
+    @staticmethod
+    def _rewind_body(body_positions: List[Tuple[io.IOBase, int]]) -> None:
+        for stream, position in body_positions:
+            stream.seek(position)
+
+    def _send_through_circuit_breaker(self, request: dict, **kwargs) -> requests.Response:
+        if self.circuit_breaker is None:
+            return self.http_client.request(**request, **kwargs)
+        # The waits between the retries sent by urllib3 are excluded from the duration by the retry policy.
+        return self.circuit_breaker.call(request['url'], partial(self.http_client.request, **request, **kwargs))
+
+    def _decode_json_response(self, request: dict, response: Any) -> Any:
+        """Parse the body of a successful JSON response and run the post_decode hooks."""
+        if not self._hooks:
+            return self._parse_json_response(response)
+        start = time.monotonic()
+        result = self._parse_json_response(response)
+        self._run_hooks(
+            POST_DECODE,
+            request['method'],
+            request['url'],
+            start=start,
+            request=request,
+            response=response,
+            size=len(response.content),
+        )
+        return result
+
+    def _parse_json_response(self, response: Any) -> Any:
+        """Parse the body of a successful JSON response.
+
+        Raises:
+            ApiException: The body is not valid JSON.
+        """
+        try:
+            return self.get_json_codec().loads_response(response)
+        except json_import.JSONDecodeError as err:
+            raise ApiException(
+                code=response.status_code,
+                http_response=response,
+                message='Error processing the HTTP response',
+            ) from err
+
+    def send_many(
+        self, requests_to_send: Iterable[dict], *, max_in_flight: Optional[int] = None, ordered: bool = True, **kwargs
+    ) -> Iterator[Tuple[int, Union[DetailedResponse, Exception]]]:
+        """Send many independent requests concurrently, on a bounded pool of worker threads.
+
+        The requests are sent with send(), through the service's session. The iterable is consumed
+        in the calling thread as requests complete, so the requests can be prepared lazily, for example
+        with a generator of prepare_request() calls: they are then authenticated one at a time with the
+        cached token, rather than by each worker.
+
+        Args:
+            requests_to_send: The requests to send, as returned by prepare_request().
+
+        Keyword Arguments:
+            max_in_flight: The maximum number of requests sent at the same time. In ordered mode, this also
+                bounds the number of completed responses waiting for an earlier request.
+                Defaults to pool_maxsize, so that each request uses a pooled connection.
+            ordered: Whether the results are returned in the order of the requests, or as they complete.
+                Defaults to True.
+            kwargs: The keyword arguments passed to send() for each request.
+
+        Returns:
+            An iterator of (index, result) tuples, where index is the position of the request in
+            `requests_to_send` and result is its DetailedResponse, or the exception (usually an
+            ApiException) raised by send().
+
+        Raises:
+            ValueError: `max_in_flight` is less than 1.
+        """
+        if max_in_flight is None:
+            max_in_flight = self.pool_maxsize
+        if max_in_flight < 1:
+            raise ValueError('max_in_flight must be at least 1')
+        return self._send_many(requests_to_send, max_in_flight, ordered, kwargs)
+
+    def _send_many(
+        self, requests_to_send: Iterable[dict], max_in_flight: int, ordered: bool, kwargs: dict
+    ) -> Iterator[Tuple[int, Union[DetailedResponse, Exception]]]:
+        # pylint: disable=too-many-locals
+        executor = ThreadPoolExecutor(max_in_flight, thread_name_prefix='ibm-cloud-sdk-core-send')
+        queued = enumerate(requests_to_send)
+        pending = {}
+        completed = {}
+        next_index = 0
+        try:
+            while True:
+                # Completed results waiting for an earlier request count against the limit.
+                while queued is not None and len(pending) + len(completed) < max_in_flight:
+                    item = next(queued, None)
+                    if item is None:
+                        queued = None
+                        break
+                    # Run in a copy of the context, so that the requests share the deadline of the caller.
+                    pending[executor.submit(copy_context().run, self._send_or_error, item[1], kwargs)] = item[0]
+                if not pending:
+                    return
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index = pending.pop(future)
+                    if ordered:
+                        completed[index] = future.result()
+                    else:
+                        yield index, future.result()
+                while next_index in completed:
+                    yield next_index, completed.pop(next_index)
+                    next_index += 1
+        finally:
+            # Stop sending if the caller doesn't consume all the results.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def _send_or_error(self, request: dict, kwargs: dict) -> Union[DetailedResponse, Exception]:
+        try:
+            return self.send(request, **kwargs)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return err
+
+    def paginate(
+        self,
+        operation: Callable[..., DetailedResponse],
+        items_key: str,
+        *,
+        page_param: str = 'start',
+        prefetch: int = 1,
+        next_token: Optional[Callable[[dict], Any]] = None,
+        **params,
+    ) -> Pager:
+        """Returns a pager that iterates over the items of a paginated list operation of this service.
+
+        The pager is an iterator over the items of all the pages, and fetches the next pages on a
+        worker thread while the current one is consumed. For example:
+
+            for instance in service.paginate(service.list_resource_instances, 'resources', limit=100):
+                ...
+
+        Args:
+            operation: The list operation, called with `params` and the page parameter.
+            items_key: The name of the property of the result that contains the items of a page.
+
+        Keyword Arguments:
+            page_param: The name of the operation parameter that selects the page, e.g. 'start' or 'offset'.
+                Defaults to 'start'.
+            prefetch: The maximum number of pages fetched ahead of the page being consumed,
+                or 0 to fetch each page when it is needed. Defaults to 1.
+            next_token: A function that takes the result of the operation and returns the value of the
+                page parameter for the next page, or None after the last page. Defaults to
+                pager.get_next_page_token(), which handles `next` links and `offset` pagination.
+            params: The other parameters of the operation, sent with every page request.
+
+        Raises:
+            ValueError: `prefetch` is negative.
+        """
+        return Pager(operation, items_key, page_param=page_param, prefetch=prefetch, next_token=next_token, **params)
+
+    def set_lazy_response_parsing(self, lazy_response_parsing: bool = True) -> None:
+        """Set whether JSON response bodies are parsed when the result of the DetailedResponse is
+        first accessed, rather than by send(), so that callers that only need the status code or
+        the headers don't pay for parsing. An invalid body then raises the ApiException on that first access.
+
+        Args:
+            lazy_response_parsing: Set to true to parse JSON response bodies on first access. Defaults to True.
+        """
+        self.lazy_response_parsing = lazy_response_parsing
+
+    def set_reauthenticate_on_401(self, reauthenticate: bool = True) -> None:
+        """Set whether a request rejected with a 401 status code is sent again with a new access token.
+
+        This lets calls recover right away when the access token was revoked or rotated before its
+        expiration time. The rejected token is discarded and a new one is fetched, by a single token
+        request shared by all the threads, then the request is sent again, only once. Only the
+        authenticators that fetch tokens (like the IAM authenticator) are supported, and requests
+        with a streamed body are only sent again if the streams can be rewound (seeked).
+
+        Args:
+            reauthenticate: Set to true to send rejected requests again with a new token. Defaults to True.
+        """
+        self.reauthenticate_on_401 = reauthenticate
+
+    def add_hook(self, event: str, hook: Callable[[HookEvent], None]) -> None:
+        """Call a function at a step of each call, for example to record metrics or traces.
+
+        The steps are, in order: 'pre_prepare', 'post_authenticate' (prepare_request), 'pre_send',
+        'response_received', 'post_decode' (send), and 'error' when prepare_request or send raises
+        an exception. The hook is called in the thread (or task) of the call with a HookEvent,
+        which has the monotonic timestamp of the step and, depending on the step, its duration,
+        the request, the response and the size of their bodies. Hooks should return quickly;
+        the exceptions they raise are logged and ignored. Calls don't create events while no hook is registered.
+
+        Args:
+            event: The step, one of hooks.HOOK_EVENTS.
+            hook: The function to call with the HookEvent.
+
+        Raises:
+            ValueError: The event is not supported.
+        """
+        if event not in HOOK_EVENTS:
+            raise ValueError('Unsupported hook event: {0}. Supported events: {1}'.format(event, ', '.join(HOOK_EVENTS)))
+        self._hooks = dict(self._hooks, **{event: self._hooks.get(event, ()) + (hook,)})
+
+    def remove_hook(self, event: str, hook: Callable[[HookEvent], None]) -> None:
+        """Stop calling a function added by add_hook().
+
+        Args:
+            event: The step the hook was added for.
+            hook: The function.
+
+        Raises:
+            ValueError: The hook was not added for this event.
+        """
+        hooks = list(self._hooks.get(event, ()))
+        hooks.remove(hook)
+        self._hooks = {name: value for name, value in self._hooks.items() if name != event}
+        if hooks:
+            self._hooks[event] = tuple(hooks)
+
+    def _run_hooks(self, event: str, method: str, url: str, **details) -> float:
+        """Call the hooks of an event.
+
+        Returns:
+            The timestamp of the event.
+        """
+        timestamp = time.monotonic()
+        hooks = self._hooks.get(event)
+        if hooks:
+            hook_event = HookEvent(event, timestamp, method, url, **details)
+            for hook in hooks:
+                try:
+                    hook(hook_event)
+                except Exception:  # pylint: disable=broad-exception-caught
+                    logger.exception('The %s hook %r raised an exception', event, hook)
+        return timestamp
+
+    def _run_error_hooks(self, request: dict, start: float, error: Exception) -> None:
+        self._run_hooks(
+            ERROR,
+            request['method'],
+            request['url'],
+            start=start,
+            request=request,
+            response=getattr(error, 'http_response', None),
+            error=error,
+        )
+
+    @classmethod
+    def _get_request_size(cls, request: dict) -> Optional[int]:
+        # The size of a multipart body, an iterator or a stream of unknown length is not known before it is sent.
+        data = request.get('data')
+        if request.get('files'):
+            return None
+        if data is None:
+            return 0
+        if not isinstance(data, (bytes, str, io.IOBase)):
+            return None
+        size = cls._get_body_size(data)
+        return None if size == float('inf') else int(size)
+
+    @staticmethod
+    def _get_response_size(response: Any, stream: bool) -> Optional[int]:
+        if not stream:
+            return len(response.content)
+        content_length = response.headers.get('Content-Length')
+        return int(content_length) if content_length and content_length.isdigit() else None
+
+    @staticmethod
+    def _get_elapsed(response: Any) -> Optional[float]:
+        try:
+            return response.elapsed.total_seconds()
+        except (AttributeError, RuntimeError):
+            # httpx only sets the elapsed time of a streamed response once it is closed.
+            return None
 
     def set_enable_gzip_compression(self, should_enable_compression: bool = False) -> None:
         """Set value to enable gzip compression on request bodies"""
         self.enable_gzip_compression = should_enable_compression
 
+    def set_json_codec(self, codec: Optional[JsonCodec]) -> None:
+        """Set the codec used to serialize JSON request bodies and parse JSON response bodies.
+
+        Args:
+            codec: The codec to use, e.g. OrjsonCodec(), or None to use the default codec
+                returned by json_codec.get_json_codec().
+
+        Raises:
+            TypeError: The `codec` is not a JsonCodec.
+        """
+        if codec is not None and not isinstance(codec, JsonCodec):
+            raise TypeError('codec must be a JsonCodec')
+        self.json_codec = codec
+
+    def get_json_codec(self) -> JsonCodec:
+        """Get the codec used to serialize JSON request bodies and parse JSON response bodies.
+
+        Returns:
+            The codec set with set_json_codec(), or the default codec.
+        """
+        return self.json_codec or get_default_json_codec()
+
+    def set_request_compression(
+        self, encoding: Optional[str] = 'gzip', *, level: Optional[int] = None, min_size: int = 0
+    ) -> None:
+        """Enable compression of request bodies with the given content coding.
+
+        The codings that are always available are 'gzip' and 'deflate'; 'br' and 'zstd' are
+        available when the `brotli` and `zstandard` packages are installed, and more can be added
+        with compression.register_codec(). Compression is applied to requests that don't already
+        have a Content-Encoding header.
+
+        Args:
+            encoding: The name of the content coding, or None to disable compression. Defaults to 'gzip'.
+
+        Keyword Arguments:
+            level: The compression level, which trades CPU time for smaller request bodies.
+                Defaults to None (the coding's default level).
+            min_size: Request bodies smaller than this number of bytes are sent uncompressed. Streamed bodies
+                of unknown size are always compressed. Defaults to 0.
+
+        Raises:
+            ValueError: The coding isn't available, or the level is not valid for it.
+        """
+        if encoding is None:
+            self.set_enable_gzip_compression(False)
+            return
+        # Fail early on unknown codings and invalid levels, rather than when sending a request.
+        get_codec(encoding).create_compressor(level)
+        self.compression_encoding = encoding.lower()
+        self.compression_level = level
+        self.compression_min_size = min_size
+        self.enable_gzip_compression = True
+        logger.debug(
+            'Enabled request compression; encoding=%s, level=%s, min_size=%d',
+            self.compression_encoding,
+            level,
+            min_size,
+        )
+
     def get_enable_gzip_compression(self) -> bool:
         """Get value for enabling gzip compression on request bodies"""
         return self.enable_gzip_compression
@@ -405,6 +1309,35 @@ class BaseService:
             Prepared request dictionary.
         """
         # pylint: disable=unused-argument; necessary for kwargs
+        if self._hooks:
+            self._run_hooks(PRE_PREPARE, method, url)
+        request = self._build_request(method, url, headers=headers, params=params, data=data)
+
+        start = time.monotonic()
+        try:
+            with deadline_scope(self.total_timeout) as deadline:
+                self.authenticator.authenticate(request)
+        except Exception as err:
+            if self._hooks:
+                self._run_error_hooks(request, start, err)
+            raise
+        if self._hooks:
+            self._run_hooks(POST_AUTHENTICATE, method, request['url'], start=start, request=request)
+        if deadline is not None:
+            self._remember_deadline(request, deadline, start)
+
+        return self._complete_request(request, files)
+
+    def _build_request(
+        self,
+        method: str,
+        url: str,
+        *,
+        headers: Optional[dict] = None,
+        params: Optional[dict] = None,
+        data: Optional[Union[str, dict]] = None,
+    ) -> dict:
+        """Build the unauthenticated part of a request dict: url, headers, query params and body."""
         request = {'method': method}
 
         # validate the service url is set
@@ -435,22 +1368,37 @@ class BaseService:
             data = remove_null_values(data)
             if headers.get('content-type') is None:
                 headers.update({'content-type': 'application/json'})
-            data = json_import.dumps(data).encode('utf-8')
+            data = self.get_json_codec().dumps(data)
         request['data'] = data
+        return request
 
-        self.authenticator.authenticate(request)
+    def _complete_request(
+        self,
+        request: dict,
+        files: Optional[Union[Dict[str, Tuple[str]], List[Tuple[str, Tuple[str, ...]]]]] = None,
+    ) -> dict:
+        """Compress the body of an authenticated request dict and add its multipart files."""
+        headers = request['headers']
 
         # Compress the request body if applicable
-        if self.get_enable_gzip_compression() and 'content-encoding' not in headers and request['data'] is not None:
-            headers['content-encoding'] = 'gzip'
+        raw_data = request['data']
+        if (
+            self.get_enable_gzip_compression()
+            and 'content-encoding' not in headers
+            and raw_data is not None
+            and self._get_body_size(raw_data) >= self.compression_min_size
+        ):
+            codec = get_codec(self.compression_encoding)
+            headers['content-encoding'] = codec.encoding
             request['headers'] = headers
-            # If the provided data is a file-like object, we create `GzipStream` which will handle
+            # If the provided data is a file-like object, we create a stream which will handle
             # the compression on-the-fly when the requests package starts reading its content.
             # This helps avoid OOM errors when the opened file is too big.
-            # In any other cases, we use the in memory compression directly from
-            # the `gzip` package for backward compatibility.
-            raw_data = request['data']
-            request['data'] = GzipStream(raw_data) if isinstance(raw_data, io.IOBase) else gzip.compress(raw_data)
+            # In any other cases, we compress the data in memory.
+            if isinstance(raw_data, io.IOBase):
+                request['data'] = codec.compress_stream(raw_data, self.compression_level)
+            else:
+                request['data'] = codec.compress(raw_data, self.compression_level)
 
         # Next, we need to process the 'files' argument to try to fill in
         # any missing filenames where possible.
@@ -475,6 +1423,20 @@ class BaseService:
         logger.debug('Prepared request [%s %s]', request['method'], request['url'])
         return request
 
+    @staticmethod
+    def _get_body_size(data: Union[bytes, io.IOBase]) -> float:
+        """Returns the number of bytes left to read from a request body, or infinity if it's unknown."""
+        if not isinstance(data, io.IOBase):
+            return len(data)
+        try:
+            if isinstance(data, io.BytesIO):
+                return data.getbuffer().nbytes - data.tell()
+            if not isinstance(data, io.TextIOBase):
+                return os.fstat(data.fileno()).st_size - data.tell()
+        except (OSError, ValueError):
+            pass
+        return float('inf')
+
     @staticmethod
     def encode_path_vars(*args: str) -> List[str]:
         """Encode path variables to be substituted into a URL path.
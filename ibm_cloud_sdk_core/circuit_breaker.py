@@ -0,0 +1,289 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from collections import deque
+from contextvars import ContextVar
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+from urllib.parse import urlsplit
+
+from .api_exception import ApiException
+from .logger import get_logger
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover
+    httpx = None
+
+logger = get_logger()
+
+# Errors that indicate that the endpoint is unreachable or too slow. The requests exceptions are OSErrors.
+_FAILURE_ERRORS = (OSError,) if httpx is None else (OSError, httpx.TransportError)
+
+# The seconds waited between the attempts of the request sent by CircuitBreaker.call, if any.
+_waited: ContextVar[Optional[List[float]]] = ContextVar('ibm_cloud_sdk_core_circuit_breaker_waited', default=None)
+
+
+def record_wait(seconds: float) -> None:
+    """Exclude `seconds` from the duration of the request being sent by CircuitBreaker.call, if any.
+
+    Called for the waits between the retries of a request (the backoff and the rate limiter),
+    so that only the time spent on the HTTP exchanges counts toward `slow_call_duration`.
+    """
+    waited = _waited.get()
+    if waited is not None:
+        waited[0] += seconds
+
+
+class CircuitBreakerOpenException(ApiException):
+    """Raised instead of sending a request while the circuit breaker of its host is open.
+
+    Args:
+        host: The host of the request.
+        retry_after: The number of seconds before the circuit breaker lets a request through.
+
+    Attributes:
+        host (str): The host of the request.
+        retry_after (float): The number of seconds before the circuit breaker lets a request through.
+    """
+
+    def __init__(self, host: str, retry_after: float) -> None:
+        super().__init__(
+            503, message='The circuit breaker for {0} is open, retry in {1:.1f} seconds'.format(host, retry_after)
+        )
+        self.host = host
+        self.retry_after = retry_after
+
+
+class _Circuit:  # pylint: disable=too-few-public-methods
+    def __init__(self, window_size: int) -> None:
+        self.state = CircuitBreaker.CLOSED
+        # The outcome of the last calls, as (failed, slow) tuples.
+        self.calls = deque(maxlen=window_size)
+        self.opened_at = 0.0
+        self.probes = 0
+        self.probe_successes = 0
+
+
+class CircuitBreaker:
+    """Stops sending requests to a host for a while when too many of its recent requests failed or were slow.
+
+    The breaker of each host starts closed. When at least `minimum_calls` of the last `window_size`
+    requests were sent and the proportion of failed (or slow) ones reaches the threshold, it opens:
+    requests fail immediately with a CircuitBreakerOpenException, so callers can shed load or fail
+    over. After `open_timeout` seconds it is half-open and lets `half_open_calls` probe requests
+    through. It closes again if they all succeed, and opens again if one fails.
+
+    A request failed if it raised a connection error or a timeout, or if the response status code
+    is one of `failure_status_codes`.
+
+    Keyword Args:
+        failure_rate_threshold: The proportion of failed requests that opens the breaker. Defaults to 0.5.
+        slow_call_duration: Requests that take longer than this number of seconds are slow.
+            Defaults to None (the duration is not tracked).
+        slow_call_rate_threshold: The proportion of slow requests that opens the breaker. Defaults to 1.0.
+        window_size: The number of recent requests tracked for each host. Defaults to 20.
+        minimum_calls: The number of requests needed before the breaker can open. Defaults to 10.
+        open_timeout: The number of seconds the breaker stays open before it lets probe requests through.
+            Defaults to 30.
+        half_open_calls: The number of probe requests sent while the breaker is half-open. Defaults to 1.
+        failure_status_codes: The status codes of failed responses. Defaults to 500, 502, 503 and 504.
+
+    Raises:
+        ValueError: An argument is not valid.
+    """
+
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+
+    def __init__(
+        self,
+        *,
+        failure_rate_threshold: float = 0.5,
+        slow_call_duration: Optional[float] = None,
+        slow_call_rate_threshold: float = 1.0,
+        window_size: int = 20,
+        minimum_calls: int = 10,
+        open_timeout: float = 30.0,
+        half_open_calls: int = 1,
+        failure_status_codes: Iterable[int] = (500, 502, 503, 504),
+    ) -> None:
+        if not 0 < failure_rate_threshold <= 1 or not 0 < slow_call_rate_threshold <= 1:
+            raise ValueError('the rate thresholds must be greater than 0 and at most 1')
+        if window_size < 1 or half_open_calls < 1 or not 1 <= minimum_calls <= window_size:
+            raise ValueError(
+                'window_size and half_open_calls must be at least 1, minimum_calls between 1 and window_size'
+            )
+        self.failure_rate_threshold = failure_rate_threshold
+        self.slow_call_duration = slow_call_duration
+        self.slow_call_rate_threshold = slow_call_rate_threshold
+        self.window_size = window_size
+        self.minimum_calls = minimum_calls
+        self.open_timeout = open_timeout
+        self.half_open_calls = half_open_calls
+        self.failure_status_codes = frozenset(failure_status_codes)
+        self._circuits: Dict[str, _Circuit] = {}
+        self._lock = Lock()
+
+    def call(self, url: str, send: Callable[[], Any]) -> Any:
+        """Send a request through the breaker of its host.
+
+        Args:
+            url: The URL of the request.
+            send: A function that sends the request and returns a response with a `status_code`.
+
+        Raises:
+            CircuitBreakerOpenException: The breaker is open, the request was not sent.
+        """
+        host = self.before_request(url)
+        waited = [0.0]
+        context_token = _waited.set(waited)
+        start = time.monotonic()
+        try:
+            response = send()
+        except BaseException as err:
+            self.record_error(host, err, time.monotonic() - start - waited[0])
+            raise
+        finally:
+            _waited.reset(context_token)
+        self.record_response(host, response.status_code, time.monotonic() - start - waited[0])
+        return response
+
+    async def call_async(self, url: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a request through the breaker of its host, with a coroutine function (see call)."""
+        host = self.before_request(url)
+        start = time.monotonic()
+        try:
+            response = await send()
+        except BaseException as err:
+            self.record_error(host, err, time.monotonic() - start)
+            raise
+        self.record_response(host, response.status_code, time.monotonic() - start)
+        return response
+
+    def before_request(self, url: str) -> str:
+        """Check that a request can be sent to `url`.
+
+        Every call must be followed by a call to record_response or record_error.
+
+        Returns:
+            The host of the request, to pass to record_response or record_error.
+
+        Raises:
+            CircuitBreakerOpenException: The breaker is open.
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                circuit = self._circuits[host] = _Circuit(self.window_size)
+            if circuit.state == self.CLOSED:
+                return host
+            retry_after = circuit.opened_at + self.open_timeout - time.monotonic()
+            if circuit.state == self.OPEN and retry_after <= 0:
+                logger.debug('Circuit breaker for %s is half-open', host)
+                circuit.state = self.HALF_OPEN
+                circuit.probes = 0
+                circuit.probe_successes = 0
+            if circuit.state == self.HALF_OPEN and circuit.probes < self.half_open_calls:
+                circuit.probes += 1
+                return host
+        raise CircuitBreakerOpenException(host, max(retry_after, 0))
+
+    def record_response(self, host: str, status_code: int, elapsed: float) -> None:
+        """Record the response to a request sent after before_request.
+
+        Args:
+            host: The host returned by before_request.
+            status_code: The status code of the response.
+            elapsed: The duration of the request in seconds.
+        """
+        self._record(host, status_code in self.failure_status_codes, elapsed)
+
+    def record_error(self, host: str, error: BaseException, elapsed: float) -> None:
+        """Record an exception raised by a request sent after before_request.
+
+        Connection errors and timeouts count as failures; other exceptions are not recorded.
+
+        Args:
+            host: The host returned by before_request.
+            error: The exception.
+            elapsed: The duration of the request in seconds.
+        """
+        if isinstance(error, _FAILURE_ERRORS):
+            self._record(host, True, elapsed)
+            return
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is not None and circuit.state == self.HALF_OPEN and circuit.probes > 0:
+                # Let another request probe the host.
+                circuit.probes -= 1
+
+    def get_state(self, url: str) -> str:
+        """Returns the state of the breaker for the host of `url`: CLOSED, OPEN or HALF_OPEN.
+
+        An open breaker is reported as HALF_OPEN once it lets probe requests through.
+        """
+        with self._lock:
+            circuit = self._circuits.get(urlsplit(url).netloc.lower())
+            if circuit is None:
+                return self.CLOSED
+            if circuit.state == self.OPEN and time.monotonic() >= circuit.opened_at + self.open_timeout:
+                return self.HALF_OPEN
+            return circuit.state
+
+    def reset(self) -> None:
+        """Close the breakers of all the hosts and forget their recent requests."""
+        with self._lock:
+            self._circuits.clear()
+
+    def _record(self, host: str, failed: bool, elapsed: float) -> None:
+        slow = self.slow_call_duration is not None and elapsed > self.slow_call_duration
+        with self._lock:
+            circuit = self._circuits.get(host)
+            if circuit is None:
+                # The breaker was reset while the request was sent.
+                return
+            if circuit.state == self.HALF_OPEN:
+                if failed or slow:
+                    self._open(host, circuit)
+                else:
+                    circuit.probe_successes += 1
+                    if circuit.probe_successes >= self.half_open_calls:
+                        logger.debug('Circuit breaker for %s is closed', host)
+                        circuit.state = self.CLOSED
+                        circuit.calls.clear()
+                return
+            if circuit.state == self.OPEN:
+                # The request was sent before the breaker opened.
+                return
+            circuit.calls.append((failed, slow))
+            if len(circuit.calls) < self.minimum_calls:
+                return
+            failures = sum(1 for call in circuit.calls if call[0])
+            slow_calls = sum(1 for call in circuit.calls if call[1])
+            if failures >= self.failure_rate_threshold * len(
+                circuit.calls
+            ) or slow_calls >= self.slow_call_rate_threshold * len(circuit.calls):
+                self._open(host, circuit)
+
+    def _open(self, host: str, circuit: _Circuit) -> None:
+        logger.warning('Circuit breaker for %s is open for %.1f seconds', host, self.open_timeout)
+        circuit.state = self.OPEN
+        circuit.opened_at = time.monotonic()
+        circuit.calls.clear()
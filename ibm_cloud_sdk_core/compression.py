@@ -0,0 +1,151 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import zlib
+from threading import Lock
+from typing import Any, Callable, List, Optional, Union
+
+from .utils import CompressedStream, GzipCompressor
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover
+    brotli = None
+
+try:
+    import zstandard
+except ImportError:  # pragma: no cover
+    zstandard = None
+
+
+class CompressionCodec:
+    """A content coding that can be used to compress request bodies.
+
+    Args:
+        encoding: The name of the coding, sent as the value of the Content-Encoding header.
+        compressor_factory: A function that takes a compression level (None for the coding's
+            default level) and returns an incremental compressor, like the ones returned by
+            zlib.compressobj(), with a `compress(data)` and a `flush()` method.
+    """
+
+    def __init__(self, encoding: str, compressor_factory: Callable[[Optional[int]], Any]) -> None:
+        self.encoding = encoding
+        self.compressor_factory = compressor_factory
+
+    def create_compressor(self, level: Optional[int] = None) -> Any:
+        """Returns a new incremental compressor.
+
+        Args:
+            level: The compression level. Defaults to None (the coding's default level).
+
+        Raises:
+            ValueError: The level is not valid for this coding.
+        """
+        try:
+            return self.compressor_factory(level)
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            # Each compression library reports invalid levels with its own exception type.
+            raise ValueError('Invalid compression level for {0} encoding: {1}'.format(self.encoding, level)) from err
+
+    def compress(self, data: bytes, level: Optional[int] = None) -> bytes:
+        """Compress `data` all at once.
+
+        Args:
+            data: The data to compress.
+            level: The compression level. Defaults to None (the coding's default level).
+        """
+        compressor = self.create_compressor(level)
+        return compressor.compress(data) + compressor.flush()
+
+    def compress_stream(self, source: Union[io.IOBase, bytes, str], level: Optional[int] = None) -> CompressedStream:
+        """Returns a file-like object that compresses `source` on the fly, as it is read.
+
+        Args:
+            source: The file-like object, bytes or string to compress.
+            level: The compression level. Defaults to None (the coding's default level).
+        """
+        return CompressedStream(source, self.create_compressor(level))
+
+
+class _BrotliCompressor:
+    def __init__(self, level: Optional[int]) -> None:
+        self._compressor = brotli.Compressor() if level is None else brotli.Compressor(quality=level)
+
+    def compress(self, data: bytes) -> bytes:
+        """Compress `data` and return the compressed data that is ready so far."""
+        return self._compressor.process(data)
+
+    def flush(self) -> bytes:
+        """Return the rest of the compressed data."""
+        return self._compressor.finish()
+
+
+_codecs_lock = Lock()
+_codecs = {}
+
+
+def register_codec(codec: CompressionCodec) -> None:
+    """Make a content coding available for request body compression, replacing
+    any coding registered before with the same name.
+
+    Args:
+        codec: The coding to register.
+    """
+    with _codecs_lock:
+        _codecs[codec.encoding.lower()] = codec
+
+
+def get_codec(encoding: str) -> CompressionCodec:
+    """Returns the registered content coding with the given name.
+
+    Args:
+        encoding: The name of the coding, e.g. 'gzip'.
+
+    Raises:
+        ValueError: No coding is registered with that name, for example
+            because the package that implements it isn't installed.
+    """
+    with _codecs_lock:
+        codec = _codecs.get((encoding or '').lower())
+    if codec is None:
+        raise ValueError(
+            'Unsupported compression encoding: {0}. Available encodings: {1}'.format(
+                encoding, ', '.join(get_available_encodings())
+            )
+        )
+    return codec
+
+
+def get_available_encodings() -> List[str]:
+    """Returns the names of the registered content codings."""
+    with _codecs_lock:
+        return sorted(_codecs)
+
+
+register_codec(CompressionCodec('gzip', lambda level: GzipCompressor(9 if level is None else level)))
+register_codec(CompressionCodec('deflate', lambda level: zlib.compressobj(-1 if level is None else level)))
+if brotli is not None:  # pragma: no cover
+    register_codec(CompressionCodec('br', _BrotliCompressor))
+if zstandard is not None:  # pragma: no cover
+    register_codec(
+        CompressionCodec(
+            'zstd',
+            lambda level: (
+                zstandard.ZstdCompressor() if level is None else zstandard.ZstdCompressor(level=level)
+            ).compressobj(),
+        )
+    )
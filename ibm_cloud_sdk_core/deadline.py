@@ -0,0 +1,170 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Iterator, Optional, Tuple, Union
+
+from urllib3.util.timeout import Timeout
+
+from .api_exception import ApiException
+
+# The deadline of the SDK call in progress, see deadline_scope().
+_current_deadline: ContextVar[Optional['Deadline']] = ContextVar('ibm_cloud_sdk_core_deadline', default=None)
+
+
+class DeadlineExceededException(ApiException):
+    """Raised when an SDK call did not complete before its deadline.
+
+    Args:
+        total_timeout: The number of seconds the call was allowed to take.
+
+    Attributes:
+        total_timeout (float): The number of seconds the call was allowed to take.
+    """
+
+    def __init__(self, total_timeout: float) -> None:
+        super().__init__(504, message='The call did not complete within {0} seconds'.format(total_timeout))
+        self.total_timeout = total_timeout
+
+
+class Deadline:
+    """The time by which an SDK call, including its token fetch, retries and backoff, must complete.
+
+    Args:
+        total_timeout: The number of seconds from the start of the call.
+
+    Keyword Args:
+        start: The time.monotonic() value of the start of the call. Defaults to now.
+
+    Attributes:
+        total_timeout (float): The number of seconds the call is allowed to take.
+        start (float): The time.monotonic() value of the start of the call.
+        expires_at (float): The time.monotonic() value of the deadline.
+    """
+
+    def __init__(self, total_timeout: float, *, start: Optional[float] = None) -> None:
+        self.total_timeout = total_timeout
+        self.start = time.monotonic() if start is None else start
+        self.expires_at = self.start + total_timeout
+
+    def remaining(self) -> float:
+        """Returns the number of seconds left before the deadline, or 0 if it has passed."""
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        """Returns true if the deadline has passed."""
+        return time.monotonic() >= self.expires_at
+
+    def check(self) -> None:
+        """Raise a DeadlineExceededException if the deadline has passed."""
+        if self.expired():
+            raise DeadlineExceededException(self.total_timeout)
+
+    def cap(self, timeout: Optional[float]) -> float:
+        """Returns the smaller of `timeout` (None for no timeout) and the time left before the deadline.
+
+        Raises:
+            DeadlineExceededException: The deadline has passed.
+        """
+        remaining = self.remaining()
+        if remaining <= 0:
+            raise DeadlineExceededException(self.total_timeout)
+        return remaining if timeout is None else min(timeout, remaining)
+
+    def cap_timeout(
+        self, timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]
+    ) -> Union[float, Tuple[float, float]]:
+        """Cap a requests timeout, a single value or a (connect, read) tuple, to the time left before the deadline.
+
+        Raises:
+            DeadlineExceededException: The deadline has passed.
+        """
+        if isinstance(timeout, tuple):
+            return self.cap(timeout[0]), self.cap(timeout[1])
+        return self.cap(timeout)
+
+
+class DeadlineTimeout(Timeout):
+    """A urllib3 timeout that is capped to the time left before a deadline at each attempt.
+
+    urllib3 clones the timeout of a request before each attempt (the first one and each retry),
+    so every attempt gets the connect and read timeouts, but no more than the time left.
+
+    Args:
+        deadline: The deadline of the call.
+        timeout: The requests timeout of each attempt, a single value or a (connect, read) tuple.
+    """
+
+    def __init__(
+        self, deadline: Deadline, timeout: Union[None, float, Tuple[Optional[float], Optional[float]]]
+    ) -> None:
+        connect, read = timeout if isinstance(timeout, tuple) else (timeout, timeout)
+        super().__init__(connect=connect, read=read)
+        self.deadline = deadline
+
+    def clone(self) -> Timeout:
+        """Returns the timeout of the next attempt.
+
+        Raises:
+            DeadlineExceededException: The deadline has passed.
+        """
+        connect, read = self.deadline.cap_timeout((self._connect, self._read))
+        return Timeout(connect=connect, read=read, total=self.deadline.remaining() or None)
+
+
+def earliest_deadline(*deadlines: Optional[Deadline]) -> Optional[Deadline]:
+    """Returns the deadline that expires first, ignoring None, or None if there is none."""
+    return min((deadline for deadline in deadlines if deadline is not None), key=lambda d: d.expires_at, default=None)
+
+
+def get_deadline() -> Optional[Deadline]:
+    """Returns the deadline of the SDK call in progress, or None if it has no deadline."""
+    return _current_deadline.get()
+
+
+@contextmanager
+def deadline_scope(total_timeout: Optional[float]) -> Iterator[Optional[Deadline]]:
+    """Bound the time taken by the SDK calls made in a `with` block, token fetches included.
+
+    Scopes can be nested, the earliest deadline applies. For example:
+
+        with deadline_scope(10):
+            service.get_resource(id='abc')
+
+    Args:
+        total_timeout: The number of seconds the block is allowed to take,
+            or None to keep the deadline of the enclosing scope (if any).
+
+    Yields:
+        The deadline that applies in the block, or None.
+    """
+    deadline = _current_deadline.get()
+    if total_timeout is not None and (deadline is None or deadline.remaining() > total_timeout):
+        deadline = Deadline(total_timeout)
+    with use_deadline(deadline):
+        yield deadline
+
+
+@contextmanager
+def use_deadline(deadline: Optional[Deadline]) -> Iterator[Optional[Deadline]]:
+    """Set the deadline in a `with` block, or remove it with None, whatever the enclosing scope."""
+    token = _current_deadline.set(deadline)
+    try:
+        yield deadline
+    finally:
+        _current_deadline.reset(token)
@@ -14,19 +14,38 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import codecs
 import json
-from typing import Dict, Optional, Union
+from typing import Any, AsyncIterator, Callable, Dict, Iterator, List, Optional, Union
 
 import requests
 
+from .api_exception import ApiException
+from .json_codec import JsonCodec, get_json_codec
+from .utils import is_json_lines_mimetype, is_json_mimetype
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
 
 class DetailedResponse:
     """Custom class for detailed response returned from APIs.
 
+    When the result is a streamed response (the request was sent with `stream=True`), its
+    body can be consumed with iter_bytes(), iter_lines() or readinto() (or aiter_bytes() and
+    aiter_lines() for the responses of AsyncBaseService). These decompress the body as it is
+    read, according to its Content-Encoding, and only hold one chunk of it in memory.
+    iter_records() (or aiter_records()) decodes JSON lines and JSON array bodies one record
+    at a time, so the memory used depends on the size of the largest record rather than the body.
+    The DetailedResponse can be used as a context manager that closes the streamed response.
+
     Keyword Args:
         response: The response to the service request, defaults to None.
         headers: The headers of the response, defaults to None.
         status_code: The status code of the response, defaults to None.
+        result_loader: A function that returns the response to the service request. If set, it is
+            called the first time the result is accessed, instead of using `response`. Defaults to None.
+        json_codec: The codec that parses the JSON lines records of iter_records() and aiter_records(),
+            or None to use the default codec returned by json_codec.get_json_codec(). Defaults to None.
 
     Attributes:
         result (dict, requests.Response, None): The response to the service request.
@@ -41,10 +60,30 @@ class DetailedResponse:
         response: Optional[Union[dict, requests.Response]] = None,
         headers: Optional[Dict[str, str]] = None,
         status_code: Optional[int] = None,
+        result_loader: Optional[Callable[[], Any]] = None,
+        json_codec: Optional[JsonCodec] = None,
     ) -> None:
         self.result = response
+        self._result_loader = result_loader
+        self._json_codec = json_codec
         self.headers = headers
         self.status_code = status_code
+        self._chunks = None
+        self._pending = memoryview(b'')
+
+    @property
+    def result(self) -> Optional[Union[dict, requests.Response]]:
+        """The response to the service request, loaded on first access if the DetailedResponse has a result loader."""
+        if self._result_loader is not None:
+            # The loader is kept if it fails, so that each access raises the error.
+            self._result = self._result_loader()
+            self._result_loader = None
+        return self._result
+
+    @result.setter
+    def result(self, value: Optional[Union[dict, requests.Response]]) -> None:
+        self._result = value
+        self._result_loader = None
 
     def get_result(self) -> Optional[Union[dict, requests.Response]]:
         """Get the response returned by the service request.
@@ -54,6 +93,10 @@ class DetailedResponse:
             1. a dict that represents an instance of a response model
             2. a requests.Response instance if the operation returns a streamed response
             3. None if the server returned no response body
+
+        Raises:
+            ApiException: The result is parsed on first access (see BaseService.set_lazy_response_parsing)
+                and the response body is not valid JSON.
         """
         return self.result
 
@@ -73,10 +116,254 @@ class DetailedResponse:
         """
         return self.status_code
 
+    def iter_bytes(self, chunk_size: int = DEFAULT_CHUNK_SIZE, *, decode_content: bool = True) -> Iterator[bytes]:
+        """Iterate over the body of a streamed response.
+
+        Args:
+            chunk_size: The maximum number of bytes read from the connection at once.
+
+        Keyword Args:
+            decode_content: Whether the body should be decompressed according to its
+                Content-Encoding. Defaults to True.
+
+        Returns:
+            An iterator over chunks of the body.
+
+        Raises:
+            TypeError: The result is not a response.
+        """
+        response = self._get_response('iter_content')
+        if self._chunks is not None:
+            # Continue where readinto() stopped.
+            if self._pending:
+                yield self._pending.tobytes()
+                self._pending = memoryview(b'')
+            yield from self._chunks
+        elif decode_content:
+            yield from response.iter_content(chunk_size)
+        else:
+            yield from response.raw.stream(chunk_size, decode_content=False)
+
+    def iter_lines(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        decode_unicode: bool = False,
+        max_line_size: Optional[int] = None,
+    ) -> Iterator[Union[bytes, str]]:
+        """Iterate over the lines of the body of a streamed response.
+
+        Lines may end with '\\n' or '\\r\\n'; the line endings are not included in the lines.
+
+        Args:
+            chunk_size: The maximum number of bytes read from the connection at once.
+
+        Keyword Args:
+            decode_unicode: Whether to decode the lines with the encoding of the response
+                (UTF-8 if the response doesn't specify one). Defaults to False.
+            max_line_size: The maximum length of a line in bytes, to bound the memory used for a
+                response without line breaks. Defaults to None (no limit).
+
+        Returns:
+            An iterator over the lines of the body, as bytes or as str if `decode_unicode` is True.
+
+        Raises:
+            TypeError: The result is not a response.
+            ValueError: A line is longer than `max_line_size`.
+        """
+        encoding = self._get_line_encoding(decode_unicode, 'iter_content')
+        splitter = _LineSplitter(max_line_size)
+        for chunk in self.iter_bytes(chunk_size):
+            yield from _decode_lines(splitter.feed(chunk), encoding)
+        yield from _decode_lines(splitter.finish(), encoding)
+
+    def readinto(self, b) -> int:
+        """Read the body of a streamed response into the pre-allocated, writable bytes-like object `b`.
+
+        The body is decompressed according to its Content-Encoding.
+
+        Returns:
+            The number of bytes written into `b`, 0 once the whole body has been read.
+
+        Raises:
+            TypeError: The result is not a response.
+        """
+        response = self._get_response('iter_content')
+        if self._chunks is None:
+            self._chunks = response.iter_content(DEFAULT_CHUNK_SIZE)
+        while not self._pending:
+            chunk = next(self._chunks, None)
+            if chunk is None:
+                return 0
+            self._pending = memoryview(chunk)
+        with memoryview(b).cast('B') as target:
+            size = min(len(target), len(self._pending))
+            target[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    async def aiter_bytes(
+        self, chunk_size: int = DEFAULT_CHUNK_SIZE, *, decode_content: bool = True
+    ) -> AsyncIterator[bytes]:
+        """Iterate over the body of a streamed response returned by AsyncBaseService.
+
+        Args:
+            chunk_size: The maximum number of bytes in a chunk.
+
+        Keyword Args:
+            decode_content: Whether the body should be decompressed according to its
+                Content-Encoding. Defaults to True.
+
+        Returns:
+            An asynchronous iterator over chunks of the body.
+
+        Raises:
+            TypeError: The result is not an asynchronous response.
+        """
+        response = self._get_response('aiter_bytes')
+        chunks = response.aiter_bytes(chunk_size) if decode_content else response.aiter_raw(chunk_size)
+        async for chunk in chunks:
+            yield chunk
+
+    async def aiter_lines(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        decode_unicode: bool = False,
+        max_line_size: Optional[int] = None,
+    ) -> AsyncIterator[Union[bytes, str]]:
+        """Iterate over the lines of the body of a streamed response returned by AsyncBaseService.
+
+        This is the asynchronous counterpart of iter_lines(), and takes the same arguments.
+
+        Raises:
+            TypeError: The result is not an asynchronous response.
+            ValueError: A line is longer than `max_line_size`.
+        """
+        encoding = self._get_line_encoding(decode_unicode, 'aiter_bytes')
+        splitter = _LineSplitter(max_line_size)
+        async for chunk in self.aiter_bytes(chunk_size):
+            for line in _decode_lines(splitter.feed(chunk), encoding):
+                yield line
+        for line in _decode_lines(splitter.finish(), encoding):
+            yield line
+
+    def iter_records(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        json_lines: Optional[bool] = None,
+        max_record_size: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate over the JSON records in the body of a streamed response, decoding them one by one.
+
+        The body is either a sequence of JSON values separated by line breaks (JSON lines, or NDJSON),
+        in which case each line is a record, or a single JSON array, in which case each element is
+        a record. Any other JSON value is returned as a single record.
+
+        Args:
+            chunk_size: The maximum number of bytes read from the connection at once.
+
+        Keyword Args:
+            json_lines: Whether the body is in JSON lines format. Defaults to None, which selects
+                the format based on the Content-Type of the response.
+            max_record_size: The maximum size of a record in bytes. Defaults to None (no limit).
+
+        Returns:
+            An iterator over the decoded records.
+
+        Raises:
+            TypeError: The result is not a response.
+            ValueError: A record is longer than `max_record_size`.
+            ApiException: The body is not valid JSON.
+        """
+        decoder = self._get_record_decoder('iter_content', json_lines, max_record_size)
+        for chunk in self.iter_bytes(chunk_size):
+            yield from self._decode_records(decoder.feed, chunk)
+        yield from self._decode_records(decoder.finish)
+
+    async def aiter_records(
+        self,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        *,
+        json_lines: Optional[bool] = None,
+        max_record_size: Optional[int] = None,
+    ) -> AsyncIterator[Any]:
+        """Iterate over the JSON records in the body of a streamed response returned by AsyncBaseService.
+
+        This is the asynchronous counterpart of iter_records(), and takes the same arguments.
+
+        Raises:
+            TypeError: The result is not an asynchronous response.
+            ValueError: A record is longer than `max_record_size`.
+            ApiException: The body is not valid JSON.
+        """
+        decoder = self._get_record_decoder('aiter_bytes', json_lines, max_record_size)
+        async for chunk in self.aiter_bytes(chunk_size):
+            for record in self._decode_records(decoder.feed, chunk):
+                yield record
+        for record in self._decode_records(decoder.finish):
+            yield record
+
+    def close(self) -> None:
+        """Close the streamed response, releasing its connection."""
+        if hasattr(self.result, 'iter_content'):
+            self.result.close()
+
+    async def aclose(self) -> None:
+        """Close the streamed response returned by AsyncBaseService, releasing its connection."""
+        if hasattr(self.result, 'aiter_bytes'):
+            await self.result.aclose()
+        else:
+            self.close()
+
+    def __enter__(self) -> 'DetailedResponse':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    async def __aenter__(self) -> 'DetailedResponse':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    def _get_response(self, method: str):
+        if not hasattr(self.result, method):
+            raise TypeError(
+                'The result is not a {0}response'.format('' if method == 'iter_content' else 'asynchronous ')
+            )
+        return self.result
+
+    def _get_record_decoder(self, method: str, json_lines: Optional[bool], max_record_size: Optional[int]):
+        response = self._get_response(method)
+        if json_lines is None:
+            content_type = response.headers.get('Content-Type')
+            json_lines = is_json_lines_mimetype(content_type) or not is_json_mimetype(content_type)
+        if json_lines:
+            return _JsonLinesDecoder(self._json_codec or get_json_codec(), max_record_size)
+        return _JsonArrayDecoder(max_record_size)
+
+    def _decode_records(self, decode: Callable[..., List[Any]], *args) -> List[Any]:
+        try:
+            return decode(*args)
+        except json.JSONDecodeError as err:
+            raise ApiException(
+                code=self.status_code, http_response=self.result, message='Error processing the HTTP response'
+            ) from err
+
+    def _get_line_encoding(self, decode_unicode: bool, method: str) -> Optional[str]:
+        response = self._get_response(method)
+        return (response.encoding or 'utf-8') if decode_unicode else None
+
     def _to_dict(self) -> dict:
         _dict = {}
-        if hasattr(self, 'result') and self.result is not None:
-            _dict['result'] = self.result if isinstance(self.result, (dict, list)) else 'HTTP response'
+        if self._result_loader is not None:
+            # Don't parse a lazily parsed result, nor raise its parsing error, just to print it.
+            _dict['result'] = 'HTTP response'
+        elif self._result is not None:
+            _dict['result'] = self._result if isinstance(self._result, (dict, list)) else 'HTTP response'
         if hasattr(self, 'headers') and self.headers is not None:
             _dict['headers'] = self.headers
         if hasattr(self, 'status_code') and self.status_code is not None:
@@ -85,3 +372,171 @@ class DetailedResponse:
 
     def __str__(self) -> str:
         return json.dumps(self._to_dict(), indent=4, default=lambda o: o.__dict__)
+
+
+class _LineSplitter:
+    """Splits chunks of data into lines, keeping the incomplete last line until the next chunk."""
+
+    def __init__(self, max_line_size: Optional[int] = None, *, skip_blank: bool = False) -> None:
+        self.max_line_size = max_line_size
+        self.skip_blank = skip_blank
+        self._pending = bytearray()
+
+    def feed(self, chunk: bytes) -> List[bytes]:
+        """Returns the lines completed by `chunk`."""
+        # Only the new data needs to be searched for line breaks.
+        start = 0
+        search_from = len(self._pending)
+        self._pending += chunk
+        lines = []
+        while True:
+            end = self._pending.find(b'\n', search_from)
+            if end < 0:
+                break
+            line = self._line(start, end)
+            if line.strip() or not self.skip_blank:
+                lines.append(line)
+            start = search_from = end + 1
+        del self._pending[:start]
+        if self.max_line_size is not None and len(self._pending) > self.max_line_size:
+            raise ValueError('The response contains a line longer than {0} bytes'.format(self.max_line_size))
+        return lines
+
+    def finish(self) -> List[bytes]:
+        """Returns the last line, if the data doesn't end with a line break."""
+        line = self._line(0, len(self._pending))
+        self._pending.clear()
+        return [line] if line.strip() or (line and not self.skip_blank) else []
+
+    def _line(self, start: int, end: int) -> bytes:
+        if end > start and self._pending[end - 1] == 0x0D:
+            end -= 1
+        if self.max_line_size is not None and end - start > self.max_line_size:
+            raise ValueError('The response contains a line longer than {0} bytes'.format(self.max_line_size))
+        return bytes(self._pending[start:end])
+
+
+def _decode_lines(lines: List[bytes], encoding: Optional[str]) -> List[Union[bytes, str]]:
+    return [line.decode(encoding) for line in lines] if encoding else lines
+
+
+class _JsonLinesDecoder:
+    """Decodes chunks of JSON lines into records, skipping blank lines."""
+
+    def __init__(self, json_codec: JsonCodec, max_record_size: Optional[int] = None) -> None:
+        self._json_codec = json_codec
+        self._splitter = _LineSplitter(max_record_size, skip_blank=True)
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Returns the records completed by `chunk`."""
+        return [self._json_codec.loads(line) for line in self._splitter.feed(chunk)]
+
+    def finish(self) -> List[Any]:
+        """Returns the last record, if the data doesn't end with a line break."""
+        return [self._json_codec.loads(line) for line in self._splitter.finish()]
+
+
+class _JsonArrayDecoder:
+    """Decodes chunks of a JSON array into the elements of the array.
+
+    Each element is decoded as soon as it is complete. An incomplete element is decoded
+    again only after the data buffered for it has doubled, so that large elements that
+    span many chunks are decoded in linear time. If the JSON value is not an array, it's
+    decoded once all the data has arrived, as a single record.
+    """
+
+    _WHITESPACE = ' \t\n\r'
+
+    def __init__(self, max_record_size: Optional[int] = None) -> None:
+        self.max_record_size = max_record_size
+        self._decoder = json.JSONDecoder(strict=False)
+        self._text_decoder = codecs.getincrementaldecoder('utf-8')()
+        self._parts = []
+        self._size = 0
+        self._retry_size = 0
+        self._is_array = None
+        # 'element', 'separator' (a comma or the end of the array) or 'end'.
+        self._expecting = 'element'
+        self._count = 0
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        """Returns the elements completed by `chunk`."""
+        text = self._text_decoder.decode(chunk)
+        self._parts.append(text)
+        self._size += len(text)
+        if self._is_array is False or self._size < self._retry_size:
+            self._check_size()
+            return []
+        return self._decode(final=False)
+
+    def finish(self) -> List[Any]:
+        """Returns the remaining elements, or the whole value if it's not an array."""
+        text = self._text_decoder.decode(b'', final=True)
+        self._parts.append(text)
+        if self._is_array is False:
+            return [json.loads(''.join(self._parts), strict=False)]
+        records = self._decode(final=True)
+        if self._is_array and self._expecting != 'end':
+            raise json.JSONDecodeError('Unterminated array', ''.join(self._parts), self._size)
+        return records
+
+    def _decode(self, final: bool) -> List[Any]:
+        text = ''.join(self._parts)
+        position = 0
+        records = []
+        while True:
+            position = self._skip_whitespace(text, position)
+            if position == len(text):
+                break
+            if self._is_array is None:
+                self._is_array = text[position] == '['
+                if not self._is_array:
+                    break
+                position += 1
+            elif self._expecting == 'end':
+                raise json.JSONDecodeError('Extra data', text, position)
+            elif self._expecting == 'separator':
+                if text[position] not in ',]':
+                    raise json.JSONDecodeError("Expecting ',' delimiter", text, position)
+                self._expecting = 'element' if text[position] == ',' else 'end'
+                position += 1
+            elif text[position] == ']' and self._count == 0:
+                self._expecting = 'end'
+                position += 1
+            else:
+                try:
+                    record, end = self._decoder.raw_decode(text, position)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    self._retry_size = 2 * (len(text) - position)
+                    break
+                if not final and self._may_continue(record, text, end):
+                    break
+                self._retry_size = 0
+                records.append(record)
+                self._count += 1
+                self._expecting = 'separator'
+                position = end
+        text = text[position:]
+        self._parts = [text]
+        self._size = len(text)
+        self._check_size()
+        return records
+
+    @staticmethod
+    def _may_continue(record: Any, text: str, end: int) -> bool:
+        # A number decoded from a prefix, like 1 from '1.' or '1e', may continue in the next chunk.
+        if not isinstance(record, (int, float)) or isinstance(record, bool):
+            return False
+        return end == len(text) or text[end] in '.eE+-'
+
+    @classmethod
+    def _skip_whitespace(cls, text: str, position: int) -> int:
+        while position < len(text) and text[position] in cls._WHITESPACE:
+            position += 1
+        return position
+
+    def _check_size(self) -> None:
+        if self.max_record_size is not None and self._size > self.max_record_size:
+            raise ValueError('The response contains a record longer than {0} bytes'.format(self.max_record_size))
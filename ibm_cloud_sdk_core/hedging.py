@@ -0,0 +1,298 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import math
+import sys
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextvars import copy_context
+from threading import Lock
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+from .logger import get_logger
+from .retry_policy import RetryBudget
+
+logger = get_logger()
+
+
+class HedgingPolicy:
+    """Sends a copy of an idempotent request that is slow to respond, and uses the first successful response.
+
+    If no response arrives within the hedging delay, a hedge (a copy of the request) is sent,
+    up to `max_hedges` times. The first successful response is returned, the other requests are
+    cancelled (asynchronous requests) or their responses are discarded (synchronous requests).
+    A response is successful unless its status code is 429 or 5xx; if all the requests fail,
+    the outcome of the original request is returned.
+
+    The delay is fixed, or the `percentile` of the latency of recent requests, so that only the
+    slowest requests are hedged. Hedges are limited by a budget, so that they don't overload a
+    service that is slow for every request.
+
+    Keyword Args:
+        delay: The number of seconds to wait for a response before sending a hedge,
+            or None to use the `percentile` of recent latencies. Defaults to None.
+        percentile: The percentile of recent latencies used as the delay. Defaults to 0.95.
+        min_delay: The minimum delay in seconds, when it is computed from recent latencies. Defaults to 0.01.
+        min_samples: The number of latencies needed to compute the delay; requests are not hedged
+            until then. Defaults to 20.
+        window_size: The number of recent latencies tracked. Defaults to 200.
+        max_hedges: The maximum number of hedges sent for a request. Defaults to 1.
+        budget: The budget that limits the number of hedges.
+            Defaults to 10% of the requests, plus 1 hedge per second.
+        methods: The HTTP methods of the requests that can be hedged. Defaults to GET, HEAD and OPTIONS.
+        max_workers: The number of threads that send synchronous hedges. Defaults to 32.
+            The original requests are sent by another pool, which keeps one thread per request in flight,
+            so that they are never queued behind the hedges.
+
+    Raises:
+        ValueError: An argument is not valid.
+    """
+
+    def __init__(
+        self,
+        *,
+        delay: Optional[float] = None,
+        percentile: float = 0.95,
+        min_delay: float = 0.01,
+        min_samples: int = 20,
+        window_size: int = 200,
+        max_hedges: int = 1,
+        budget: Optional[RetryBudget] = None,
+        methods: Iterable[str] = ('GET', 'HEAD', 'OPTIONS'),
+        max_workers: int = 32,
+    ) -> None:
+        if delay is not None and delay < 0:
+            raise ValueError('delay must not be negative')
+        if not 0 < percentile <= 1:
+            raise ValueError('percentile must be greater than 0 and at most 1')
+        if max_hedges < 1 or max_workers < 1 or not 1 <= min_samples <= window_size:
+            raise ValueError('max_hedges and max_workers must be at least 1, min_samples between 1 and window_size')
+        self.delay = delay
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.min_samples = min_samples
+        self.max_hedges = max_hedges
+        self.budget = budget if budget is not None else RetryBudget()
+        self.methods = frozenset(method.upper() for method in methods)
+        self.max_workers = max_workers
+        self._latencies = deque(maxlen=window_size)
+        self._stats = {'requests': 0, 'hedges': 0, 'hedge_wins': 0, 'budget_exhausted': 0}
+        self._executor = None
+        self._original_executor = None
+        self._lock = Lock()
+
+    def should_hedge(self, method: str) -> bool:
+        """Returns true if requests with this HTTP method can be hedged."""
+        return method.upper() in self.methods
+
+    def get_delay(self) -> Optional[float]:
+        """Returns the number of seconds to wait before sending a hedge, or None if there are too few latencies."""
+        if self.delay is not None:
+            return self.delay
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            latencies = sorted(self._latencies)
+        return max(latencies[math.ceil(self.percentile * len(latencies)) - 1], self.min_delay)
+
+    def record_latency(self, elapsed: float) -> None:
+        """Record the number of seconds a request took to get a response."""
+        with self._lock:
+            self._latencies.append(elapsed)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Returns the hedging metrics.
+
+        Returns:
+            A dictionary with the number of 'requests' that could be hedged, the number of 'hedges' sent,
+            the number of 'hedge_wins' (a hedge returned the response), the number of hedges not sent
+            because of the budget ('budget_exhausted'), and the current 'delay' (or None).
+        """
+        with self._lock:
+            stats = dict(self._stats)
+        stats['delay'] = self.get_delay()
+        return stats
+
+    def call(self, method: str, send: Callable[[], Any]) -> Any:
+        """Send a request, hedging it if it is slow.
+
+        Args:
+            method: The HTTP method of the request.
+            send: A function that sends the request and returns a response with a `status_code`.
+                It is called in other threads when the request can be hedged.
+
+        Returns:
+            The first successful response, or the outcome of the original request.
+        """
+        delay = self._start(method)
+        if delay is None:
+            return self._timed(send)
+        # The original request is not sent by the executor of the hedges, so that the number of requests
+        # in flight is not limited by max_workers. The requests run in a copy of the context, so that
+        # they share the deadline of the caller.
+        original = self._submit(self._get_executor(original=True), send)
+        if original is None:
+            # The policy was closed meanwhile.
+            return self._timed(send)
+        attempts = [original]
+        pending = set(attempts)
+        winner = None
+        while winner is None:
+            can_hedge = delay is not None and len(attempts) <= self.max_hedges
+            done, pending = wait(pending, timeout=delay if can_hedge else None, return_when=FIRST_COMPLETED)
+            if not done:
+                attempt = self._submit(self._get_executor(), send) if self._acquire_hedge() else None
+                if attempt is not None:
+                    attempts.append(attempt)
+                    pending.add(attempt)
+                else:
+                    delay = None
+                continue
+            winner = next((future for future in attempts if future in done and self._succeeded(future)), None)
+            if winner is None and not pending:
+                winner = attempts[0]
+        self._finish(attempts.index(winner))
+        for attempt in attempts:
+            if attempt is not winner and not attempt.cancel():
+                attempt.add_done_callback(_discard_response)
+        return winner.result()
+
+    async def call_async(self, method: str, send: Callable[[], Awaitable[Any]]) -> Any:
+        """Send a request, hedging it if it is slow, with a coroutine function (see call).
+
+        The requests that don't return the response are cancelled.
+        """
+        delay = self._start(method)
+        if delay is None:
+            return await self._timed_async(send)
+        attempts = [asyncio.ensure_future(self._timed_async(send))]
+        pending = set(attempts)
+        winner = None
+        try:
+            while winner is None:
+                can_hedge = delay is not None and len(attempts) <= self.max_hedges
+                done, pending = await asyncio.wait(
+                    pending, timeout=delay if can_hedge else None, return_when=asyncio.FIRST_COMPLETED
+                )
+                if not done:
+                    if self._acquire_hedge():
+                        attempt = asyncio.ensure_future(self._timed_async(send))
+                        attempts.append(attempt)
+                        pending.add(attempt)
+                    else:
+                        delay = None
+                    continue
+                winner = next((task for task in attempts if task in done and self._succeeded(task)), None)
+                if winner is None and not pending:
+                    winner = attempts[0]
+        finally:
+            await _cancel_losers(attempts, winner)
+        self._finish(attempts.index(winner))
+        return winner.result()
+
+    def close(self) -> None:
+        """Stop the threads that send the synchronous requests, once their current request is sent.
+
+        The policy can still be used after it's closed, new threads are started when needed.
+        """
+        with self._lock:
+            executors = (self._executor, self._original_executor)
+            self._executor = self._original_executor = None
+        for executor in executors:
+            if executor is not None:
+                executor.shutdown(wait=False)
+
+    def _start(self, method: str) -> Optional[float]:
+        # Returns the hedging delay, or None if the request is not hedged.
+        if not self.should_hedge(method):
+            return None
+        self.budget.record_request()
+        with self._lock:
+            self._stats['requests'] += 1
+        return self.get_delay()
+
+    def _acquire_hedge(self) -> bool:
+        acquired = self.budget.try_acquire()
+        with self._lock:
+            self._stats['hedges' if acquired else 'budget_exhausted'] += 1
+        if acquired:
+            logger.debug('Sending a hedged request')
+        else:
+            logger.debug('Not hedging the request, the hedging budget is exhausted')
+        return acquired
+
+    def _finish(self, winner: int) -> None:
+        if winner > 0:
+            with self._lock:
+                self._stats['hedge_wins'] += 1
+
+    def _timed(self, send: Callable[[], Any]) -> Any:
+        start = time.monotonic()
+        response = send()
+        self.record_latency(time.monotonic() - start)
+        return response
+
+    async def _timed_async(self, send: Callable[[], Awaitable[Any]]) -> Any:
+        start = time.monotonic()
+        response = await send()
+        self.record_latency(time.monotonic() - start)
+        return response
+
+    def _get_executor(self, original: bool = False) -> ThreadPoolExecutor:
+        with self._lock:
+            if original:
+                if self._original_executor is None:
+                    # The idle threads are reused, so there are as many threads as original requests in flight.
+                    self._original_executor = ThreadPoolExecutor(
+                        max_workers=sys.maxsize, thread_name_prefix='ibm-cloud-sdk-core-hedged-request'
+                    )
+                return self._original_executor
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers, thread_name_prefix='ibm-cloud-sdk-core-hedging'
+                )
+            return self._executor
+
+    def _submit(self, executor: ThreadPoolExecutor, send: Callable[[], Any]) -> Optional[Future]:
+        # Returns None if the executor was shut down by close() since it was returned.
+        try:
+            return executor.submit(copy_context().run, self._timed, send)
+        except RuntimeError:
+            return None
+
+    @staticmethod
+    def _succeeded(attempt: Future) -> bool:
+        if attempt.cancelled() or attempt.exception() is not None:
+            return False
+        status_code = attempt.result().status_code
+        return status_code != 429 and status_code < 500
+
+
+def _discard_response(attempt: Future) -> None:
+    # Release the connection of a response that lost the race.
+    if not attempt.cancelled() and attempt.exception() is None:
+        attempt.result().close()
+
+
+async def _cancel_losers(attempts: List[asyncio.Future], winner: Optional[asyncio.Future]) -> None:
+    losers = [attempt for attempt in attempts if attempt is not winner]
+    for attempt in losers:
+        attempt.cancel()
+    for outcome in await asyncio.gather(*losers, return_exceptions=True):
+        if hasattr(outcome, 'aclose'):
+            await outcome.aclose()
@@ -0,0 +1,107 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from typing import Any, Optional
+
+# The steps of a call, in order, that hooks can be registered for (see BaseService.add_hook).
+# Before the request dict is built by prepare_request().
+PRE_PREPARE = 'pre_prepare'
+# After the request was authenticated by prepare_request(), which may have waited for a token.
+POST_AUTHENTICATE = 'post_authenticate'
+# Before send() sends the request.
+PRE_SEND = 'pre_send'
+# After send() received the response, including its body unless it is streamed.
+RESPONSE_RECEIVED = 'response_received'
+# After the JSON body of a successful response was parsed.
+POST_DECODE = 'post_decode'
+# When prepare_request() or send() raises an exception.
+ERROR = 'error'
+HOOK_EVENTS = (PRE_PREPARE, POST_AUTHENTICATE, PRE_SEND, RESPONSE_RECEIVED, POST_DECODE, ERROR)
+
+
+class HookEvent:  # pylint: disable=too-many-instance-attributes
+    """A step of a call, passed to the hooks registered with BaseService.add_hook().
+
+    The timestamps are time.monotonic() values, so the durations of the steps of a call
+    can be computed from the events, or correlated with other measurements.
+
+    Args:
+        name: The step, one of HOOK_EVENTS.
+        timestamp: The time of the step.
+        method: The HTTP method of the request.
+        url: The URL of the request; for PRE_PREPARE, the path given to prepare_request().
+
+    Keyword Args:
+        start: The time the step started, if it has a duration. Defaults to None.
+        request: The request dict. Defaults to None.
+        response: The requests (or httpx) response. Defaults to None.
+        size: A number of bytes. Defaults to None.
+        elapsed: The number of seconds between sending the request and receiving the response headers.
+            Defaults to None.
+        error: The exception raised. Defaults to None.
+
+    Attributes:
+        name (str): The step, one of HOOK_EVENTS.
+        timestamp (float): The time of the step.
+        start (float): The time the step started: when prepare_request() started authenticating the
+            request (POST_AUTHENTICATE), when the request was sent (RESPONSE_RECEIVED), when the body
+            started to be parsed (POST_DECODE), or when prepare_request() or send() was called (ERROR).
+            None for the other steps.
+        method (str): The HTTP method of the request.
+        url (str): The URL of the request.
+        request (dict): The request dict, except for PRE_PREPARE.
+        response: The response, for RESPONSE_RECEIVED, POST_DECODE and ERROR (if there is one).
+        status_code (int): The status code of the response, or None.
+        size (int): The size of the request body (PRE_SEND) or of the response body (RESPONSE_RECEIVED
+            and POST_DECODE) in bytes, or None if it is unknown.
+        elapsed (float): For RESPONSE_RECEIVED, the number of seconds between sending the request
+            (the last attempt, if it was retried) and receiving the response headers, or None.
+        error (Exception): The exception raised, for ERROR.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        timestamp: float,
+        method: str,
+        url: str,
+        *,
+        start: Optional[float] = None,
+        request: Optional[dict] = None,
+        response: Any = None,
+        size: Optional[int] = None,
+        elapsed: Optional[float] = None,
+        error: Optional[Exception] = None,
+    ) -> None:
+        self.name = name
+        self.timestamp = timestamp
+        self.start = start
+        self.method = method
+        self.url = url
+        self.request = request
+        self.response = response
+        self.status_code = getattr(response, 'status_code', None)
+        self.size = size
+        self.elapsed = elapsed
+        self.error = error
+
+    @property
+    def duration(self) -> Optional[float]:
+        """The number of seconds the step took, or None if it has no duration."""
+        return None if self.start is None else self.timestamp - self.start
+
+    def __repr__(self) -> str:
+        return '<HookEvent {0} {1} {2}>'.format(self.name, self.method, self.url)
@@ -1,28 +1,133 @@
 import ssl
+from functools import lru_cache
+from typing import Optional
 
 from requests import certs
 from requests.adapters import HTTPAdapter, DEFAULT_POOLBLOCK
 from urllib3.util.ssl_ import create_urllib3_context
 
 
+def create_ssl_context(disable_ssl_verification: bool = False, ca_certs: Optional[str] = None) -> ssl.SSLContext:
+    """Create the SSL context used for connections to service and token endpoints.
+
+    Loading the CA bundle is relatively expensive, so use get_ssl_context() unless
+    the returned context needs to be modified.
+
+    Args:
+        disable_ssl_verification: whether verification of the server's SSL certificate should be disabled.
+        ca_certs: the path of the CA bundle used to verify the server's certificate.
+            Defaults to the bundle used by the requests package.
+
+    Returns:
+        A new SSL context that requires at least TLS v1.2.
+    """
+    ssl_context = create_urllib3_context()
+    # NOTE: https://github.com/psf/requests/pull/6731/files#r1622893724
+    ssl_context.load_verify_locations(ca_certs or certs.where())
+    ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
+
+    if disable_ssl_verification:
+        ssl_context.check_hostname = False
+        ssl_context.verify_mode = ssl.CERT_NONE
+
+    return ssl_context
+
+
+@lru_cache(maxsize=None)
+def get_ssl_context(disable_ssl_verification: bool = False, ca_certs: Optional[str] = None) -> ssl.SSLContext:
+    """Return the process-wide SSL context for the given verification mode and CA bundle.
+
+    The context is created by create_ssl_context() on first use and then shared by all
+    the adapters and clients that use the same settings, so it must not be modified.
+
+    Args:
+        disable_ssl_verification: whether verification of the server's SSL certificate should be disabled.
+        ca_certs: the path of the CA bundle used to verify the server's certificate.
+            Defaults to the bundle used by the requests package.
+
+    Returns:
+        A shared SSL context that requires at least TLS v1.2.
+    """
+    return create_ssl_context(bool(disable_ssl_verification), ca_certs)
+
+
 class SSLHTTPAdapter(HTTPAdapter):
     """Wraps the original HTTP adapter and adds additional SSL context."""
 
     def __init__(self, *args, **kwargs):
         self._disable_ssl_verification = kwargs.pop('_disable_ssl_verification', None)
+        self._private_ssl_contexts = {}
 
         super().__init__(*args, **kwargs)
 
     def init_poolmanager(self, connections, maxsize, block=DEFAULT_POOLBLOCK, **pool_kwargs):
         """Create and use custom SSL configuration."""
 
-        ssl_context = create_urllib3_context()
-        # NOTE: https://github.com/psf/requests/pull/6731/files#r1622893724
-        ssl_context.load_verify_locations(certs.where())
-        ssl_context.minimum_version = ssl.TLSVersion.TLSv1_2
-
-        if self._disable_ssl_verification:
-            ssl_context.check_hostname = False
-            ssl_context.verify_mode = ssl.CERT_NONE
+        ssl_context = get_ssl_context(bool(self._disable_ssl_verification))
 
         super().init_poolmanager(connections, maxsize, block, ssl_context=ssl_context, **pool_kwargs)
+
+    def set_disable_ssl_verification(self, status: bool) -> None:
+        """Set the SSL verification mode used for new connections.
+
+        The SSL context is part of the connection pool key, so the connections opened
+        with the previous mode stay in their own pools and are never used with the new mode,
+        while the pools of the new mode are reused if the mode is switched back again.
+
+        Args:
+            status: set to true to disable ssl verification
+        """
+        self._disable_ssl_verification = status
+        self._private_ssl_contexts = {}
+        self.poolmanager.connection_pool_kw['ssl_context'] = get_ssl_context(bool(status))
+
+    def set_pool_config(self, pool_connections: int, pool_maxsize: int, pool_block: bool) -> None:
+        """Re-create the connection pools with a new sizing and blocking policy.
+
+        urllib3 pools can't be resized, so the current pools and their connections are closed.
+
+        Args:
+            pool_connections: The number of connection pools (one per host) to cache.
+            pool_maxsize: The maximum number of connections to keep in each pool.
+            pool_block: Whether requests should wait for a free connection when a pool is full.
+        """
+        if (pool_connections, pool_maxsize, pool_block) == (
+            self._pool_connections,
+            self._pool_maxsize,
+            self._pool_block,
+        ):
+            return
+        self.close()
+        self.proxy_manager.clear()
+        self._pool_connections = pool_connections
+        self._pool_maxsize = pool_maxsize
+        self._pool_block = pool_block
+        self.init_poolmanager(pool_connections, pool_maxsize, block=pool_block)
+
+    def cert_verify(self, conn, url, verify, cert):
+        """Keep the certificate requirements of the connection pool in line with its SSL context."""
+        super().cert_verify(conn, url, verify, cert)
+        ssl_context = getattr(conn, 'conn_kw', {}).get('ssl_context')
+        if ssl_context is not None and ssl_context.verify_mode == ssl.CERT_NONE:
+            conn.cert_reqs = 'CERT_NONE'
+
+    def build_connection_pool_key_attributes(self, request, verify, cert=None):
+        """Select the SSL context for requests that override the SSL verification settings."""
+        host_params, pool_kwargs = super().build_connection_pool_key_attributes(request, verify, cert)
+        disable_ssl_verification = bool(self._disable_ssl_verification) or verify is False
+        # urllib3 sets the verify mode of the SSL context from cert_reqs on every connection,
+        # so it must always match the mode of the context, otherwise a request with verify=True
+        # would turn on the verification in the context shared with the other adapters.
+        pool_kwargs['cert_reqs'] = 'CERT_NONE' if disable_ssl_verification else 'CERT_REQUIRED'
+        if isinstance(verify, str) or cert is not None:
+            # urllib3 loads custom CA bundles and client certificates into the SSL context,
+            # so these requests use a private context instead of the shared one.
+            key = (verify, cert if cert is None or isinstance(cert, str) else tuple(cert))
+            ssl_context = self._private_ssl_contexts.get(key)
+            if ssl_context is None:
+                ssl_context = create_ssl_context(disable_ssl_verification)
+                self._private_ssl_contexts[key] = ssl_context
+            pool_kwargs['ssl_context'] = ssl_context
+        else:
+            pool_kwargs['ssl_context'] = get_ssl_context(disable_ssl_verification)
+        return host_params, pool_kwargs
@@ -0,0 +1,155 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import codecs
+import json
+from typing import Any, Union
+
+import requests
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+
+class JsonCodec:
+    """Serializes request bodies to JSON and parses JSON response bodies, with the `json` package.
+
+    Subclasses can use a faster JSON library, as long as they accept and return the same values.
+    """
+
+    name = 'json'
+
+    def dumps(self, obj: Any) -> bytes:
+        """Serialize `obj` to UTF-8 encoded JSON.
+
+        Raises:
+            TypeError: `obj` contains a value that can't be serialized.
+        """
+        return json.dumps(obj).encode('utf-8')
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        """Parse a JSON document. Control characters are allowed inside strings.
+
+        Raises:
+            json.JSONDecodeError: `data` is not valid JSON.
+        """
+        return json.loads(data, strict=False)
+
+    def loads_response(self, response: Any) -> Any:
+        """Parse the JSON body of a `requests` or `httpx` response.
+
+        The body is parsed from the raw bytes, without decoding it to text first,
+        unless the response declares a charset other than UTF-8.
+
+        Raises:
+            requests.exceptions.JSONDecodeError: The body is not valid JSON.
+        """
+        try:
+            if _is_text_encoding(response.encoding):
+                return self.loads(response.text)
+            return self.loads(response.content)
+        except json.JSONDecodeError as err:
+            # Raise the same exception as requests.Response.json().
+            raise requests.exceptions.JSONDecodeError(err.msg, err.doc, err.pos) from err
+
+
+class OrjsonCodec(JsonCodec):
+    """Serializes and parses JSON with the `orjson` package, which is several times faster than `json`.
+
+    The output is compact and not ASCII-escaped, which is equivalent JSON. Values that `orjson`
+    can't handle, like integers larger than 64 bits, NaN in documents or control characters inside
+    strings, are passed to JsonCodec instead. So are the datetime, dataclass and numpy values
+    that `orjson` would serialize itself, so that they raise a TypeError as with `json`.
+    The remaining differences with JsonCodec are in request bodies: NaN and infinite floats are
+    serialized as null rather than NaN and Infinity, and UUID and Enum values are serialized
+    (as a string and as their value) rather than rejected.
+    """
+
+    # Let json reject the types that orjson serializes only when asked to.
+    _DUMPS_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        if orjson is not None
+        else 0
+    )
+
+    name = 'orjson'
+
+    def __init__(self) -> None:
+        if orjson is None:
+            raise ImportError('OrjsonCodec requires the orjson package')
+
+    def dumps(self, obj: Any) -> bytes:
+        try:
+            return orjson.dumps(obj, default=_reject, option=self._DUMPS_OPTIONS)
+        except TypeError:
+            # orjson.JSONEncodeError is a TypeError.
+            return super().dumps(obj)
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        try:
+            return orjson.loads(data)
+        except json.JSONDecodeError:
+            # orjson.JSONDecodeError is a json.JSONDecodeError.
+            return super().loads(data)
+
+
+# The codecs that can be selected with the JSON_CODEC configuration property, by name.
+JSON_CODECS = {codec.name: codec for codec in (JsonCodec, OrjsonCodec)}
+
+
+def _reject(obj: Any) -> None:
+    """Called by orjson for the values it doesn't serialize, so that they're passed to json."""
+    raise TypeError('Type is not JSON serializable: {0}'.format(type(obj).__name__))
+
+
+def _is_text_encoding(encoding: str) -> bool:
+    """Returns true if the body must be decoded to text before it's parsed, false if it can be parsed as bytes."""
+    if not encoding:
+        return False
+    try:
+        return codecs.lookup(encoding).name != 'utf-8'
+    except LookupError:
+        return False
+
+
+_default_codec = JsonCodec()
+
+
+def get_json_codec() -> JsonCodec:
+    """Returns the codec used by the services that don't have their own (see BaseService.set_json_codec).
+
+    It's a JsonCodec, unless another codec was set with set_json_codec(), e.g. an OrjsonCodec.
+    """
+    return _default_codec
+
+
+def set_json_codec(codec: JsonCodec) -> None:
+    """Set the codec used by the services that don't have their own.
+
+    Use set_json_codec(OrjsonCodec()) to serialize and parse JSON with the `orjson` package.
+
+    Args:
+        codec: The codec to use.
+
+    Raises:
+        TypeError: The `codec` is not a JsonCodec.
+    """
+    global _default_codec  # pylint: disable=global-statement
+    if not isinstance(codec, JsonCodec):
+        raise TypeError('codec must be a JsonCodec')
+    _default_codec = codec
@@ -0,0 +1,303 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import queue
+import weakref
+from threading import Event, Thread
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, List, Optional, Tuple
+
+from .detailed_response import DetailedResponse
+from .utils import get_query_param
+
+# Each page is passed from the worker to the consumer as (items, next page token, error).
+_Page = Tuple[Optional[List[Any]], Any, Optional[BaseException]]
+
+
+def get_next_page_token(result: dict, page_param: str = 'start') -> Any:
+    """Returns the value of the page parameter that selects the page after `result`, or None if it is the last page.
+
+    The token is taken from the `next` (or `next_url`) property of the result, which can be a URL,
+    or an object with a `href` URL or the token itself. If the result has no `next` property and
+    the page parameter is 'offset', the next offset is computed from the `offset`, `limit` and
+    `total_count` properties.
+
+    Args:
+        result: The result of the list operation.
+        page_param: The name of the operation parameter that selects the page. Defaults to 'start'.
+    """
+    next_link = result.get('next') or result.get('next_url')
+    if isinstance(next_link, dict):
+        if next_link.get(page_param) is not None:
+            return next_link.get(page_param)
+        next_link = next_link.get('href')
+    if next_link:
+        return get_query_param(next_link, page_param)
+    if page_param == 'offset' and result.get('limit') and result.get('total_count') is not None:
+        offset = (result.get('offset') or 0) + result.get('limit')
+        if offset < result.get('total_count'):
+            return offset
+    return None
+
+
+class _BasePager:  # pylint: disable=too-few-public-methods
+    def __init__(
+        self,
+        operation: Callable[..., Any],
+        items_key: str,
+        *,
+        page_param: str = 'start',
+        prefetch: int = 1,
+        next_token: Optional[Callable[[dict], Any]] = None,
+        **params,
+    ) -> None:
+        if prefetch < 0:
+            raise ValueError('prefetch must be zero or greater')
+        self.operation = operation
+        self.items_key = items_key
+        self.page_param = page_param
+        self.prefetch = prefetch
+        self.next_token = next_token or (lambda result: get_next_page_token(result, page_param))
+        self.params = params
+        self._has_next = True
+        self._token = params.pop(page_param, None)
+
+    def has_next(self) -> bool:
+        """Returns true if there are more pages to fetch."""
+        return self._has_next
+
+    def _get_call_params(self, token: Any) -> dict:
+        params = dict(self.params)
+        if token is not None:
+            params[self.page_param] = token
+        return params
+
+    def _process_result(self, detailed_response: DetailedResponse) -> Tuple[List[Any], Any]:
+        result = detailed_response.get_result() or {}
+        return result.get(self.items_key) or [], self.next_token(result)
+
+    def _receive(self, page: _Page) -> List[Any]:
+        items, token, error = page
+        if error is not None:
+            self._has_next = False
+            raise error
+        self._token = token
+        self._has_next = token is not None
+        return items
+
+
+class Pager(_BasePager):
+    """Iterates over the items returned by a paginated list operation, one page at a time.
+
+    The next pages are fetched by a worker thread while the current page is consumed, so that
+    the requests overlap with the processing of the items. Close the pager (or use it as a
+    context manager) to stop the worker if the items are not all consumed. Breaking out of a
+    loop over the pager closes it, and the worker also stops once the pager is garbage collected.
+
+    Args:
+        operation: The list operation, e.g. `service.list_resource_instances`. It is called with
+            `params` and the page parameter, and returns a DetailedResponse.
+        items_key: The name of the property of the result that contains the items of a page.
+
+    Keyword Args:
+        page_param: The name of the operation parameter that selects the page, e.g. 'start' or 'offset'.
+            Defaults to 'start'.
+        prefetch: The maximum number of pages fetched ahead of the page being consumed, or 0 to fetch
+            each page when it is needed, without a worker thread. Defaults to 1.
+        next_token: A function that takes the result of the operation and returns the value of the page
+            parameter for the next page, or None after the last page. Defaults to get_next_page_token().
+        params: The other parameters of the operation, sent with every page request.
+
+    Raises:
+        ValueError: `prefetch` is negative.
+    """
+
+    def __init__(self, operation: Callable[..., DetailedResponse], items_key: str, **kwargs) -> None:
+        super().__init__(operation, items_key, **kwargs)
+        self._pages = None
+        self._stopped = Event()
+
+    def get_next(self) -> List[Any]:
+        """Returns the items of the next page.
+
+        Raises:
+            StopIteration: There are no more pages.
+            ApiException: The request for the page failed.
+        """
+        if not self.has_next():
+            raise StopIteration('No more results available')
+        if self.prefetch == 0:
+            return self._receive(self._fetch(self._token))
+        if self._pages is None:
+            self._pages = queue.Queue(self.prefetch)
+            # The worker only holds a weak reference to the pager, so that an abandoned pager can be collected.
+            Thread(
+                target=_prefetch,
+                args=(weakref.ref(self), self._pages, self._stopped, self._token),
+                name='ibm-cloud-sdk-core-pager',
+                daemon=True,
+            ).start()
+        return self._receive(self._pages.get())
+
+    def get_all(self) -> List[Any]:
+        """Returns the items of all the remaining pages."""
+        results = []
+        while self.has_next():
+            results.extend(self.get_next())
+        return results
+
+    def close(self) -> None:
+        """Stop fetching pages. The worker thread exits after its current request."""
+        self._has_next = False
+        self._stopped.set()
+        if self._pages is not None:
+            while not self._pages.empty():
+                self._pages.get_nowait()
+
+    def __iter__(self) -> Iterator[Any]:
+        try:
+            while self.has_next():
+                yield from self.get_next()
+        finally:
+            self.close()
+
+    def __enter__(self) -> 'Pager':
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _fetch(self, token: Any) -> _Page:
+        try:
+            items, token = self._process_result(self.operation(**self._get_call_params(token)))
+            return items, token, None
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            # The error is raised in the consumer's thread.
+            return None, None, err
+
+
+def _prefetch(pager_ref: 'weakref.ref[Pager]', pages: queue.Queue, stopped: Event, token: Any) -> None:
+    """Fetches the pages of a Pager into `pages`, until the last page or until the pager is closed or collected."""
+    while True:
+        pager = pager_ref()
+        if pager is None or stopped.is_set():
+            return
+        page = pager._fetch(token)  # pylint: disable=protected-access
+        del pager
+        while True:
+            if pager_ref() is None or stopped.is_set():
+                return
+            try:
+                pages.put(page, timeout=0.1)
+                break
+            except queue.Full:
+                continue
+        token = page[1]
+        if token is None:
+            return
+
+
+class AsyncPager(_BasePager):
+    """Asyncio counterpart of Pager, for the list operations of AsyncBaseService.
+
+    The next pages are fetched by a task while the current page is consumed. Close the pager
+    (or use it as an async context manager) to cancel the task if the items are not all consumed.
+    Breaking out of an `async for` loop over the pager closes it when the loop's iterator is finalized.
+
+    Args:
+        operation: The coroutine function of the list operation. It is called with `params` and
+            the page parameter, and returns a DetailedResponse.
+        items_key: The name of the property of the result that contains the items of a page.
+
+    Keyword Args:
+        page_param: The name of the operation parameter that selects the page. Defaults to 'start'.
+        prefetch: The maximum number of pages fetched ahead of the page being consumed, or 0 to fetch
+            each page when it is needed. Defaults to 1.
+        next_token: A function that takes the result of the operation and returns the value of the page
+            parameter for the next page, or None after the last page. Defaults to get_next_page_token().
+        params: The other parameters of the operation, sent with every page request.
+
+    Raises:
+        ValueError: `prefetch` is negative.
+    """
+
+    def __init__(self, operation: Callable[..., Awaitable[DetailedResponse]], items_key: str, **kwargs) -> None:
+        super().__init__(operation, items_key, **kwargs)
+        self._pages = None
+        self._task = None
+
+    async def get_next(self) -> List[Any]:
+        """Returns the items of the next page.
+
+        Raises:
+            StopAsyncIteration: There are no more pages.
+            ApiException: The request for the page failed.
+        """
+        if not self.has_next():
+            raise StopAsyncIteration('No more results available')
+        if self.prefetch == 0:
+            return self._receive(await self._fetch(self._token))
+        if self._pages is None:
+            self._pages = asyncio.Queue(self.prefetch)
+            self._task = asyncio.ensure_future(self._prefetch(self._token))
+        return self._receive(await self._pages.get())
+
+    async def get_all(self) -> List[Any]:
+        """Returns the items of all the remaining pages."""
+        results = []
+        while self.has_next():
+            results.extend(await self.get_next())
+        return results
+
+    async def aclose(self) -> None:
+        """Stop fetching pages, cancelling the current request."""
+        self._has_next = False
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    async def __aiter__(self) -> AsyncIterator[Any]:
+        try:
+            while self.has_next():
+                for item in await self.get_next():
+                    yield item
+        finally:
+            await self.aclose()
+
+    async def __aenter__(self) -> 'AsyncPager':
+        return self
+
+    async def __aexit__(self, *args) -> None:
+        await self.aclose()
+
+    async def _fetch(self, token: Any) -> _Page:
+        try:
+            items, token = self._process_result(await self.operation(**self._get_call_params(token)))
+            return items, token, None
+        except Exception as err:  # pylint: disable=broad-exception-caught
+            return None, None, err
+
+    async def _prefetch(self, token: Any) -> None:
+        while True:
+            page = await self._fetch(token)
+            await self._pages.put(page)
+            token = page[1]
+            if token is None:
+                return
@@ -0,0 +1,303 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import asyncio
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from email.utils import parsedate_to_datetime
+from threading import Lock
+from typing import Any, Dict, Iterator, Mapping, Optional, Tuple
+from urllib.parse import urlsplit
+
+from .deadline import DeadlineExceededException, get_deadline
+from .logger import get_logger
+
+logger = get_logger()
+
+# X-RateLimit-Reset values larger than this are epoch timestamps rather than a number of seconds.
+_EPOCH_THRESHOLD = 10**9
+
+# The rate limiter and the URL of the request being sent, so that its retries wait too (see rate_limited_request()).
+_current_request: ContextVar[Optional[Tuple['RateLimiter', str]]] = ContextVar(
+    'ibm_cloud_sdk_core_rate_limited_request', default=None
+)
+
+
+class _Bucket:
+    def __init__(self, rate: float, burst: float, now: float) -> None:
+        self.rate = rate
+        self.tokens = burst
+        # The time the tokens were last refilled. It is in the future while the bucket is paused.
+        self.updated = now
+        self.waiting = 0
+
+    def refill(self, now: float, burst: float) -> None:
+        """Add the tokens accumulated since the last refill, up to `burst`."""
+        if now > self.updated:
+            self.tokens = min(burst, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+
+    def pause_until(self, until: float) -> None:
+        """Stop adding tokens until the monotonic time `until`."""
+        # Keep a single token, for the first request sent when the pause ends.
+        self.tokens = min(self.tokens, 1)
+        self.updated = max(self.updated, until)
+
+
+class RateLimiter:
+    """Limits the rate of the requests sent to each host (or each request path) with a token bucket.
+
+    Requests wait for a token before they are sent, so that concurrent callers are throttled on the
+    client rather than by the server. The rate adapts to the responses: it is halved on each 429
+    response, and requests are paused for the time given by the Retry-After header. When responses
+    include the X-RateLimit-Remaining and X-RateLimit-Reset headers, the rate is set to spread the
+    remaining requests until the reset time. Otherwise it recovers gradually up to the configured rate.
+
+    Args:
+        rate: The maximum number of requests per second.
+
+    Keyword Args:
+        burst: The number of requests that can be sent at once, after a period of inactivity.
+            Defaults to `rate` (at least 1).
+        per: 'host' to limit the requests to each host, or 'path' to limit the requests to each
+            request path separately. Defaults to 'host'.
+        min_rate: The rate is never reduced below this number of requests per second.
+            Defaults to 1% of `rate`.
+        max_buckets: The maximum number of hosts (or paths) tracked. When it is reached, the least
+            recently used host (or path) without waiting requests is forgotten. Defaults to 1000.
+
+    Raises:
+        ValueError: An argument is not valid.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        *,
+        burst: Optional[float] = None,
+        per: str = 'host',
+        min_rate: Optional[float] = None,
+        max_buckets: int = 1000,
+    ) -> None:
+        if rate <= 0:
+            raise ValueError('rate must be greater than 0')
+        if per not in ('host', 'path'):
+            raise ValueError("per must be 'host' or 'path'")
+        if max_buckets < 1:
+            raise ValueError('max_buckets must be at least 1')
+        self.rate = rate
+        self.burst = max(burst if burst is not None else rate, 1)
+        self.per = per
+        self.min_rate = min(min_rate if min_rate is not None else rate / 100, rate)
+        self.max_buckets = max_buckets
+        # In least recently used order.
+        self._buckets: 'OrderedDict[str, _Bucket]' = OrderedDict()
+        self._lock = Lock()
+
+    def acquire(self, url: str) -> float:
+        """Wait until a request can be sent to `url`.
+
+        Returns:
+            The time waited, in seconds.
+
+        Raises:
+            DeadlineExceededException: The request could only be sent after the deadline of the call.
+        """
+        key, delay = self._reserve(url)
+        if delay > 0:
+            self._check_deadline(key, delay)
+            logger.debug('Rate limiter delaying request to %s for %.3f seconds', key, delay)
+            try:
+                time.sleep(delay)
+            finally:
+                self._done_waiting(key)
+        return delay
+
+    async def acquire_async(self, url: str) -> float:
+        """Wait until a request can be sent to `url`, without blocking the event loop.
+
+        Returns:
+            The time waited, in seconds.
+
+        Raises:
+            DeadlineExceededException: The request could only be sent after the deadline of the call.
+        """
+        key, delay = self._reserve(url)
+        if delay > 0:
+            self._check_deadline(key, delay)
+            logger.debug('Rate limiter delaying request to %s for %.3f seconds', key, delay)
+            try:
+                await asyncio.sleep(delay)
+            finally:
+                self._done_waiting(key)
+        return delay
+
+    def record_response(self, url: str, status_code: int, headers: Mapping[str, str]) -> None:
+        """Adapt the rate for `url` to a response received from the server.
+
+        Args:
+            url: The URL of the request.
+            status_code: The status code of the response.
+            headers: The headers of the response.
+        """
+        now = time.monotonic()
+        retry_after = _parse_delay(headers.get('Retry-After')) if status_code == 429 else None
+        remaining = _parse_number(headers.get('X-RateLimit-Remaining'))
+        reset = _parse_reset(headers.get('X-RateLimit-Reset'))
+        with self._lock:
+            bucket = self._get_bucket(self._get_key(url), now)
+            bucket.refill(now, self.burst)
+            if status_code == 429:
+                bucket.rate = max(self.min_rate, bucket.rate / 2)
+                bucket.pause_until(now + (retry_after if retry_after is not None else 1 / bucket.rate))
+            elif remaining is not None and reset is not None:
+                if remaining < 1:
+                    bucket.pause_until(now + reset)
+                else:
+                    bucket.rate = min(self.rate, max(self.min_rate, remaining / max(reset, 1)))
+            else:
+                # Additive increase, back to the configured rate after 10 successful responses.
+                bucket.rate = min(self.rate, bucket.rate + self.rate / 10)
+        if status_code == 429:
+            logger.debug('Rate limiter reduced the rate for %s after a 429 response', self._get_key(url))
+
+    def get_rate(self, url: str) -> float:
+        """Returns the current rate, in requests per second, for the requests to `url`."""
+        with self._lock:
+            bucket = self._buckets.get(self._get_key(url))
+            return bucket.rate if bucket is not None else self.rate
+
+    def get_queue_depth(self, url: Optional[str] = None) -> int:
+        """Returns the number of requests waiting to be sent to `url`, or to any URL if `url` is None."""
+        with self._lock:
+            if url is None:
+                return sum(bucket.waiting for bucket in self._buckets.values())
+            bucket = self._buckets.get(self._get_key(url))
+            return bucket.waiting if bucket is not None else 0
+
+    def get_stats(self) -> Dict[str, Dict[str, float]]:
+        """Returns the current rate and queue depth of each host (or path), keyed by host (or path)."""
+        with self._lock:
+            return {key: {'rate': bucket.rate, 'queue_depth': bucket.waiting} for key, bucket in self._buckets.items()}
+
+    def _get_key(self, url: str) -> str:
+        parts = urlsplit(url)
+        if self.per == 'path':
+            return parts.netloc.lower() + parts.path
+        return parts.netloc.lower()
+
+    def _get_bucket(self, key: str, now: float) -> _Bucket:
+        bucket = self._buckets.get(key)
+        if bucket is not None:
+            self._buckets.move_to_end(key)
+            return bucket
+        if len(self._buckets) >= self.max_buckets:
+            # Forget the least recently used bucket that no request is waiting for.
+            idle_key = next((key for key, bucket in self._buckets.items() if not bucket.waiting), None)
+            if idle_key is not None:
+                del self._buckets[idle_key]
+        bucket = _Bucket(self.rate, self.burst, now)
+        self._buckets[key] = bucket
+        return bucket
+
+    def _reserve(self, url: str) -> Tuple[str, float]:
+        # Take a token, going into debt if there are none left: each request waits until
+        # the bucket has been refilled enough to pay for it and the requests before it.
+        key = self._get_key(url)
+        now = time.monotonic()
+        with self._lock:
+            bucket = self._get_bucket(key, now)
+            bucket.refill(now, self.burst)
+            bucket.tokens -= 1
+            delay = bucket.updated - now + max(0, -bucket.tokens) / bucket.rate
+            if delay > 0:
+                bucket.waiting += 1
+        return key, delay
+
+    def _check_deadline(self, key: str, delay: float) -> None:
+        # Give up now, and give the token back, rather than waiting past the deadline of the call.
+        deadline = get_deadline()
+        if deadline is not None and delay >= deadline.remaining():
+            with self._lock:
+                bucket = self._buckets[key]
+                bucket.tokens += 1
+                bucket.waiting -= 1
+            logger.debug('Rate limiter not delaying request to %s, the deadline would be exceeded', key)
+            raise DeadlineExceededException(deadline.total_timeout)
+
+    def _done_waiting(self, key: str) -> None:
+        with self._lock:
+            self._buckets[key].waiting -= 1
+
+
+@contextmanager
+def rate_limited_request(rate_limiter: RateLimiter, url: str) -> Iterator[None]:
+    """Make the retries of the request to `url` sent in a `with` block wait for `rate_limiter`.
+
+    The retries are sent by urllib3, which calls RetryPolicy.sleep() and so acquire_for_retry() before each one.
+    """
+    token = _current_request.set((rate_limiter, url))
+    try:
+        yield
+    finally:
+        _current_request.reset(token)
+
+
+def acquire_for_retry(response: Any = None) -> None:
+    """Record the response that is retried, if any, and wait until the retry can be sent.
+
+    Does nothing outside of a rate_limited_request() block.
+    """
+    current = _current_request.get()
+    if current is None:
+        return
+    rate_limiter, url = current
+    if response is not None:
+        rate_limiter.record_response(url, response.status, response.headers)
+    rate_limiter.acquire(url)
+
+
+def _parse_number(value: Optional[str]) -> Optional[float]:
+    try:
+        return float(value) if value is not None else None
+    except ValueError:
+        return None
+
+
+def _parse_delay(value: Optional[str]) -> Optional[float]:
+    """Parse a Retry-After header, which is a number of seconds or an HTTP date."""
+    if value is None:
+        return None
+    seconds = _parse_number(value)
+    if seconds is not None:
+        return max(seconds, 0)
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0)
+    except (TypeError, ValueError):
+        logger.debug('Ignoring invalid Retry-After header: %s', value)
+        return None
+
+
+def _parse_reset(value: Optional[str]) -> Optional[float]:
+    """Parse an X-RateLimit-Reset header, which is a number of seconds or an epoch timestamp."""
+    reset = _parse_number(value)
+    if reset is None:
+        return None
+    if reset > _EPOCH_THRESHOLD:
+        reset -= time.time()
+    return max(reset, 0)
@@ -0,0 +1,255 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import math
+import random
+import time
+from collections import deque
+from threading import Lock
+from typing import Optional
+
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+from .circuit_breaker import record_wait
+from .deadline import DeadlineExceededException, get_deadline
+from .logger import get_logger
+from .rate_limiter import acquire_for_retry
+
+logger = get_logger()
+
+EXPONENTIAL = 'exponential'
+FULL_JITTER = 'full_jitter'
+EQUAL_JITTER = 'equal_jitter'
+DECORRELATED_JITTER = 'decorrelated_jitter'
+BACKOFF_STRATEGIES = (EXPONENTIAL, FULL_JITTER, EQUAL_JITTER, DECORRELATED_JITTER)
+
+
+def compute_backoff(strategy: str, attempt: int, base: float, cap: float, previous: float = 0.0) -> float:
+    """Returns the number of seconds to wait before a retry.
+
+    Args:
+        strategy: One of BACKOFF_STRATEGIES:
+            'exponential' waits base * 2^(attempt - 1) seconds, except before the first retry (like urllib3);
+            'full_jitter' waits a random time between 0 and that exponential delay;
+            'equal_jitter' waits half of the exponential delay, plus a random time up to the other half;
+            'decorrelated_jitter' waits a random time between `base` and 3 times the previous wait.
+        attempt: The number of the retry, starting at 1.
+        base: The base delay in seconds.
+        cap: The maximum delay in seconds.
+        previous: The previous wait, for 'decorrelated_jitter'. Defaults to 0 (no previous wait).
+
+    Raises:
+        ValueError: The strategy is not supported.
+    """
+    if strategy == DECORRELATED_JITTER:
+        return min(cap, random.uniform(base, max(base, (previous or base) * 3)))
+    # Limit the exponent, the delay is capped anyway.
+    exponential = min(cap, base * 2 ** min(attempt - 1, 64))
+    if strategy == EXPONENTIAL:
+        return exponential if attempt > 1 else 0.0
+    if strategy == FULL_JITTER:
+        return random.uniform(0, exponential)
+    if strategy == EQUAL_JITTER:
+        return exponential / 2 + random.uniform(0, exponential / 2)
+    raise _unsupported_strategy(strategy)
+
+
+def _unsupported_strategy(strategy: str) -> ValueError:
+    return ValueError(
+        'Unsupported backoff strategy: {0}. Supported strategies: {1}'.format(strategy, ', '.join(BACKOFF_STRATEGIES))
+    )
+
+
+class RetryBudget:
+    """Limits retries to a proportion of the requests sent over a sliding window.
+
+    Retries are allowed while the retries sent during the last `window` seconds are fewer than
+    `ratio` times the requests sent in that time, plus `min_retries_per_second` times `window`,
+    which lets a client that sends few requests retry them. When the budget is exhausted, failed
+    requests are not retried, so that retries don't add to the load of a service that is already failing.
+    A budget can be shared by several services.
+
+    Args:
+        ratio: The maximum number of retries per request. Defaults to 0.1 (10%).
+
+    Keyword Args:
+        min_retries_per_second: The number of retries per second that are always allowed. Defaults to 1.
+        window: The length of the window in seconds. Defaults to 10.
+
+    Raises:
+        ValueError: An argument is negative, or the window is less than 1 second.
+    """
+
+    def __init__(self, ratio: float = 0.1, *, min_retries_per_second: float = 1.0, window: int = 10) -> None:
+        if ratio < 0 or min_retries_per_second < 0:
+            raise ValueError('ratio and min_retries_per_second must not be negative')
+        if window < 1:
+            raise ValueError('window must be at least 1 second')
+        self.ratio = ratio
+        self.min_retries_per_second = min_retries_per_second
+        self.window = int(window)
+        # One [second, requests, retries] counter for each second of the window.
+        self._counters = deque()
+        self._requests = 0
+        self._retries = 0
+        self._lock = Lock()
+
+    def record_request(self) -> None:
+        """Record a request, which adds `ratio` retries to the budget."""
+        with self._lock:
+            self._current_counter()[1] += 1
+            self._requests += 1
+
+    def can_retry(self) -> bool:
+        """Returns true if the budget allows a retry."""
+        with self._lock:
+            self._current_counter()
+            return self._available() >= 1
+
+    def try_acquire(self) -> bool:
+        """Take a retry from the budget.
+
+        Returns:
+            True if the retry can be sent, false if the budget is exhausted.
+        """
+        with self._lock:
+            counter = self._current_counter()
+            if self._available() < 1:
+                return False
+            counter[2] += 1
+            self._retries += 1
+            return True
+
+    def get_available(self) -> int:
+        """Returns the number of retries left in the budget."""
+        with self._lock:
+            self._current_counter()
+            return max(math.floor(self._available()), 0)
+
+    def _available(self) -> float:
+        return self.ratio * self._requests + self.min_retries_per_second * self.window - self._retries
+
+    def _current_counter(self) -> list:
+        second = int(time.monotonic())
+        while self._counters and self._counters[0][0] <= second - self.window:
+            _, requests, retries = self._counters.popleft()
+            self._requests -= requests
+            self._retries -= retries
+        if not self._counters or self._counters[-1][0] != second:
+            self._counters.append([second, 0, 0])
+        return self._counters[-1]
+
+
+class RetryPolicy(Retry):
+    """A urllib3 retry configuration with a choice of backoff strategies and an optional retry budget.
+
+    The backoff between retries is computed by compute_backoff(), with `backoff_factor` as the base
+    delay and `backoff_max` as the maximum delay. A Retry-After header in the response still takes
+    precedence. When the retry budget is exhausted, responses are returned without being retried
+    and connection errors are raised as MaxRetryError, without waiting. When the call has a deadline
+    (see deadline_scope) that would pass before the next retry, a DeadlineExceededException is raised.
+    Retries of a request sent through a rate limiter also wait for it (see rate_limiter.rate_limited_request).
+
+    Keyword Args:
+        backoff_strategy: One of BACKOFF_STRATEGIES. Defaults to 'exponential'.
+        retry_budget: The budget that limits the number of retries, or None for no limit. Defaults to None.
+        backoff_value: The wait before the current retry, used to compute the next one. Defaults to 0.
+        kwargs: The other arguments of urllib3's Retry.
+
+    Raises:
+        ValueError: The backoff strategy is not supported.
+    """
+
+    def __init__(
+        self,
+        *args,
+        backoff_strategy: str = EXPONENTIAL,
+        retry_budget: Optional[RetryBudget] = None,
+        backoff_value: float = 0.0,
+        **kwargs,
+    ) -> None:
+        if backoff_strategy not in BACKOFF_STRATEGIES:
+            raise _unsupported_strategy(backoff_strategy)
+        super().__init__(*args, **kwargs)
+        self.backoff_strategy = backoff_strategy
+        self.retry_budget = retry_budget
+        self.backoff_value = backoff_value
+
+    def new(self, **kw) -> 'RetryPolicy':
+        kw.setdefault('backoff_strategy', self.backoff_strategy)
+        kw.setdefault('retry_budget', self.retry_budget)
+        kw.setdefault('backoff_value', self.backoff_value)
+        return super().new(**kw)
+
+    def is_retry(self, method: str, status_code: int, has_retry_after: bool = False) -> bool:
+        if not super().is_retry(method, status_code, has_retry_after):
+            return False
+        if self.retry_budget is not None and not self.retry_budget.can_retry():
+            logger.debug('Not retrying status code %d, the retry budget is exhausted', status_code)
+            return False
+        return True
+
+    def increment(  # pylint: disable=too-many-arguments
+        self, method=None, url=None, response=None, error=None, _pool=None, _stacktrace=None
+    ) -> 'Retry':
+        new_retry = super().increment(method, url, response, error, _pool, _stacktrace)
+        if response is not None and response.get_redirect_location():
+            # Redirects are not retries.
+            return new_retry
+        backoff = self.next_backoff(len(new_retry.history))
+        deadline = get_deadline()
+        if deadline is not None:
+            retry_after = self.get_retry_after(response) if response is not None else None
+            if max(backoff, retry_after or 0) >= deadline.remaining():
+                logger.debug('Not retrying, the deadline would be exceeded')
+                if response is not None:
+                    # Like urllib3 does before raising MaxRetryError, so the connection can be reused.
+                    response.drain_conn()
+                raise DeadlineExceededException(deadline.total_timeout) from error
+        if not self.acquire_retry():
+            raise MaxRetryError(_pool, url, error or ResponseError('the retry budget is exhausted'))
+        return new_retry.new(backoff_value=backoff)
+
+    def get_backoff_time(self) -> float:
+        return self.backoff_value
+
+    def sleep(self, response=None) -> None:
+        start = time.monotonic()
+        try:
+            super().sleep(response)
+            # Each retry waits for the rate limiter of the service, like the first attempt.
+            acquire_for_retry(response)
+        finally:
+            # The circuit breaker only times the HTTP exchanges.
+            record_wait(time.monotonic() - start)
+
+    def next_backoff(self, attempt: int) -> float:
+        """Returns the wait before the retry number `attempt`, starting at 1."""
+        return compute_backoff(
+            self.backoff_strategy, attempt, self.backoff_factor, self.backoff_max, previous=self.backoff_value
+        )
+
+    def acquire_retry(self) -> bool:
+        """Take a retry from the retry budget, if there is one.
+
+        Returns:
+            True if the retry can be sent, false if the budget is exhausted.
+        """
+        if self.retry_budget is None or self.retry_budget.try_acquire():
+            return True
+        logger.debug('Not retrying, the retry budget is exhausted')
+        return False
@@ -0,0 +1,139 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+from http.cookiejar import DefaultCookiePolicy
+from threading import Lock
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import DEFAULT_POOLBLOCK, DEFAULT_POOLSIZE, DEFAULT_RETRIES
+from urllib3.util.retry import Retry
+
+from .http_adapter import SSLHTTPAdapter
+from .logger import get_logger
+
+logger = get_logger()
+
+
+class SessionRegistry:
+    """Shares pooled, keep-alive `requests` sessions between clients that talk to the same host.
+
+    Each session is mounted with an SSLHTTPAdapter, so it uses the same SSL settings as the
+    service clients, and keeps its connections open between requests. Sessions are keyed by the
+    scheme and host of the url, the SSL verification mode, the retry policy and the pool settings,
+    so clients that reach the same endpoint the same way share one connection pool instead of
+    performing a new TCP and TLS handshake per request. Sessions are safe to use from many threads.
+
+    Shared sessions never store cookies, so cookies received by one client are not sent by another.
+    The process-wide registry, used by the token managers and by the services that enable a shared
+    transport (see BaseService.enable_shared_transport), is returned by SessionRegistry.get_default().
+    """
+
+    _default = None
+    _default_lock = Lock()
+
+    def __init__(self) -> None:
+        self._lock = Lock()
+        self._sessions = {}
+
+    @classmethod
+    def get_default(cls) -> 'SessionRegistry':
+        """Returns the process-wide registry, creating it on first use."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def get_session(
+        self,
+        url: str,
+        *,
+        disable_ssl_verification: bool = False,
+        max_retries: Optional[Retry] = None,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        pool_block: bool = DEFAULT_POOLBLOCK,
+    ) -> requests.Session:
+        """Returns the session shared by the clients that send requests to `url` with the given settings.
+
+        Args:
+            url: The url (or just the origin) of the requests that will be sent with the session.
+
+        Keyword Args:
+            disable_ssl_verification: A flag that indicates whether verification of
+                the server's SSL certificate should be disabled or not. Defaults to False.
+            max_retries: The retry policy of the session's adapter. Defaults to None (no retries).
+            pool_connections: The number of connection pools (one per host) to cache. Defaults to 10.
+            pool_maxsize: The maximum number of connections to keep in each pool. Defaults to 10.
+            pool_block: A flag that indicates whether requests should wait for a free connection
+                when a pool is full. Defaults to False.
+
+        Returns:
+            A requests.Session instance.
+        """
+        parsed_url = urlparse(url or '')
+        key = (
+            parsed_url.scheme.lower(),
+            parsed_url.netloc.lower(),
+            bool(disable_ssl_verification),
+            _retry_key(max_retries),
+            pool_connections,
+            pool_maxsize,
+            bool(pool_block),
+        )
+        with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                session = self._create_session(
+                    disable_ssl_verification,
+                    max_retries=max_retries,
+                    pool_connections=pool_connections,
+                    pool_maxsize=pool_maxsize,
+                    pool_block=pool_block,
+                )
+                self._sessions[key] = session
+                logger.debug('Created shared HTTP session for %s://%s', key[0], key[1])
+            return session
+
+    def close(self) -> None:
+        """Close all the sessions of this registry and release their connections."""
+        with self._lock:
+            sessions = list(self._sessions.values())
+            self._sessions.clear()
+        for session in sessions:
+            session.close()
+
+    @staticmethod
+    def _create_session(disable_ssl_verification: bool, **adapter_kwargs) -> requests.Session:
+        session = requests.Session()
+        session.cookies.set_policy(DefaultCookiePolicy(allowed_domains=[]))
+        if adapter_kwargs.get('max_retries') is None:
+            adapter_kwargs['max_retries'] = DEFAULT_RETRIES
+        http_adapter = SSLHTTPAdapter(_disable_ssl_verification=disable_ssl_verification, **adapter_kwargs)
+        session.mount('http://', http_adapter)
+        session.mount('https://', http_adapter)
+        return session
+
+
+def _retry_key(retries: Optional[Retry]) -> Optional[tuple]:
+    """Returns a hashable key that is equal for retry policies with the same settings."""
+    if retries is None:
+        return None
+    return tuple(
+        (name, frozenset(value) if isinstance(value, (list, set, frozenset)) else value)
+        for name, value in sorted(vars(retries).items())
+    )
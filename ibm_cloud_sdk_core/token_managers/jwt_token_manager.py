@@ -18,10 +18,8 @@ from abc import ABC
 from typing import Optional
 
 import jwt
-import requests
 
 from .token_manager import TokenManager
-from ..api_exception import ApiException
 
 
 class JWTTokenManager(TokenManager, ABC):
@@ -76,16 +74,7 @@ class JWTTokenManager(TokenManager, ABC):
         self.refresh_time = self.expire_time - buffer
 
     def _request(self, method, url, *, headers=None, params=None, data=None, auth_tuple=None, **kwargs) -> dict:
-        kwargs = dict({"timeout": 60}, **kwargs)
-        kwargs = dict(kwargs, **self.http_config)
-
-        if self.disable_ssl_verification:
-            kwargs['verify'] = False
-
-        response = requests.request(
-            method=method, url=url, headers=headers, params=params, data=data, auth=auth_tuple, **kwargs
+        response = super()._request(
+            method, url, headers=headers, params=params, data=data, auth_tuple=auth_tuple, **kwargs
         )
-        if 200 <= response.status_code <= 299:
-            return response.json()
-
-        raise ApiException(response.status_code, http_response=response)
+        return response.json()
@@ -15,14 +15,19 @@
 # limitations under the License.
 
 
+import asyncio
 import time
 from abc import ABC, abstractmethod
-from threading import Lock
+from threading import Condition, Lock
+from typing import Optional
 
 import requests
 
 from ibm_cloud_sdk_core.logger import get_logger
 from ..api_exception import ApiException
+from ..deadline import DeadlineExceededException, get_deadline, use_deadline
+from ..session_registry import SessionRegistry
+from .token_refresh_scheduler import TokenRefreshScheduler
 
 logger = get_logger()
 
@@ -50,11 +55,21 @@ class TokenManager(ABC):
         refresh_time (int): The time in epoch seconds when the current stored token should be refreshed.
         request_time (int): The time the last outstanding token request was issued
         lock (Lock): Lock variable to serialize access to refresh/request times
+        token_request_done (Condition): Notified (with `lock` held) when the active token request completes
         http_config (dict): A dictionary containing values that control the timeout, proxies, and etc of HTTP requests.
+        http_client (Session): The session used to send token requests. Defaults to None, in which case
+            the session shared by all token managers that send requests to the same host is used.
         access_token (str): The latest stored access token
         user_agent (str): The User-Agent header value to be included in each outbound token request
     """
 
+    # The minimum time (in seconds) between two background token refresh checks.
+    BACKGROUND_REFRESH_MIN_INTERVAL = 1
+    # The time (in seconds) to wait before retrying a failed background token refresh.
+    BACKGROUND_REFRESH_RETRY_INTERVAL = 10
+    # The minimum time (in seconds) between two invalidations of the stored token (see invalidate_token).
+    TOKEN_INVALIDATION_MIN_INTERVAL = 10
+
     def __init__(self, url: str, *, disable_ssl_verification: bool = False):
         self.url = url
         self.disable_ssl_verification = disable_ssl_verification
@@ -62,9 +77,17 @@ class TokenManager(ABC):
         self.refresh_time = 0
         self.request_time = 0
         self.lock = Lock()
+        self.token_request_done = Condition(self.lock)
+        self._token_request_count = 0
+        self._token_request_error = None
         self.http_config = {}
+        self.http_client = None
         self.access_token = None
         self.user_agent = None
+        self._async_token_task = None
+        self._refresh_scheduler = None
+        self._invalidated_token = None
+        self._invalidated_at = 0.0
 
     def get_token(self) -> str:
         """Get a token to be used for authentication.
@@ -74,6 +97,12 @@ class TokenManager(ABC):
             b) If the current token should be refreshed, issue a refresh request
         2. After any requests initiated above complete, return the stored token
 
+        When the call has a deadline (see deadline_scope), the token request and the wait
+        for a token request made by another thread are bounded by the time left.
+
+        If background refresh is enabled (see enable_background_refresh), step 1.b is
+        skipped because the token is refreshed by the background thread instead.
+
         Returns:
             str: A valid access token
         """
@@ -81,7 +110,9 @@ class TokenManager(ABC):
             logger.debug('Performing synchronous token fetch')
             self.paced_request_token()
 
-        if self._token_needs_refresh():
+        if self.is_background_refresh_enabled():
+            logger.debug('Using cached access token')
+        elif self._token_needs_refresh():
             logger.debug('Performing background asynchronous token fetch')
             token_response = self.request_token()
             self._save_token_info(token_response)
@@ -90,6 +121,142 @@ class TokenManager(ABC):
 
         return self.access_token
 
+    async def async_get_token(self) -> str:
+        """Get a token to be used for authentication, without blocking the event loop.
+
+        This is the asynchronous counterpart of get_token():
+        1. If the current token is expired (or never fetched), wait for a new one
+        2. If the current token should be refreshed, start a refresh in the background
+           and return the current (still valid) token
+
+        Concurrent callers share a single in-flight token request instead of
+        issuing their own, and an error raised by that request is raised to each of them.
+
+        Returns:
+            str: A valid access token
+        """
+        if self._is_token_expired():
+            logger.debug('Performing asynchronous token fetch')
+            # Shield the shared request so that a cancelled caller doesn't cancel it for the others.
+            token_request = asyncio.shield(self._get_async_token_task())
+            deadline = get_deadline()
+            if deadline is None:
+                await token_request
+            else:
+                try:
+                    await asyncio.wait_for(token_request, deadline.cap(None))
+                except asyncio.TimeoutError as err:
+                    raise DeadlineExceededException(deadline.total_timeout) from err
+        elif not self.is_background_refresh_enabled() and self._token_needs_refresh():
+            logger.debug('Performing background asynchronous token fetch')
+            self._get_async_token_task()
+        else:
+            logger.debug('Using cached access token')
+
+        return self.access_token
+
+    def invalidate_token(self, token: str) -> bool:
+        """Discard the stored token after a service rejected it, so that the next get_token() fetches a new one.
+
+        The new token is fetched by a single request shared by all the threads (or tasks) that need it.
+        The token is not invalidated if it is no longer the stored one, for example because another
+        thread invalidated it already, and a token is invalidated at most once every
+        TOKEN_INVALIDATION_MIN_INTERVAL seconds, so that a service that rejects every token
+        doesn't cause a flood of token requests.
+
+        Args:
+            token: The token rejected by the service.
+
+        Returns:
+            True if the stored token is no longer `token` or is being replaced,
+            false if it was not invalidated because the previous invalidation is too recent.
+        """
+        with self.lock:
+            if token != self.access_token or token == self._invalidated_token:
+                return True
+            now = time.monotonic()
+            recently_invalidated = now - self._invalidated_at < self.TOKEN_INVALIDATION_MIN_INTERVAL
+            if self._invalidated_token is not None and recently_invalidated:
+                logger.debug('Not invalidating the access token, the previous one was invalidated recently')
+                return False
+            logger.debug('Invalidating the access token')
+            self._invalidated_token = token
+            self._invalidated_at = now
+            self.expire_time = 0
+            self.refresh_time = 0
+            return True
+
+    def _get_async_token_task(self) -> asyncio.Task:
+        """Return the in-flight token request task, starting a new one if there is none."""
+        loop = asyncio.get_running_loop()
+        task = self._async_token_task
+        if task is None or task.done() or task.get_loop() is not loop:
+            task = loop.create_task(self._async_request_token())
+            task.add_done_callback(self._log_async_token_error)
+            self._async_token_task = task
+        return task
+
+    async def _async_request_token(self) -> None:
+        # request_token() uses blocking I/O, so it runs in the default executor.
+        # The request is shared by all the callers, so it is not bounded by the deadline of the first one.
+        with use_deadline(None):
+            token_response = await asyncio.to_thread(self.request_token)
+        self._save_token_info(token_response)
+
+    @staticmethod
+    def _log_async_token_error(task: asyncio.Task) -> None:
+        # Retrieve the error so that background refresh failures are logged and not reported as
+        # "never retrieved"; callers waiting on the task receive the error themselves.
+        if not task.cancelled() and task.exception() is not None:
+            logger.debug('Asynchronous token fetch failed: %s', task.exception())
+
+    def enable_background_refresh(self, scheduler: Optional[TokenRefreshScheduler] = None) -> None:
+        """Refresh the token in the background.
+
+        A token is fetched right away and then refreshed when its refresh time is reached,
+        so that get_token() only has to return the cached token instead of refreshing it on
+        the calling thread. Failed refreshes are logged and retried. The refreshes are performed
+        by a TokenRefreshScheduler, which serves many token managers from a few daemon threads.
+
+        Args:
+            scheduler: The scheduler that refreshes the token. Defaults to the process-wide
+                scheduler returned by TokenRefreshScheduler.get_default().
+        """
+        with self.lock:
+            if self._refresh_scheduler is not None:
+                return
+            self._refresh_scheduler = scheduler or TokenRefreshScheduler.get_default()
+        self._refresh_scheduler.register(self)
+        logger.debug('Enabled background token refresh')
+
+    def disable_background_refresh(self) -> None:
+        """Stop the background token refresh started by enable_background_refresh()."""
+        with self.lock:
+            scheduler = self._refresh_scheduler
+            self._refresh_scheduler = None
+        if scheduler is not None:
+            scheduler.unregister(self)
+            logger.debug('Disabled background token refresh')
+
+    def is_background_refresh_enabled(self) -> bool:
+        """Returns true if the token is refreshed in the background, false otherwise."""
+        return self._refresh_scheduler is not None
+
+    def _background_refresh(self) -> float:
+        """Fetch a new token if the current one is expired or should be refreshed.
+
+        Returns:
+            float: the time in epoch seconds when this method should be called again
+        """
+        if self._is_token_expired():
+            logger.debug('Performing background token fetch')
+            self.paced_request_token()
+        elif self._token_needs_refresh():
+            logger.debug('Performing background token refresh')
+            token_response = self.request_token()
+            self._save_token_info(token_response)
+        return self.refresh_time
+
     def set_disable_ssl_verification(self, status: bool = False) -> None:
         """Sets the ssl verification to enabled or disabled.
 
@@ -104,6 +271,34 @@ class TokenManager(ABC):
         else:
             raise TypeError('status must be a bool')
 
+    def get_http_client(self) -> requests.Session:
+        """Get the session used to send token requests to `url`.
+
+        Returns:
+            The session set with set_http_client(), or the pooled session shared by the
+            token managers that send requests to the same host.
+        """
+        return self._get_http_client(self.url)
+
+    def set_http_client(self, http_client: Optional[requests.Session]) -> None:
+        """Set the session used to send token requests.
+
+        Args:
+            http_client: The session to use, or None to use the pooled session
+                shared by the token managers that send requests to the same host.
+
+        Raises:
+            TypeError: The `http_client` is not a requests.Session.
+        """
+        if http_client is not None and not isinstance(http_client, requests.Session):
+            raise TypeError('http_client must be a requests.Session')
+        self.http_client = http_client
+
+    def _get_http_client(self, url: str) -> requests.Session:
+        if self.http_client is not None:
+            return self.http_client
+        return SessionRegistry.get_default().get_session(url, disable_ssl_verification=self.disable_ssl_verification)
+
     def _set_user_agent(self, user_agent: str = None) -> None:
         self.user_agent = user_agent
 
@@ -114,37 +309,57 @@ class TokenManager(ABC):
         """
         Paces requests to request_token.
 
-        This method pseudo-serializes requests for an access_token
+        This method serializes requests for an access_token
         when the current token is expired (or has never been fetched).
         The first caller into this method records its `request_time` and
         then issues the token request. Subsequent callers will check the
         `request_time` to see if a request is active (has been issued within
-        the past 60 seconds), and if so will sleep for a short time interval
-        (currently 0.5 seconds) before checking again. The check for an active
-        request and update of `request_time` are serailized by the `lock`
+        the past 60 seconds), and if so will wait on the `token_request_done`
+        condition until that request completes. The check for an active
+        request and update of `request_time` are serialized by the `lock`
         variable so that only one caller can become the active requester
         with a 60 second interval.
 
-        Threads that sleep waiting for the active request to complete will
-        eventually find a newly valid token and return, or 60 seconds will
-        elapse and a new thread will assume the role of the active request.
+        Waiting threads are woken up as soon as the active request has stored
+        the new token. If the active request fails, its error is raised in the
+        waiting threads as well. If 60 seconds elapse without the active request
+        completing, a new thread will assume the role of the active request.
         """
         while self._is_token_expired():
-            current_time = self._get_current_time()
-
             with self.lock:
+                current_time = self._get_current_time()
                 request_active = self.request_time > (current_time - 60)
-                if not request_active:
-                    self.request_time = current_time
-
-            if not request_active:
+                if request_active:
+                    request_count = self._token_request_count
+                    wait_time = self.request_time + 60 - current_time
+                    deadline = get_deadline()
+                    if deadline is not None:
+                        wait_time = deadline.cap(wait_time)
+                    self.token_request_done.wait_for(
+                        lambda: self._token_request_count != request_count,
+                        timeout=wait_time,
+                    )
+                    if self._token_request_count != request_count and self._token_request_error is not None:
+                        raise self._token_request_error
+                    continue
+                self.request_time = current_time
+
+            try:
                 token_response = self.request_token()
                 self._save_token_info(token_response)
-                self.request_time = 0
-                return
-
-            # Sleep for 0.5 seconds before checking token again
-            time.sleep(0.5)
+            except Exception as err:
+                self._finish_token_request(err)
+                raise
+            self._finish_token_request(None)
+            return
+
+    def _finish_token_request(self, error: Optional[Exception]) -> None:
+        """Record the outcome of the active token request and wake up the threads waiting for it."""
+        with self.lock:
+            self.request_time = 0
+            self._token_request_error = error
+            self._token_request_count += 1
+            self.token_request_done.notify_all()
 
     @abstractmethod  # pragma: no cover
     def request_token(self) -> None:
@@ -207,9 +422,18 @@ class TokenManager(ABC):
         if self.disable_ssl_verification:
             kwargs['verify'] = False
 
-        response = requests.request(
-            method=method, url=url, headers=headers, params=params, data=data, auth=auth_tuple, **kwargs
-        )
+        deadline = get_deadline()
+        if deadline is not None:
+            kwargs['timeout'] = deadline.cap_timeout(kwargs['timeout'])
+
+        try:
+            response = self._get_http_client(url).request(
+                method=method, url=url, headers=headers, params=params, data=data, auth=auth_tuple, **kwargs
+            )
+        except (requests.exceptions.Timeout, requests.exceptions.ConnectionError) as err:
+            if deadline is not None and deadline.expired():
+                raise DeadlineExceededException(deadline.total_timeout) from err
+            raise
         if 200 <= response.status_code <= 299:
             return response
 
@@ -0,0 +1,210 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import heapq
+import itertools
+import queue
+import time
+import weakref
+from threading import Condition, Lock, Thread
+
+from ibm_cloud_sdk_core.logger import get_logger
+
+logger = get_logger()
+
+
+# pylint: disable=too-many-instance-attributes
+class TokenRefreshScheduler:
+    """Refreshes the tokens of many token managers from a single scheduler thread.
+
+    The scheduler keeps a heap of the next refresh time of each registered token manager.
+    A single scheduler thread waits for the earliest one and hands the due refreshes to a
+    small, bounded pool of worker threads, so the number of threads doesn't grow with the
+    number of token managers. All threads are daemon threads and are started on first use.
+
+    Token managers are registered with TokenManager.enable_background_refresh(), which uses the
+    process-wide scheduler returned by TokenRefreshScheduler.get_default() unless another one is given.
+    The scheduler only holds weak references to the token managers.
+
+    Keyword Args:
+        max_workers: The maximum number of token refreshes that run at the same time. Defaults to 4.
+    """
+
+    _default = None
+    _default_lock = Lock()
+
+    def __init__(self, *, max_workers: int = 4) -> None:
+        if max_workers < 1:
+            raise ValueError('max_workers must be at least 1')
+        self.max_workers = max_workers
+        self._lock = Lock()
+        self._wakeup = Condition(self._lock)
+        self._heap = []
+        self._sequence = itertools.count()
+        # Maps each registered token manager to its registration number, which is used
+        # to discard the heap entries of token managers that have been unregistered.
+        self._registrations = weakref.WeakKeyDictionary()
+        self._due = queue.SimpleQueue()
+        self._threads = []
+        self._shutdown = False
+        self._pending = 0
+        self._in_flight = 0
+        self._refresh_count = 0
+        self._failure_count = 0
+        self._last_refresh_lag = 0.0
+        self._max_refresh_lag = 0.0
+
+    @classmethod
+    def get_default(cls) -> 'TokenRefreshScheduler':
+        """Returns the process-wide scheduler, creating it on first use."""
+        with cls._default_lock:
+            if cls._default is None:
+                cls._default = cls()
+            return cls._default
+
+    def register(self, token_manager: 'TokenManager') -> None:
+        """Refresh the token of `token_manager` in the background, starting right away.
+
+        Args:
+            token_manager: The token manager to refresh.
+        """
+        with self._lock:
+            if self._shutdown:
+                raise RuntimeError('The token refresh scheduler has been shut down')
+            if token_manager in self._registrations:
+                return
+            registration = next(self._sequence)
+            self._registrations[token_manager] = registration
+            self._push(time.time(), token_manager, registration)
+            self._start_threads()
+
+    def unregister(self, token_manager: 'TokenManager') -> None:
+        """Stop refreshing the token of `token_manager`.
+
+        Args:
+            token_manager: The token manager to stop refreshing.
+        """
+        with self._lock:
+            self._registrations.pop(token_manager, None)
+
+    def is_registered(self, token_manager: 'TokenManager') -> bool:
+        """Returns true if `token_manager` is refreshed by this scheduler, false otherwise."""
+        with self._lock:
+            return token_manager in self._registrations
+
+    def get_stats(self) -> dict:
+        """Returns a snapshot of the scheduler's state.
+
+        Returns:
+            A dictionary with the following keys:
+            registered: the number of registered token managers
+            scheduled: the number of refreshes waiting for their refresh time
+            queue_depth: the number of refreshes that are due but wait for a free worker
+            in_flight: the number of refreshes in progress
+            refresh_count: the number of refreshes performed so far
+            failure_count: the number of refreshes that failed so far
+            last_refresh_lag: the delay (in seconds) between the refresh time and the start of the last refresh
+            max_refresh_lag: the largest such delay observed so far
+        """
+        with self._lock:
+            return {
+                'registered': len(self._registrations),
+                'scheduled': len(self._heap),
+                'queue_depth': self._pending,
+                'in_flight': self._in_flight,
+                'refresh_count': self._refresh_count,
+                'failure_count': self._failure_count,
+                'last_refresh_lag': self._last_refresh_lag,
+                'max_refresh_lag': self._max_refresh_lag,
+            }
+
+    def shutdown(self) -> None:
+        """Stop the scheduler threads. Refreshes that are in progress are allowed to complete."""
+        with self._lock:
+            self._shutdown = True
+            self._registrations.clear()
+            self._heap.clear()
+            self._wakeup.notify_all()
+        for _ in self._threads:
+            self._due.put(None)
+
+    def _push(self, refresh_time: float, token_manager: 'TokenManager', registration: int) -> None:
+        # Must be called with the lock held.
+        heapq.heappush(self._heap, (refresh_time, next(self._sequence), weakref.ref(token_manager), registration))
+        self._wakeup.notify()
+
+    def _start_threads(self) -> None:
+        # Must be called with the lock held.
+        if self._threads:
+            return
+        self._threads.append(Thread(target=self._schedule, name='ibm-cloud-sdk-core-token-scheduler', daemon=True))
+        for i in range(self.max_workers):
+            self._threads.append(
+                Thread(target=self._work, name='ibm-cloud-sdk-core-token-refresh-{0}'.format(i), daemon=True)
+            )
+        for thread in self._threads:
+            thread.start()
+
+    def _is_current(self, token_manager_ref: weakref.ref, registration: int) -> bool:
+        # Must be called with the lock held.
+        token_manager = token_manager_ref()
+        return token_manager is not None and self._registrations.get(token_manager) == registration
+
+    def _schedule(self) -> None:
+        """Wait for the earliest refresh time and hand the due refreshes to the workers."""
+        with self._lock:
+            while not self._shutdown:
+                if self._heap and not self._is_current(self._heap[0][2], self._heap[0][3]):
+                    heapq.heappop(self._heap)
+                elif not self._heap:
+                    self._wakeup.wait()
+                elif self._heap[0][0] > time.time():
+                    self._wakeup.wait(self._heap[0][0] - time.time())
+                else:
+                    self._pending += 1
+                    self._due.put(heapq.heappop(self._heap))
+
+    def _work(self) -> None:
+        """Perform the due refreshes."""
+        while True:
+            entry = self._due.get()
+            if entry is None:
+                return
+            refresh_time, _, token_manager_ref, registration = entry
+            with self._lock:
+                self._pending -= 1
+                # Keep a strong reference, so that the token manager can't be collected during the refresh.
+                token_manager = token_manager_ref()
+                if token_manager is None or self._registrations.get(token_manager) != registration:
+                    continue
+                self._in_flight += 1
+                self._last_refresh_lag = max(time.time() - refresh_time, 0.0)
+                self._max_refresh_lag = max(self._max_refresh_lag, self._last_refresh_lag)
+            failed = False
+            try:
+                next_refresh_time = token_manager._background_refresh()  # pylint: disable=protected-access
+            except Exception as err:  # pylint: disable=broad-exception-caught
+                logger.warning('Background token refresh failed: %s', err)
+                failed = True
+                next_refresh_time = time.time() + token_manager.BACKGROUND_REFRESH_RETRY_INTERVAL
+            next_refresh_time = max(next_refresh_time, time.time() + token_manager.BACKGROUND_REFRESH_MIN_INTERVAL)
+            with self._lock:
+                self._in_flight -= 1
+                self._refresh_count += 1
+                self._failure_count += failed
+                if self._is_current(token_manager_ref, registration) and not self._shutdown:
+                    self._push(next_refresh_time, token_manager, registration)
+            del token_manager
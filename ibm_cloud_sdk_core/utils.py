@@ -15,13 +15,15 @@
 # limitations under the License.
 # from ibm_cloud_sdk_core.authenticators import Authenticator
 import datetime
-import gzip
 import io
 import json as json_import
 import re
+import struct
+import time
+import zlib
 from os import getenv, environ, getcwd
 from os.path import isfile, join, expanduser
-from typing import List, Union
+from typing import Any, List, Union
 from urllib.parse import urlparse, parse_qs
 
 import dateutil.parser as date_parser
@@ -30,24 +32,30 @@ from .logger import get_logger
 logger = get_logger()
 
 
-class GzipStream(io.RawIOBase):
+class CompressedStream(io.RawIOBase):
     """Compress files on the fly.
 
-    GzipStream is a helper class around the gzip library. It helps to
-    compress already opened files (file-like objects) on the fly, so
-    there is no need to read everything into the memory and call the
-    `compress` function on it.
-    The GzipFile is opened on the instance itself so it needs to act
-    as a file-like object.
+    CompressedStream reads the source in fixed-size chunks and compresses them as the
+    target stream reads the compressed data, so there is no need to read everything
+    into the memory and call the `compress` function on it. Only the compressed output
+    of the current chunk is buffered, so the memory use doesn't depend on the size of
+    the source, and binary sources are read in chunks rather than line by line.
 
     Args:
-        input: the source of the data to be compressed.
+        source: the source of the data to be compressed.
                It can be a file-like object, bytes or string.
+        compressor: an incremental compressor, like the ones returned by zlib.compressobj():
+            its `compress(data)` method returns the compressed data that is ready so far,
+            and its `flush()` method returns the rest once the whole source has been compressed.
+
+    Keyword Args:
+        chunk_size: the number of bytes (or characters, for text sources) read from the source at once.
     """
 
-    def __init__(self, source: Union[io.IOBase, bytes, str]):
-        self.buffer = b''
+    CHUNK_SIZE = 64 * 1024
 
+    def __init__(self, source: Union[io.IOBase, bytes, str], compressor: Any, *, chunk_size: int = CHUNK_SIZE):
+        super().__init__()
         if isinstance(source, io.IOBase):
             # The input is already a file-like object, use it as-is.
             self.uncompressed = source
@@ -58,61 +66,132 @@ class GzipStream(io.RawIOBase):
             # Handle the rest as raw bytes.
             self.uncompressed = io.BytesIO(source)
 
-        self.compressor = gzip.GzipFile(fileobj=self, mode='wb')
+        self.chunk_size = chunk_size
+        self._compressor = compressor
+        self._buffer = bytearray()
+        self._offset = 0
+        self._eof = False
+
+    def readable(self) -> bool:
+        return True
 
     def read(self, size: int = -1) -> bytes:
-        """Compresses and returns the requested size of data.
+        """Compresses and returns up to `size` bytes of data.
+
+        Fewer than `size` bytes are returned if less compressed data is ready;
+        an empty result means that the whole source has been compressed and read.
 
         Args:
             size: how many bytes to return. -1 to read and compress the whole file
         """
-        compressed = b''
+        if size is None or size < 0:
+            return self.readall()
+        if not self._fill_buffer():
+            return b''
+        with memoryview(self._buffer) as buffer:
+            compressed = buffer[self._offset : self._offset + size].tobytes()
+        self._consume(len(compressed))
+        return compressed
+
+    def readinto(self, b) -> int:
+        """Compresses data into the pre-allocated, writable bytes-like object `b`.
 
-        if (size < 0) or (len(self.buffer) < size):
-            for raw in self.uncompressed:
+        Returns:
+            The number of bytes written into `b`, 0 if the whole source has been compressed and read.
+        """
+        if not self._fill_buffer():
+            return 0
+        with memoryview(b).cast('B') as target, memoryview(self._buffer) as buffer:
+            size = min(len(target), len(buffer) - self._offset)
+            target[:size] = buffer[self._offset : self._offset + size]
+        self._consume(size)
+        return size
+
+    def _fill_buffer(self) -> bool:
+        """Compress chunks of the source until there is compressed data to return.
+
+        Returns:
+            False if the whole source has been compressed and read, True otherwise.
+        """
+        while self._offset == len(self._buffer):
+            self._buffer.clear()
+            self._offset = 0
+            if self._eof:
+                return False
+            raw = self.uncompressed.read(self.chunk_size)
+            if raw:
                 # We need to encode text like streams (e.g. TextIOWrapper) to bytes.
                 if isinstance(raw, str):
                     raw = raw.encode()
+                self._buffer += self._compressor.compress(raw)
+            else:
+                self._buffer += self._compressor.flush()
+                self._eof = True
+        return True
 
-                self.compressor.write(raw)
+    def _consume(self, size: int) -> None:
+        self._offset += size
+        if self._offset == len(self._buffer):
+            self._buffer.clear()
+            self._offset = 0
 
-                # Stop compressing if we reached the max allowed size.
-                if 0 < size < len(self.buffer):
-                    self.compressor.flush()
-                    break
-            else:
-                self.compressor.close()
+    def close(self) -> None:
+        """Closes the underlying file-like object."""
+        self.uncompressed.close()
+        super().close()
 
-            if size < 0:
-                # Return all data from the buffer.
-                compressed = self.buffer
-                self.buffer = b''
-        else:
-            # If we already have enough data in our buffer
-            # return the desired chunk of bytes
-            compressed = self.buffer[:size]
-            # then remove them from the buffer.
-            self.buffer = self.buffer[size:]
 
-        return compressed
+class GzipCompressor:
+    """An incremental compressor that produces the same gzip format as the gzip package.
 
-    def flush(self) -> None:
-        """Not implemented."""
-        # Since this "pipe" sits between 2 other stream (source/read -> target/write)
-        # it wouldn't be worth to implemet flushing.
-        pass
+    zlib only produces the raw deflate stream; the gzip header and trailer are added here.
 
-    def write(self, compressed: bytes) -> None:
-        """Append the compressed data to the buffer
+    Args:
+        compresslevel: the compression level, from 0 (no compression) to 9 (best compression). Defaults to 9.
+    """
 
-        This happens when the target stream calls the `read` method and
-        that triggers the gzip "compressor".
-        """
-        self.buffer += compressed
+    def __init__(self, compresslevel: int = 9) -> None:
+        self._compressor = zlib.compressobj(compresslevel, zlib.DEFLATED, -zlib.MAX_WBITS)
+        self._crc = 0
+        self._size = 0
+        xfl = 2 if compresslevel == 9 else 4 if compresslevel == 1 else 0
+        self._header = struct.pack('<BBBBLBB', 0x1F, 0x8B, 8, 0, int(time.time()), xfl, 255)
 
-    def close(self) -> None:
-        """Closes the underlying file-like object."""
-        self.uncompressed.close()
+    def compress(self, data: bytes) -> bytes:
+        """Compress `data` and return the compressed data that is ready so far."""
+        self._crc = zlib.crc32(data, self._crc)
+        self._size += len(data)
+        return self._pop_header() + self._compressor.compress(data)
+
+    def flush(self) -> bytes:
+        """Return the rest of the compressed data, followed by the gzip trailer."""
+        return self._pop_header() + self._compressor.flush() + struct.pack('<LL', self._crc, self._size & 0xFFFFFFFF)
+
+    def _pop_header(self) -> bytes:
+        header, self._header = self._header, b''
+        return header
+
+
+class GzipStream(CompressedStream):
+    """Compress files on the fly into gzip format.
+
+    Args:
+        source: the source of the data to be compressed.
+               It can be a file-like object, bytes or string.
+
+    Keyword Args:
+        chunk_size: the number of bytes (or characters, for text sources) read from the source at once.
+        compresslevel: the compression level, from 0 (no compression) to 9 (best compression). Defaults to 9.
+    """
+
+    def __init__(
+        self,
+        source: Union[io.IOBase, bytes, str],
+        *,
+        chunk_size: int = CompressedStream.CHUNK_SIZE,
+        compresslevel: int = 9,
+    ):
+        super().__init__(source, GzipCompressor(compresslevel), chunk_size=chunk_size)
 
 
 def has_bad_first_or_last_char(val: str) -> bool:
@@ -497,3 +576,19 @@ def is_json_mimetype(mimetype: str) -> bool:
         true if mimetype is a JSON-line mimetype, false otherwise.
     """
     return mimetype is not None and json_mimetype_pattern.match(mimetype) is not None
+
+
+# A regex that matches a JSON lines (newline-delimited JSON) mimetype.
+json_lines_mimetype_pattern = re.compile('^application/(x-ndjson|jsonl|x-jsonlines|jsonlines)(\\s*;.*)?$')
+
+
+def is_json_lines_mimetype(mimetype: str) -> bool:
+    """Returns true if 'mimetype' is a JSON lines (NDJSON) mimetype, false otherwise.
+
+    Args:
+        mimetype: The mimetype to check.
+
+    Returns:
+        true if mimetype is a JSON lines mimetype, false otherwise.
+    """
+    return mimetype is not None and json_lines_mimetype_pattern.match(mimetype) is not None
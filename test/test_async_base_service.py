@@ -0,0 +1,418 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring,protected-access
+import asyncio
+import gzip
+import io
+import json
+import logging
+import time
+
+import httpx
+import pytest
+
+from ibm_cloud_sdk_core import (
+    ApiException,
+    AsyncBaseService,
+    CircuitBreaker,
+    CircuitBreakerOpenException,
+    DeadlineExceededException,
+    DetailedResponse,
+    JsonCodec,
+)
+from ibm_cloud_sdk_core.detailed_response import DEFAULT_CHUNK_SIZE
+from ibm_cloud_sdk_core.authenticators import BasicAuthenticator, NoAuthAuthenticator
+from .utils.logger_utils import setup_test_logger
+
+setup_test_logger(logging.WARNING)
+
+
+class AnyAsyncServiceV1(AsyncBaseService):
+    default_url = 'https://gateway.watsonplatform.net/test/api'
+
+    def __init__(self, version: str, authenticator=None) -> None:
+        AsyncBaseService.__init__(self, service_url=self.default_url, authenticator=authenticator)
+        self.version = version
+
+    async def get_document(self, document_id: str, **kwargs) -> DetailedResponse:
+        url = '/v1/documents/{0}'.format(*self.encode_path_vars(document_id))
+        request = await self.prepare_request(method='GET', url=url, params={'version': self.version})
+        return await self.send(request, **kwargs)
+
+    async def create_document(self, document: dict) -> DetailedResponse:
+        request = await self.prepare_request(method='POST', url='/v1/documents', data=document)
+        return await self.send(request)
+
+
+def mock_service(handler, authenticator=None) -> AnyAsyncServiceV1:
+    service = AnyAsyncServiceV1('2026-01-01', authenticator=authenticator or NoAuthAuthenticator())
+    service.set_async_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    return service
+
+
+def test_invalid_authenticator():
+    with pytest.raises(ValueError) as err:
+        AnyAsyncServiceV1('2026-01-01')
+    assert str(err.value) == 'authenticator must be provided'
+
+
+def test_request_success_json():
+    requests_seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        requests_seen.append(request)
+        return httpx.Response(200, json={'id': 'doc 1'})
+
+    service = mock_service(handler, BasicAuthenticator('user', 'pass'))
+    response = asyncio.run(service.get_document('doc 1'))
+
+    assert isinstance(response, DetailedResponse)
+    assert response.get_status_code() == 200
+    assert response.get_result() == {'id': 'doc 1'}
+    assert len(requests_seen) == 1
+    assert requests_seen[0].url.raw_path.startswith(b'/test/api/v1/documents/doc%201?')
+    assert requests_seen[0].url.params['version'] == '2026-01-01'
+    assert requests_seen[0].headers['Authorization'].startswith('Basic ')
+    assert requests_seen[0].headers['User-Agent'].startswith('ibm-python-sdk-core-')
+
+
+def test_request_body_json_and_gzip():
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append((request.headers.get('content-encoding'), request.content))
+        return httpx.Response(201, json={})
+
+    service = mock_service(handler)
+    asyncio.run(service.create_document({'name': 'foo', 'missing': None}))
+    service.set_enable_gzip_compression(True)
+    asyncio.run(service.create_document({'name': 'foo'}))
+
+    assert bodies[0][0] is None
+    assert json.loads(bodies[0][1]) == {'name': 'foo'}
+    assert bodies[1][0] == 'gzip'
+    assert json.loads(gzip.decompress(bodies[1][1])) == {'name': 'foo'}
+
+
+class RecordingStream(io.BytesIO):
+    def __init__(self, data: bytes) -> None:
+        super().__init__(data)
+        self.reads = []
+
+    def read(self, size=-1) -> bytes:
+        self.reads.append(size)
+        return super().read(size)
+
+
+def test_request_body_stream():
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        bodies.append(request.read())
+        return httpx.Response(201, json={})
+
+    async def upload(service, data):
+        request = await service.prepare_request(method='POST', url='/v1/documents', data=data)
+        return await service.send(request)
+
+    service = mock_service(handler)
+    data = bytes(range(256)) * 1024
+    stream = RecordingStream(data)
+    asyncio.run(upload(service, stream))
+    asyncio.run(upload(service, io.StringIO('line 1\nline 2\n')))
+
+    # The stream is read in fixed-size chunks, whatever its lines.
+    assert stream.reads == [DEFAULT_CHUNK_SIZE] * 5
+    assert bodies == [data, b'line 1\nline 2\n']
+
+
+def test_request_no_body_and_non_json():
+    responses = iter([httpx.Response(204), httpx.Response(200, text='plain text')])
+    service = mock_service(lambda request: next(responses))
+
+    assert asyncio.run(service.get_document('a')).get_result() is None
+    result = asyncio.run(service.get_document('b')).get_result()
+    assert isinstance(result, httpx.Response)
+    assert result.text == 'plain text'
+
+
+def test_request_stream():
+    async def consume(service):
+        response = await service.get_document('a', stream=True)
+        result = response.get_result()
+        body = b''.join([chunk async for chunk in result.aiter_bytes()])
+        await result.aclose()
+        return body
+
+    service = mock_service(lambda request: httpx.Response(200, json={'foo': 'bar'}))
+    assert json.loads(asyncio.run(consume(service))) == {'foo': 'bar'}
+
+
+def test_request_stream_lines():
+    body = gzip.compress(b'{"a": 1}\n{"b": 2}\n')
+
+    async def consume(service):
+        async with await service.get_document('a', stream=True) as response:
+            return [json.loads(line) async for line in response.aiter_lines(4, decode_unicode=True)]
+
+    service = mock_service(lambda request: httpx.Response(200, content=body, headers={'Content-Encoding': 'gzip'}))
+    assert asyncio.run(consume(service)) == [{'a': 1}, {'b': 2}]
+
+
+def test_request_stream_records():
+    async def consume(service):
+        async with await service.get_document('a', stream=True) as response:
+            return [record async for record in response.aiter_records(3)]
+
+    service = mock_service(lambda request: httpx.Response(200, json=[{'a': 1}, {'b': [2, 3]}]))
+    assert asyncio.run(consume(service)) == [{'a': 1}, {'b': [2, 3]}]
+
+
+def test_request_error():
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        return httpx.Response(
+            404, json={'errors': [{'message': 'not found'}]}, headers={'X-Global-Transaction-ID': 'xx'}
+        )
+
+    service = mock_service(handler)
+    with pytest.raises(ApiException) as err:
+        asyncio.run(service.get_document('a'))
+    assert err.value.status_code == 404
+    assert err.value.message == 'not found'
+    assert err.value.global_transaction_id == 'xx'
+
+
+def test_request_invalid_json():
+    service = mock_service(
+        lambda request: httpx.Response(200, content=b'{"foo": ', headers={'Content-Type': 'application/json'})
+    )
+    with pytest.raises(ApiException) as err:
+        asyncio.run(service.get_document('a'))
+    assert err.value.message == 'Error processing the HTTP response'
+
+
+def test_lazy_response_parsing():
+    service = mock_service(
+        lambda request: httpx.Response(200, content=b'{"foo": ', headers={'Content-Type': 'application/json'})
+    )
+    service.set_lazy_response_parsing()
+    service.set_json_codec(JsonCodec())
+    detailed_response = asyncio.run(service.get_document('a'))
+    assert detailed_response.get_status_code() == 200
+    assert detailed_response._json_codec is service.get_json_codec()  # pylint: disable=protected-access
+    # Printing the response doesn't parse the result, nor raise the parsing error.
+    assert detailed_response._to_dict()['result'] == 'HTTP response'  # pylint: disable=protected-access
+    with pytest.raises(ApiException) as err:
+        detailed_response.get_result()
+    assert err.value.message == 'Error processing the HTTP response'
+
+
+def test_send_many():
+    in_flight = [0, 0]
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        in_flight[0] += 1
+        in_flight[1] = max(in_flight)
+        index = int(request.url.params['i'])
+        await asyncio.sleep(0.02 * (10 - index))
+        in_flight[0] -= 1
+        if index == 3:
+            return httpx.Response(500, json={'error': 'failed'})
+        return httpx.Response(200, json={'i': index})
+
+    service = AnyAsyncServiceV1('2026-01-01', authenticator=NoAuthAuthenticator())
+    service.set_async_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async def requests_to_send():
+        for i in range(10):
+            yield await service.prepare_request('GET', url='', params={'i': i})
+
+    async def send_all(requests_to_send, **kwargs):
+        return [result async for result in service.send_many(requests_to_send, **kwargs)]
+
+    results = asyncio.run(send_all(requests_to_send(), max_in_flight=3))
+    assert [index for index, _ in results] == list(range(10))
+    assert isinstance(results[3][1], ApiException)
+    assert [result.get_result()['i'] for index, result in results if index != 3] == [0, 1, 2, 4, 5, 6, 7, 8, 9]
+    assert in_flight[1] == 3
+
+    async def prepare_all():
+        return [await service.prepare_request('GET', url='', params={'i': i}) for i in range(10)]
+
+    results = asyncio.run(send_all(asyncio.run(prepare_all()), ordered=False))
+    assert sorted(index for index, _ in results) == list(range(10))
+    assert results[0][0] == 9
+
+
+def test_rate_limiting_records_retried_responses():
+    statuses = iter([429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        status = next(statuses)
+        return httpx.Response(status, json={}, headers={'Retry-After': '0'} if status == 429 else {})
+
+    service = mock_service(handler)
+    service.enable_retries(max_retries=1, retry_interval=0.01)
+    service.enable_rate_limiting(100)
+    assert asyncio.run(service.get_document('a')).get_status_code() == 200
+    # Halved by the 429 response, then increased by a tenth of the rate by the 200 response.
+    assert service.get_rate_limiter().get_rate(service.service_url) == 60
+
+
+def test_circuit_breaker_stops_retries():
+    statuses = []
+
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        statuses.append(503)
+        return httpx.Response(503, json={})
+
+    service = mock_service(handler)
+    service.enable_retries(max_retries=4, retry_interval=0.01)
+    service.enable_circuit_breaker(window_size=2, minimum_calls=2)
+    with pytest.raises(CircuitBreakerOpenException):
+        asyncio.run(service.get_document('a'))
+    # The breaker opened after 2 attempts, the remaining retries were not sent.
+    assert len(statuses) == 2
+
+
+def test_circuit_breaker_ignores_rate_limiter_wait():
+    service = mock_service(lambda request: httpx.Response(200, json={}))
+    service.enable_rate_limiting(5, burst=1)
+    service.enable_circuit_breaker(slow_call_duration=0.1, window_size=2, minimum_calls=2)
+
+    async def send_all():
+        for _ in range(3):
+            await service.get_document('a')
+
+    start = time.monotonic()
+    asyncio.run(send_all())
+    # The requests waited 0.2 seconds for the rate limiter, but the exchanges weren't slow.
+    assert time.monotonic() - start >= 0.35
+    assert service.get_circuit_breaker().get_state(service.service_url) == CircuitBreaker.CLOSED
+
+
+def test_hedging_cancels_slow_request():
+    calls = []
+
+    async def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        calls.append(request)
+        if len(calls) == 1:
+            await asyncio.sleep(1)
+        return httpx.Response(200, json={'attempt': len(calls)})
+
+    service = mock_service(handler)
+    service.enable_hedging(0.02)
+    response = asyncio.run(service.get_document('a'))
+    assert response.get_result() == {'attempt': 2}
+    assert service.get_hedging_policy().get_stats()['hedge_wins'] == 1
+
+
+def test_total_timeout():
+    async def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        await asyncio.sleep(1)
+        return httpx.Response(200, json={})
+
+    service = mock_service(handler)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededException):
+        asyncio.run(service.get_document('a', total_timeout=0.05))
+    assert time.monotonic() - start < 0.5
+
+    statuses = []
+
+    def failing_handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        statuses.append(503)
+        return httpx.Response(503, json={}, headers={'Retry-After': '5'})
+
+    service = mock_service(failing_handler)
+    service.enable_retries(max_retries=4)
+    service.set_total_timeout(1)
+    with pytest.raises(DeadlineExceededException):
+        asyncio.run(service.get_document('a'))
+    # The retry would start after the deadline, so the call fails without waiting.
+    assert len(statuses) == 1
+
+    # The deadline starts in prepare_request(), so the time taken to authenticate counts.
+    async def prepare_slowly_and_send():
+        request = await service.prepare_request('GET', url='')
+        assert 'deadline' not in request
+        await asyncio.sleep(0.15)
+        return await service.send(request)
+
+    service.set_total_timeout(0.1)
+    with pytest.raises(DeadlineExceededException):
+        asyncio.run(prepare_slowly_and_send())
+    assert len(statuses) == 1
+
+
+def test_retries():
+    statuses = iter([503, 429, 200])
+
+    def handler(request: httpx.Request) -> httpx.Response:  # pylint: disable=unused-argument
+        status = next(statuses)
+        return httpx.Response(status, json={}, headers={'Retry-After': '0'} if status == 429 else {})
+
+    service = mock_service(handler)
+    service.enable_retries(max_retries=2, retry_interval=0.01)
+    assert asyncio.run(service.get_document('a')).get_status_code() == 200
+
+    statuses = iter([503, 503])
+    service.enable_retries(max_retries=1, retry_interval=0.01)
+    with pytest.raises(ApiException) as err:
+        asyncio.run(service.get_document('a'))
+    assert err.value.status_code == 503
+
+
+def test_concurrent_requests():
+    async def handler(request: httpx.Request) -> httpx.Response:
+        await asyncio.sleep(0.05)
+        return httpx.Response(200, json={'path': request.url.path})
+
+    async def run_all(service):
+        return await asyncio.gather(*(service.get_document(str(i)) for i in range(50)))
+
+    service = mock_service(handler)
+    responses = asyncio.run(run_all(service))
+    assert [r.get_result()['path'] for r in responses] == ['/test/api/v1/documents/{0}'.format(i) for i in range(50)]
+
+
+def test_http_client_lifecycle():
+    service = AnyAsyncServiceV1('2026-01-01', authenticator=NoAuthAuthenticator())
+    client = service.get_async_http_client()
+    assert isinstance(client, httpx.AsyncClient)
+    assert service.get_async_http_client() is client
+
+    # Changing the ssl or http config replaces the client on the next request.
+    service.set_disable_ssl_verification(True)
+    assert service.get_async_http_client() is not client
+    service.set_http_config({'timeout': 10})
+    assert len(service._retired_http_clients) == 2
+
+    asyncio.run(service.close())
+    assert client.is_closed
+    assert service.async_http_client is None
+
+    with pytest.raises(TypeError):
+        service.set_async_http_client('bad_argument_type')
+
+
+def test_connection_pool_config():
+    service = AnyAsyncServiceV1('2026-01-01', authenticator=NoAuthAuthenticator())
+    client = service.get_async_http_client()
+    service.set_connection_pool_config(pool_maxsize=64, pool_block=True)
+    assert service.get_async_http_client() is not client
+    asyncio.run(service.close())
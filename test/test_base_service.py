@@ -17,12 +17,15 @@
 # pylint: disable=missing-docstring,protected-access,too-few-public-methods,too-many-lines
 
 import gzip
+import io
 import json
 import logging
 import os
 import ssl
 import tempfile
+import threading
 import time
+import zlib
 from shutil import copyfile
 from typing import Optional
 from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
@@ -33,8 +36,9 @@ import responses
 import requests
 
 from ibm_cloud_sdk_core import ApiException
-from ibm_cloud_sdk_core import BaseService, DetailedResponse
-from ibm_cloud_sdk_core import CP4DTokenManager
+from ibm_cloud_sdk_core import BaseService, DetailedResponse, JsonCodec
+from ibm_cloud_sdk_core import CP4DTokenManager, SessionRegistry
+from ibm_cloud_sdk_core import CircuitBreaker, CircuitBreakerOpenException
 from ibm_cloud_sdk_core import get_authenticator_from_environment
 from ibm_cloud_sdk_core.authenticators import (
     IAMAuthenticator,
@@ -427,6 +431,95 @@ def test_request_success_invalid_json():
     assert "Expecting ':' delimiter: line 1" in str(err.value.__cause__)
 
 
+@responses.activate
+def test_lazy_response_parsing():
+    url = 'https://gateway.watsonplatform.net/test/api'
+    responses.add(responses.GET, url, status=200, body='{"foo": "bar"}', content_type='application/json')
+    responses.add(responses.GET, url, status=200, body='{"foo": ', content_type='application/json')
+    service = AnyServiceV1('2018-11-20', authenticator=NoAuthAuthenticator())
+    service.set_lazy_response_parsing()
+    parsed = []
+
+    class CountingCodec(JsonCodec):
+        def loads(self, data):
+            parsed.append(data)
+            return super().loads(data)
+
+    service.set_json_codec(CountingCodec())
+
+    detailed_response = service.send(service.prepare_request('GET', url=''))
+    assert detailed_response.get_status_code() == 200
+    assert detailed_response.get_headers()['Content-Type'] == 'application/json'
+    assert detailed_response._json_codec is service.get_json_codec()  # pylint: disable=protected-access
+    # Printing the response doesn't parse the result.
+    assert json.loads(str(detailed_response))['result'] == 'HTTP response'
+    assert not parsed
+    assert detailed_response.get_result() == {'foo': 'bar'}
+    assert detailed_response.result == {'foo': 'bar'}
+    assert parsed == [b'{"foo": "bar"}']
+    assert json.loads(str(detailed_response))['result'] == {'foo': 'bar'}
+
+    # The error is raised when the result is accessed.
+    detailed_response = service.send(service.prepare_request('GET', url=''))
+    assert json.loads(str(detailed_response))['status_code'] == 200
+    for _ in range(2):
+        with pytest.raises(ApiException, match=r'Error processing the HTTP response') as err:
+            detailed_response.get_result()
+        assert isinstance(err.value.__cause__, requests.exceptions.JSONDecodeError)
+
+    detailed_response.result = {'replaced': True}
+    assert detailed_response.get_result() == {'replaced': True}
+
+
+@responses.activate
+def test_send_many():
+    lock = threading.Lock()
+    in_flight = [0, 0]
+
+    def callback(request):
+        with lock:
+            in_flight[0] += 1
+            in_flight[1] = max(in_flight)
+        # Later requests complete first.
+        index = int(request.params['i'])
+        time.sleep(0.02 * (10 - index) / 10)
+        with lock:
+            in_flight[0] -= 1
+        if index == 3:
+            return (404, {}, '{"error": "not found"}')
+        return (200, {'Content-Type': 'application/json'}, json.dumps({'i': index}))
+
+    url = 'https://gateway.watsonplatform.net/test/api'
+    responses.add_callback(responses.GET, url, callback=callback)
+    service = AnyServiceV1('2018-11-20', authenticator=NoAuthAuthenticator())
+
+    prepared = []
+
+    def requests_to_send():
+        for i in range(10):
+            prepared.append(threading.current_thread())
+            yield service.prepare_request('GET', url='', params={'i': i})
+
+    results = list(service.send_many(requests_to_send(), max_in_flight=4))
+    assert [index for index, _ in results] == list(range(10))
+    for index, result in results:
+        if index == 3:
+            assert isinstance(result, ApiException)
+            assert result.status_code == 404
+        else:
+            assert result.get_result() == {'i': index}
+    assert in_flight[1] <= 4
+    # The requests are prepared (and authenticated) by the caller's thread.
+    assert set(prepared) == {threading.current_thread()}
+
+    results = list(service.send_many(requests_to_send(), max_in_flight=10, ordered=False))
+    assert sorted(index for index, _ in results) == list(range(10))
+    assert [index for index, _ in results] != list(range(10))
+
+    with pytest.raises(ValueError, match='max_in_flight must be at least 1'):
+        service.send_many([], max_in_flight=0)
+
+
 @responses.activate
 def test_request_success_response():
     expected_body = '{"foo": "bar", "description": "this\nis\na\ndescription"}'
@@ -743,6 +836,49 @@ def test_gzip_compression_external():
     assert prepped['headers'].get('content-encoding') == 'gzip'
 
 
+def test_request_compression():
+    service = AnyServiceV1('2018-11-20', authenticator=NoAuthAuthenticator())
+    data = b'{"foo": "bar"}' * 100
+    service.set_request_compression('deflate', level=1, min_size=100)
+    assert service.get_enable_gzip_compression()
+    prepped = service.prepare_request('POST', url='', data=data)
+    assert prepped['headers'].get('content-encoding') == 'deflate'
+    assert zlib.decompress(prepped['data']) == data
+
+    # Bodies smaller than the minimum size are not compressed.
+    prepped = service.prepare_request('POST', url='', data=b'{"foo": "bar"}')
+    assert prepped['headers'].get('content-encoding') is None
+    assert prepped['data'] == b'{"foo": "bar"}'
+    prepped = service.prepare_request('POST', url='', data=io.BytesIO(b'{"foo": "bar"}'))
+    assert prepped['headers'].get('content-encoding') is None
+    with tempfile.TemporaryFile(mode='w+b') as tmp_file:
+        tmp_file.write(data)
+        tmp_file.seek(0)
+        prepped = service.prepare_request('POST', url='', data=tmp_file)
+        assert prepped['headers'].get('content-encoding') == 'deflate'
+        assert zlib.decompress(prepped['data'].read()) == data
+
+    service.set_request_compression(None)
+    assert not service.get_enable_gzip_compression()
+    assert service.prepare_request('POST', url='', data=data)['data'] == data
+
+    with pytest.raises(ValueError):
+        service.set_request_compression('lz4')
+    with pytest.raises(ValueError):
+        service.set_request_compression('gzip', level=42)
+    assert service.compression_encoding == 'deflate'
+
+
+def test_request_compression_external():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-compression.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = IncludeExternalConfigService('v1', authenticator=NoAuthAuthenticator())
+    assert service.get_enable_gzip_compression() is True
+    assert service.compression_encoding == 'deflate'
+    assert service.compression_level == 1
+    assert service.compression_min_size == 1024
+
+
 def test_retry_config_default():
     service = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
     service.enable_retries()
@@ -1021,3 +1157,218 @@ def test_min_ssl_version():
     ssl_context = adapter.poolmanager.connection_pool_kw.get('ssl_context', None)
     assert ssl_context is not None
     assert ssl_context.minimum_version == ssl.TLSVersion.TLSv1_2
+
+
+def test_config_changes_keep_connection_pools():
+    service = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    adapter = service.http_adapter
+    pool = adapter.poolmanager.connection_from_url('https://mockurl/')
+
+    # Retry policy changes are applied to the existing adapter and its pools.
+    service.enable_retries(3, 10.0)
+    assert service.http_adapter is adapter
+    assert service.http_client.get_adapter('https://') is adapter
+    assert adapter.max_retries.total == 3
+    service.disable_retries()
+    assert service.http_adapter is adapter
+    assert adapter.max_retries.total == 0
+    assert adapter.poolmanager.connection_from_url('https://mockurl/') is pool
+
+    # SSL changes keep the adapter, but new connections use the new SSL context.
+    service.set_disable_ssl_verification(True)
+    assert service.http_adapter is adapter
+    ssl_context = adapter.poolmanager.connection_pool_kw['ssl_context']
+    assert ssl_context.verify_mode == ssl.CERT_NONE
+    service.set_disable_ssl_verification(False)
+    assert adapter.poolmanager.connection_from_url('https://mockurl/') is pool
+
+    # The adapter is mounted again on a replacement http client.
+    service.set_http_client(requests.Session())
+    service.enable_retries()
+    assert service.http_client.get_adapter('https://') is adapter
+
+
+def test_connection_pool_config():
+    service = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    assert service.http_adapter.poolmanager.connection_pool_kw['maxsize'] == 10
+    assert service.http_adapter.poolmanager.connection_pool_kw['block'] is False
+
+    service = BaseService(
+        service_url='https://mockurl/', authenticator=NoAuthAuthenticator(), pool_maxsize=64, pool_block=True
+    )
+    assert service.http_adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+    assert service.http_adapter.poolmanager.connection_pool_kw['block'] is True
+    pool = service.http_adapter.poolmanager.connection_from_url('https://mockurl/')
+    assert pool.pool.maxsize == 64
+
+    service.set_connection_pool_config(pool_connections=2, pool_maxsize=32)
+    assert service.pool_maxsize == 32
+    assert service.pool_block is True
+    assert service.http_adapter.poolmanager.connection_pool_kw['maxsize'] == 32
+    assert len(service.http_adapter.poolmanager.pools.keys()) == 0
+
+    with pytest.raises(ValueError):
+        service.set_connection_pool_config(pool_maxsize=0)
+
+
+def test_connection_pool_config_external():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-pool.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = IncludeExternalConfigService('v1', authenticator=NoAuthAuthenticator())
+    assert service.pool_connections == 4
+    assert service.pool_maxsize == 64
+    assert service.pool_block is True
+    assert service.http_adapter.poolmanager.connection_pool_kw['maxsize'] == 64
+
+
+def test_shared_transport():
+    registry = SessionRegistry()
+    services = [BaseService(service_url='https://mockurl/v1', authenticator=NoAuthAuthenticator()) for _ in range(3)]
+    for service in services:
+        assert not service.is_shared_transport_enabled()
+        service.enable_shared_transport(registry)
+        assert service.is_shared_transport_enabled()
+    session = services[0].http_client
+    adapter = services[0].http_adapter
+    assert all(service.http_client is session for service in services)
+    assert all(service.http_adapter is adapter for service in services)
+
+    # Configuration changes switch to another shared session and leave the shared adapter alone.
+    services[0].enable_retries(3, 10.0)
+    assert services[0].http_client is not session
+    assert services[0].http_adapter.max_retries.total == 3
+    assert adapter.max_retries.total == 0
+    services[1].enable_retries(3, 10.0)
+    assert services[1].http_client is services[0].http_client
+    services[0].disable_retries()
+    assert services[0].http_client is session
+
+    services[0].set_disable_ssl_verification(True)
+    assert services[0].http_adapter._disable_ssl_verification is True
+    assert not adapter._disable_ssl_verification
+    services[0].set_connection_pool_config(pool_maxsize=64)
+    assert services[0].http_adapter._pool_maxsize == 64
+    assert adapter._pool_maxsize == 10
+    services[0].set_service_url('https://otherurl')
+    assert services[0].http_client is not services[2].http_client
+
+    # A replacement http client disables the shared transport.
+    services[1].set_http_client(requests.Session())
+    assert not services[1].is_shared_transport_enabled()
+    services[1].disable_retries()
+    assert services[1].http_client.get_adapter('https://') is services[1].http_adapter
+    assert services[1].http_adapter is not adapter
+
+    services[2].disable_shared_transport()
+    assert not services[2].is_shared_transport_enabled()
+    assert services[2].http_client is not session
+    assert services[2].http_adapter is not adapter
+
+
+@responses.activate
+def test_shared_transport_cookies():
+    responses.add(responses.GET, 'https://mockurl/v1/login', status=200, headers={'Set-Cookie': 'session=abc; Path=/'})
+    responses.add(responses.GET, 'https://mockurl/v1/data', status=200)
+    registry = SessionRegistry()
+    first = BaseService(service_url='https://mockurl/v1', authenticator=NoAuthAuthenticator())
+    second = BaseService(service_url='https://mockurl/v1', authenticator=NoAuthAuthenticator())
+    first.enable_shared_transport(registry)
+    second.enable_shared_transport(registry)
+
+    first.send(first.prepare_request('GET', url='/login'))
+    first.send(first.prepare_request('GET', url='/data'))
+    second.send(second.prepare_request('GET', url='/data'))
+    assert len(first.jar) == 1
+    assert len(second.jar) == 0
+    assert len(first.http_client.cookies) == 0
+    assert responses.calls[1].request.headers['Cookie'] == 'session=abc'
+    assert 'Cookie' not in responses.calls[2].request.headers
+
+
+@responses.activate
+def test_rate_limiting():
+    url = 'https://gateway.watsonplatform.net/test/api'
+    responses.add(responses.GET, url, status=200, json={})
+    responses.add(responses.GET, url, status=429, headers={'Retry-After': '0.1'})
+    service = AnyServiceV1('2018-11-20', authenticator=NoAuthAuthenticator())
+    service.enable_rate_limiting(10, burst=1)
+    limiter = service.get_rate_limiter()
+
+    service.any_service_call()
+    with pytest.raises(ApiException):
+        service.any_service_call()
+    # The second request waited for a token, then the 429 response halved the rate.
+    assert limiter.get_rate(url) == 5
+    start = time.monotonic()
+    with pytest.raises(ApiException):
+        service.any_service_call()
+    assert time.monotonic() - start >= 0.09
+
+    service.disable_rate_limiting()
+    assert service.get_rate_limiter() is None
+
+
+@responses.activate
+def test_circuit_breaker():
+    url = 'https://gateway.watsonplatform.net/test/api'
+    responses.add(responses.GET, url, body=requests.exceptions.ConnectTimeout('timed out'))
+    responses.add(responses.GET, url, status=503)
+    service = AnyServiceV1('2018-11-20', authenticator=NoAuthAuthenticator())
+    service.enable_circuit_breaker(window_size=2, minimum_calls=2, open_timeout=60)
+
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        service.any_service_call()
+    with pytest.raises(ApiException):
+        service.any_service_call()
+    assert service.get_circuit_breaker().get_state(url) == CircuitBreaker.OPEN
+    # The request fails without being sent.
+    with pytest.raises(CircuitBreakerOpenException):
+        service.any_service_call()
+    assert len(responses.calls) == 2
+
+    service.disable_circuit_breaker()
+    with pytest.raises(ApiException) as err:
+        service.any_service_call()
+    assert not isinstance(err.value, CircuitBreakerOpenException)
+
+
+@responses.activate
+def test_circuit_breaker_ignores_rate_limiter_wait():
+    url = 'https://gateway.watsonplatform.net/test/api'
+    responses.add(responses.GET, url, status=200, json={})
+    service = AnyServiceV1('2018-11-20', authenticator=NoAuthAuthenticator())
+    service.enable_rate_limiting(5, burst=1)
+    service.enable_circuit_breaker(slow_call_duration=0.1, window_size=2, minimum_calls=2)
+
+    start = time.monotonic()
+    for _ in range(3):
+        service.any_service_call()
+    # The requests waited 0.2 seconds for the rate limiter, but the exchanges weren't slow.
+    assert time.monotonic() - start >= 0.35
+    assert service.get_circuit_breaker().get_state(url) == CircuitBreaker.CLOSED
+
+
+def test_circuit_breaker_external_config():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-circuit-breaker.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = IncludeExternalConfigService('v1', authenticator=NoAuthAuthenticator())
+    breaker = service.get_circuit_breaker()
+    assert (breaker.failure_rate_threshold, breaker.slow_call_duration, breaker.open_timeout) == (0.25, 5, 10)
+    del os.environ['IBM_CREDENTIALS_FILE']
+
+
+def test_rate_limiting_external_config():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-rate-limit.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = IncludeExternalConfigService('v1', authenticator=NoAuthAuthenticator())
+    limiter = service.get_rate_limiter()
+    assert (limiter.rate, limiter.burst, limiter.per) == (25, 5, 'path')
+    del os.environ['IBM_CREDENTIALS_FILE']
+
+
+def test_shared_transport_external_config():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-shared-transport.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = IncludeExternalConfigService('v1', authenticator=NoAuthAuthenticator())
+    assert service.is_shared_transport_enabled()
+    assert service.http_client is SessionRegistry.get_default().get_session('https://mockurl')
@@ -0,0 +1,160 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring,too-few-public-methods
+import asyncio
+import time
+
+import pytest
+import requests
+
+from ibm_cloud_sdk_core import ApiException, CircuitBreaker, CircuitBreakerOpenException
+from ibm_cloud_sdk_core.circuit_breaker import record_wait
+from ibm_cloud_sdk_core.retry_policy import EXPONENTIAL, RetryPolicy
+
+URL = 'https://api.example.com/v1/things'
+
+
+class FakeResponse:
+    def __init__(self, status_code: int) -> None:
+        self.status_code = status_code
+
+
+def respond(status_code: int, delay: float = 0):
+    def send():
+        time.sleep(delay)
+        return FakeResponse(status_code)
+
+    return send
+
+
+def fail():
+    raise requests.exceptions.ConnectTimeout('timed out')
+
+
+def fail_with_value_error():
+    raise ValueError('invalid')
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        CircuitBreaker(failure_rate_threshold=0)
+    with pytest.raises(ValueError):
+        CircuitBreaker(window_size=5, minimum_calls=10)
+
+
+def test_opens_on_failure_rate():
+    breaker = CircuitBreaker(window_size=4, minimum_calls=4, open_timeout=60)
+    breaker.call(URL, respond(200))
+    breaker.call(URL, respond(503))
+    breaker.call(URL, respond(404))
+    assert breaker.get_state(URL) == CircuitBreaker.CLOSED
+    with pytest.raises(requests.exceptions.ConnectTimeout):
+        breaker.call(URL, fail)
+    # 2 of the last 4 requests failed.
+    assert breaker.get_state(URL) == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitBreakerOpenException) as err:
+        breaker.call(URL, respond(200))
+    assert isinstance(err.value, ApiException)
+    assert err.value.status_code == 503
+    assert err.value.host == 'api.example.com'
+    assert 59 < err.value.retry_after <= 60
+    assert 'The circuit breaker for api.example.com is open' in str(err.value)
+
+    # Other hosts are not affected.
+    assert breaker.call('https://other.example.com', respond(200)).status_code == 200
+
+    breaker.reset()
+    assert breaker.get_state(URL) == CircuitBreaker.CLOSED
+
+    # The outcome of the requests sent before a reset is ignored.
+    hosts = [breaker.before_request(URL) for _ in range(3)]
+    breaker.reset()
+    breaker.record_response(hosts[0], 503, 0.01)
+    breaker.record_error(hosts[1], ValueError('invalid'), 0.01)
+    breaker.record_error(hosts[2], requests.exceptions.ConnectTimeout('timed out'), 0.01)
+    assert breaker.get_state(URL) == CircuitBreaker.CLOSED
+
+
+def test_opens_on_slow_calls():
+    breaker = CircuitBreaker(slow_call_duration=0.01, slow_call_rate_threshold=0.5, window_size=2, minimum_calls=2)
+    breaker.call(URL, respond(200))
+    breaker.call(URL, respond(200, delay=0.02))
+    assert breaker.get_state(URL) == CircuitBreaker.OPEN
+
+
+def test_waits_are_not_timed():
+    def send():
+        # A retry policy that waited for the backoff.
+        RetryPolicy(total=1, backoff_strategy=EXPONENTIAL, backoff_value=0.2).sleep()
+        return FakeResponse(200)
+
+    breaker = CircuitBreaker(slow_call_duration=0.1, window_size=1, minimum_calls=1)
+    breaker.call(URL, send)
+    assert breaker.get_state(URL) == CircuitBreaker.CLOSED
+    breaker.call(URL, respond(200, delay=0.15))
+    assert breaker.get_state(URL) == CircuitBreaker.OPEN
+    # Outside of a call, the waits are ignored.
+    record_wait(1)
+
+
+def test_half_open_probes():
+    breaker = CircuitBreaker(window_size=2, minimum_calls=2, open_timeout=0.05, half_open_calls=2)
+    for _ in range(2):
+        breaker.call(URL, respond(500))
+    assert breaker.get_state(URL) == CircuitBreaker.OPEN
+    time.sleep(0.06)
+    assert breaker.get_state(URL) == CircuitBreaker.HALF_OPEN
+
+    # A failed probe opens the breaker again.
+    breaker.call(URL, respond(502))
+    assert breaker.get_state(URL) == CircuitBreaker.OPEN
+    time.sleep(0.06)
+
+    # Only half_open_calls probes are let through at the same time, and they must all succeed.
+    first = breaker.before_request(URL)
+    second = breaker.before_request(URL)
+    with pytest.raises(CircuitBreakerOpenException):
+        breaker.before_request(URL)
+    breaker.record_response(first, 200, 0.01)
+    assert breaker.get_state(URL) == CircuitBreaker.HALF_OPEN
+    breaker.record_response(second, 200, 0.01)
+    assert breaker.get_state(URL) == CircuitBreaker.CLOSED
+
+
+def test_other_errors_release_probes():
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1, open_timeout=0)
+    breaker.call(URL, respond(500))
+    with pytest.raises(ValueError):
+        breaker.call(URL, fail_with_value_error)
+    # The error is not a failure of the host, so another probe can be sent.
+    assert breaker.call(URL, respond(200)).status_code == 200
+    assert breaker.get_state(URL) == CircuitBreaker.CLOSED
+
+
+def test_call_async():
+    breaker = CircuitBreaker(window_size=1, minimum_calls=1)
+
+    async def send():
+        return FakeResponse(504)
+
+    async def call_twice():
+        await breaker.call_async(URL, send)
+        await breaker.call_async(URL, send)
+
+    with pytest.raises(CircuitBreakerOpenException):
+        asyncio.run(call_twice())
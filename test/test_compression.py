@@ -0,0 +1,63 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import gzip
+import io
+import zlib
+
+import pytest
+
+from ibm_cloud_sdk_core.compression import CompressionCodec, get_available_encodings, get_codec, register_codec
+
+DATA = b'{"name": "value", "numbers": [1, 2, 3]}' * 1000
+
+
+def test_builtin_codecs():
+    assert {'gzip', 'deflate'} <= set(get_available_encodings())
+
+    codec = get_codec('GZIP')
+    assert codec.encoding == 'gzip'
+    assert gzip.decompress(codec.compress(DATA)) == DATA
+    assert len(codec.compress(DATA, level=1)) > len(codec.compress(DATA, level=9))
+    assert gzip.decompress(codec.compress_stream(io.BytesIO(DATA), level=1).read()) == DATA
+
+    codec = get_codec('deflate')
+    assert zlib.decompress(codec.compress(DATA, level=6)) == DATA
+    assert zlib.decompress(codec.compress_stream(io.BytesIO(DATA)).read()) == DATA
+
+
+def test_optional_codecs():
+    if 'zstd' in get_available_encodings():
+        zstandard = pytest.importorskip('zstandard')
+        compressed = get_codec('zstd').compress(DATA, level=3)
+        assert zstandard.ZstdDecompressor().decompressobj().decompress(compressed) == DATA
+    if 'br' in get_available_encodings():
+        brotli = pytest.importorskip('brotli')
+        assert brotli.decompress(get_codec('br').compress_stream(DATA, level=4).read()) == DATA
+
+
+def test_unknown_codec_and_level():
+    with pytest.raises(ValueError, match='Unsupported compression encoding: lz4'):
+        get_codec('lz4')
+    with pytest.raises(ValueError, match='Invalid compression level'):
+        get_codec('gzip').create_compressor(42)
+
+
+def test_register_codec():
+    register_codec(CompressionCodec('x-identity', lambda level: zlib.compressobj(0)))
+    assert 'x-identity' in get_available_encodings()
+    assert zlib.decompress(get_codec('x-identity').compress(DATA)) == DATA
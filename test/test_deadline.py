@@ -0,0 +1,170 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import os
+import time
+
+import pytest
+import requests
+import responses
+
+from ibm_cloud_sdk_core import ApiException, BaseService, DeadlineExceededException, RateLimiter, deadline_scope
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_cloud_sdk_core.deadline import Deadline, DeadlineTimeout, get_deadline
+
+
+def test_deadline():
+    deadline = Deadline(10)
+    assert 9 < deadline.remaining() <= 10
+    assert not deadline.expired()
+    assert deadline.cap(None) <= 10
+    assert deadline.cap(2) == 2
+    assert deadline.cap_timeout((3, 60)) == (3, pytest.approx(10, abs=0.1))
+
+    expired = Deadline(0)
+    assert expired.expired()
+    assert expired.remaining() == 0
+    with pytest.raises(DeadlineExceededException) as err:
+        expired.cap(60)
+    assert isinstance(err.value, ApiException)
+    assert err.value.status_code == 504
+    assert err.value.total_timeout == 0
+
+
+def test_deadline_timeout():
+    timeout = DeadlineTimeout(Deadline(5), (2, 60))
+    attempt_timeout = timeout.clone()
+    assert attempt_timeout.connect_timeout == 2
+    assert 4 < attempt_timeout.total <= 5
+
+    with pytest.raises(DeadlineExceededException):
+        DeadlineTimeout(Deadline(0), 60).clone()
+
+
+def test_deadline_scope():
+    assert get_deadline() is None
+    with deadline_scope(10) as outer:
+        assert get_deadline() is outer
+        # The earliest deadline applies.
+        with deadline_scope(20) as inner:
+            assert inner is outer
+        with deadline_scope(1) as inner:
+            assert inner is not outer
+            assert get_deadline() is inner
+        with deadline_scope(None) as inner:
+            assert inner is outer
+        assert get_deadline() is outer
+    assert get_deadline() is None
+
+
+@responses.activate
+def test_send_gives_up_before_retry():
+    url = 'https://mockurl/'
+    responses.add(responses.GET, url, status=503, headers={'Retry-After': '5'})
+    service = BaseService(service_url=url, authenticator=NoAuthAuthenticator())
+    service.enable_retries(max_retries=4)
+    start = time.monotonic()
+    with pytest.raises(DeadlineExceededException) as err:
+        service.send(service.prepare_request('GET', url=''), total_timeout=1)
+    # The retry would start after the deadline, so the call fails without waiting.
+    assert time.monotonic() - start < 1
+    assert err.value.total_timeout == 1
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_send_timeout_after_deadline():
+    url = 'https://mockurl/'
+
+    def callback(request):  # pylint: disable=unused-argument
+        time.sleep(0.1)
+        raise requests.exceptions.ReadTimeout('timed out')
+
+    responses.add_callback(responses.GET, url, callback=callback)
+    service = BaseService(service_url=url, authenticator=NoAuthAuthenticator())
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        service.send(service.prepare_request('GET', url=''))
+
+    service.set_total_timeout(0.05)
+    with pytest.raises(DeadlineExceededException):
+        service.send(service.prepare_request('GET', url=''))
+
+
+class SlowAuthenticator(NoAuthAuthenticator):
+    def authenticate(self, req):
+        # Like a token fetch that takes most of the total timeout.
+        time.sleep(0.2)
+
+
+@responses.activate
+def test_prepare_and_send_share_deadline():
+    url = 'https://mockurl/'
+    responses.add(responses.GET, url, status=200, json={})
+    service = BaseService(service_url=url, authenticator=SlowAuthenticator())
+    service.set_total_timeout(0.15)
+    request = service.prepare_request('GET', url='')
+    # The deadline is kept by the service, the request only has the arguments of the HTTP request.
+    assert 'deadline' not in request
+    with pytest.raises(DeadlineExceededException):
+        service.send(request)
+    assert not responses.calls
+    assert not service._prepared_deadlines  # pylint: disable=protected-access
+
+    # A timeout given to send() is counted from prepare_request() too.
+    service.set_total_timeout(None)
+    request = service.prepare_request('GET', url='')
+    service.send(request, total_timeout=0.1)
+    service.set_total_timeout(10)
+    with pytest.raises(DeadlineExceededException):
+        service.send(service.prepare_request('GET', url=''), total_timeout=0.1)
+    assert service.send(service.prepare_request('GET', url=''), total_timeout=1).get_status_code() == 200
+
+    # It's counted from the start of the call, not from the start of an enclosing scope.
+    with deadline_scope(10):
+        time.sleep(0.2)
+        assert service.send(service.prepare_request('GET', url=''), total_timeout=0.3).get_status_code() == 200
+
+    # The deadlines of the requests that are never sent are forgotten once they have passed.
+    service.set_total_timeout(0.1)
+    service.prepare_request('GET', url='')
+    service.prepare_request('GET', url='')
+    assert len(service._prepared_deadlines) == 1  # pylint: disable=protected-access
+
+
+def test_rate_limiter_wait_is_capped():
+    limiter = RateLimiter(1, burst=1)
+    limiter.acquire('https://mockurl/')
+    with deadline_scope(0.1):
+        start = time.monotonic()
+        with pytest.raises(DeadlineExceededException):
+            limiter.acquire('https://mockurl/')
+        assert time.monotonic() - start < 0.05
+    # The token was given back.
+    assert limiter.get_queue_depth() == 0
+    assert 0.9 < limiter.acquire('https://mockurl/') <= 1
+
+
+def test_set_total_timeout():
+    service = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    with pytest.raises(ValueError):
+        service.set_total_timeout(0)
+
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-total-timeout.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service.configure_service('include_external_config')
+    assert service.total_timeout == 12.5
+    del os.environ['IBM_CREDENTIALS_FILE']
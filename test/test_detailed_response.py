@@ -1,11 +1,19 @@
 # coding=utf-8
 # pylint: disable=missing-docstring
+import gzip
+import io
 import json
 
+import pytest
 import responses
 import requests
+import urllib3
+
+from ibm_cloud_sdk_core import ApiException, BaseService
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
 
 from ibm_cloud_sdk_core import DetailedResponse
+from ibm_cloud_sdk_core.detailed_response import _JsonArrayDecoder
 
 
 def clean(val):
@@ -61,3 +69,126 @@ def test_detailed_response_list():
     assert clean(str(detailed_response.get_result())) in response_str
     # assert clean(str(detailed_response.get_headers())) in response_str
     assert clean(str(detailed_response.get_status_code())) in response_str
+
+
+def streamed_response(body: bytes, headers: dict) -> DetailedResponse:
+    response = requests.Response()
+    response.status_code = 200
+    response.headers = requests.structures.CaseInsensitiveDict(headers)
+    response.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(body), headers=headers, status=200, preload_content=False, decode_content=False
+    )
+    return DetailedResponse(response=response, headers=response.headers, status_code=200)
+
+
+def test_detailed_response_iter_bytes():
+    data = bytes(range(256)) * 4096
+    detailed_response = streamed_response(gzip.compress(data), {'Content-Encoding': 'gzip'})
+    chunks = list(detailed_response.iter_bytes(1000))
+    assert len(chunks) > 1
+    assert b''.join(chunks) == data
+
+    # The body can also be read as-is.
+    compressed = gzip.compress(data)
+    detailed_response = streamed_response(compressed, {'Content-Encoding': 'gzip'})
+    assert b''.join(detailed_response.iter_bytes(decode_content=False)) == compressed
+
+
+def test_detailed_response_iter_lines():
+    body = b'{"a": 1}\n{"b": 2}\r\n\n{"\xc3\xa9": 3}'
+    detailed_response = streamed_response(gzip.compress(body), {'Content-Encoding': 'gzip'})
+    assert list(detailed_response.iter_lines(3)) == [b'{"a": 1}', b'{"b": 2}', b'', b'{"\xc3\xa9": 3}']
+
+    detailed_response = streamed_response(body, {'Content-Type': 'application/x-ndjson; charset=utf-8'})
+    assert list(detailed_response.iter_lines(decode_unicode=True))[-1] == '{"é": 3}'
+
+    detailed_response = streamed_response(b'x' * 1000 + b'\n', {})
+    with pytest.raises(ValueError):
+        list(detailed_response.iter_lines(100, max_line_size=500))
+
+
+def test_detailed_response_readinto():
+    data = bytes(range(256)) * 4096
+    with streamed_response(gzip.compress(data), {'Content-Encoding': 'gzip'}) as detailed_response:
+        buffer = bytearray(10000)
+        target = io.BytesIO()
+        size = detailed_response.readinto(buffer)
+        target.write(buffer[:size])
+        # Iteration continues where readinto() stopped.
+        for chunk in detailed_response.iter_bytes():
+            target.write(chunk)
+        assert detailed_response.readinto(buffer) == 0
+    assert target.getvalue() == data
+    assert detailed_response.get_result().raw.closed
+
+
+def test_detailed_response_not_streamed():
+    detailed_response = DetailedResponse(response={'foo': 'bar'}, status_code=200)
+    with pytest.raises(TypeError):
+        list(detailed_response.iter_bytes())
+    with pytest.raises(TypeError):
+        detailed_response.readinto(bytearray(10))
+    detailed_response.close()
+
+
+def test_detailed_response_iter_records_json_lines():
+    records = [{'id': i, 'text': 'line\nbreak'} for i in range(100)]
+    body = ('\n'.join(json.dumps(record) for record in records) + '\n\n').encode()
+    detailed_response = streamed_response(gzip.compress(body), {'Content-Encoding': 'gzip'})
+    assert list(detailed_response.iter_records(10)) == records
+
+    detailed_response = streamed_response(b'{"a": 1}\n{"b": \n', {'Content-Type': 'application/x-ndjson'})
+    with pytest.raises(ApiException) as err:
+        list(detailed_response.iter_records())
+    assert err.value.message == 'Error processing the HTTP response'
+
+
+def test_detailed_response_iter_records_json_array():
+    records = [{'id': i, 'tags': ['a]', '{b', 'c\\"'], 'nested': {'list': [1, [2]]}} for i in range(100)] + [1, None]
+    body = json.dumps(records).encode()
+    detailed_response = streamed_response(body, {'Content-Type': 'application/json'})
+    assert list(detailed_response.iter_records(7)) == records
+
+    # Other JSON values are returned as a single record.
+    detailed_response = streamed_response(b'{"resources": [1, 2]}', {'Content-Type': 'application/json'})
+    assert list(detailed_response.iter_records()) == [{'resources': [1, 2]}]
+    detailed_response = streamed_response(b'[]', {'Content-Type': 'application/json'})
+    assert not list(detailed_response.iter_records())
+
+    detailed_response = streamed_response(b'[1, 2, "' + b'x' * 1000 + b'"]', {'Content-Type': 'application/json'})
+    with pytest.raises(ValueError):
+        list(detailed_response.iter_records(100, max_record_size=500))
+
+
+def test_json_array_decoder_chunk_boundaries():
+    # A chunk that ends inside a number doesn't end the number.
+    for first, second in [(b'[1.', b'5, 2]'), (b'[1e', b'5, 2]'), (b'[-1', b'2e-1, 2]'), (b'[1', b'0]')]:
+        decoder = _JsonArrayDecoder()
+        records = decoder.feed(first) + decoder.feed(second) + decoder.finish()
+        assert records == json.loads(first + second)
+
+    # After a large element, the next elements are returned as soon as they are complete.
+    decoder = _JsonArrayDecoder()
+    assert not decoder.feed(b'["' + b'x' * 1000)
+    assert decoder.feed(b'"' + b' ' * 1000 + b', ') == ['x' * 1000]
+    assert [decoder.feed('{{"id": {0}}}, '.format(i).encode()) for i in range(5)] == [[{'id': i}] for i in range(5)]
+
+    # Control characters are allowed inside strings, as in the responses that are not streamed.
+    decoder = _JsonArrayDecoder()
+    assert decoder.feed(b'[{"text": "a\tb\nc"}, ') == [{'text': 'a\tb\nc'}]
+    assert decoder.feed(b'"d\te"]') + decoder.finish() == ['d\te']
+    decoder = _JsonArrayDecoder()
+    assert decoder.feed(b'{"text": "a\tb"}') + decoder.finish() == [{'text': 'a\tb'}]
+
+
+@responses.activate
+def test_send_and_iter_records():
+    responses.add(
+        responses.GET,
+        'https://test.com/records',
+        body='{"id": 1}\n{"id": 2}\n',
+        content_type='application/x-ndjson',
+    )
+    service = BaseService(service_url='https://test.com', authenticator=NoAuthAuthenticator())
+    with service.send(service.prepare_request('GET', url='/records'), stream=True) as detailed_response:
+        assert list(detailed_response.iter_records()) == [{'id': 1}, {'id': 2}]
@@ -0,0 +1,251 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring,too-few-public-methods
+import asyncio
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+import responses
+
+from ibm_cloud_sdk_core import BaseService, HedgingPolicy, RetryBudget
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+
+
+class FakeResponse:
+    def __init__(self, status_code: int, name: str) -> None:
+        self.status_code = status_code
+        self.name = name
+        self.closed = False
+
+    def close(self) -> None:
+        self.closed = True
+
+
+def sequence(*attempts):
+    """Returns a send function whose calls sleep and respond as described by `attempts`, in order."""
+    attempts = iter(attempts)
+    lock = threading.Lock()
+    sent = []
+
+    def send():
+        with lock:
+            delay, status_code = next(attempts)
+            response = FakeResponse(status_code, 'attempt {0}'.format(len(sent)))
+            sent.append(response)
+        time.sleep(delay)
+        return response
+
+    return send, sent
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError):
+        HedgingPolicy(delay=-1)
+    with pytest.raises(ValueError):
+        HedgingPolicy(percentile=0)
+    with pytest.raises(ValueError):
+        HedgingPolicy(min_samples=10, window_size=5)
+
+
+def test_hedge_wins():
+    policy = HedgingPolicy(delay=0.02)
+    send, sent = sequence((0.5, 200), (0, 200))
+    response = policy.call('get', send)
+    assert response is sent[1]
+    stats = policy.get_stats()
+    assert stats == {'requests': 1, 'hedges': 1, 'hedge_wins': 1, 'budget_exhausted': 0, 'delay': 0.02}
+    time.sleep(0.6)
+    # The slow response was discarded.
+    assert sent[0].closed
+    policy.close()
+
+
+def test_fast_response_is_not_hedged():
+    policy = HedgingPolicy(delay=0.5)
+    send, sent = sequence((0, 200))
+    assert policy.call('GET', send) is sent[0]
+    assert policy.get_stats()['hedges'] == 0
+
+    # Other methods are not hedged.
+    send, sent = sequence((0.05, 200))
+    assert HedgingPolicy(delay=0).call('POST', send) is sent[0]
+
+
+def test_original_requests_are_not_limited_by_workers():
+    policy = HedgingPolicy(delay=1, max_workers=1)
+    send, sent = sequence(*[(0.1, 200)] * 8)
+    start = time.monotonic()
+    with ThreadPoolExecutor(8) as executor:
+        responses_received = list(executor.map(lambda _: policy.call('GET', send), range(8)))
+    # The requests were sent at the same time, although the policy has a single worker for hedges.
+    assert time.monotonic() - start < 0.5
+    assert sorted(response.name for response in responses_received) == sorted(response.name for response in sent)
+    assert policy.get_stats()['hedges'] == 0
+
+    # The threads of the original requests are reused, rather than started for each request.
+    originals = policy._original_executor  # pylint: disable=protected-access
+    threads = set(originals._threads)  # pylint: disable=protected-access
+    assert len(threads) <= 8
+    send, _ = sequence(*[(0, 200)] * 8)
+    for _ in range(8):
+        policy.call('GET', send)
+    assert set(originals._threads) == threads  # pylint: disable=protected-access
+    policy.close()
+
+
+def test_policy_can_be_used_after_close():
+    policy = HedgingPolicy(delay=0.02)
+    send, sent = sequence((0.1, 200), (0, 200))
+    assert policy.call('GET', send) is sent[1]
+    policy.close()
+    # New threads are started for the requests sent after the policy was closed.
+    send, sent = sequence((0.1, 200), (0, 200))
+    assert policy.call('GET', send) is sent[1]
+    policy.close()
+
+
+def test_failed_hedge_waits_for_original():
+    policy = HedgingPolicy(delay=0.02)
+    send, sent = sequence((0.1, 200), (0, 503))
+    assert policy.call('GET', send) is sent[0]
+    assert policy.get_stats()['hedge_wins'] == 0
+
+    # When all the requests fail, the outcome of the original request is returned.
+    send, sent = sequence((0.1, 500), (0, 503))
+    assert policy.call('GET', send) is sent[0]
+    policy.close()
+
+
+def test_delay_from_latency_percentile():
+    policy = HedgingPolicy(min_samples=10, window_size=10, percentile=0.9, min_delay=0.05)
+    send, sent = sequence((0, 200))
+    policy.call('GET', send)
+    # There are too few latencies to compute the delay, the request was not hedged.
+    assert policy.get_delay() is None
+    assert policy.get_stats()['hedges'] == 0
+    for latency in range(1, 11):
+        policy.record_latency(latency / 10)
+    assert policy.get_delay() == 0.9
+    for _ in range(10):
+        policy.record_latency(0.001)
+    assert policy.get_delay() == 0.05
+    assert len(sent) == 1
+
+
+def test_hedging_budget():
+    policy = HedgingPolicy(delay=0.01, budget=RetryBudget(0, min_retries_per_second=0.1))
+    send, _ = sequence((0.05, 200), (0, 200), (0.05, 200))
+    policy.call('GET', send)
+    policy.call('GET', send)
+    stats = policy.get_stats()
+    assert stats['requests'] == 2
+    assert stats['hedges'] == 1
+    assert stats['budget_exhausted'] == 1
+    policy.close()
+
+
+def test_call_async_cancels_losers():
+    policy = HedgingPolicy(delay=0.02, max_hedges=2)
+    cancelled = []
+
+    async def slow():
+        try:
+            await asyncio.sleep(1)
+        except asyncio.CancelledError:
+            cancelled.append(True)
+            raise
+        return FakeResponse(200, 'slow')
+
+    attempts = iter([slow, slow])
+
+    async def send():
+        attempt = next(attempts, None)
+        if attempt is not None:
+            return await attempt()
+        return FakeResponse(200, 'fast')
+
+    response = asyncio.run(policy.call_async('GET', send))
+    assert response.name == 'fast'
+    assert len(cancelled) == 2
+    assert policy.get_stats()['hedges'] == 2
+
+
+def test_base_service_hedging():
+    url = 'https://mockurl/'
+    calls = []
+
+    def callback(request):  # pylint: disable=unused-argument
+        calls.append(request)
+        if len(calls) == 1:
+            time.sleep(0.3)
+            return (500, {}, '{"attempt": 1}')
+        return (200, {}, '{"attempt": 2}')
+
+    # The slow request completes after the test, so don't record it in the global mock.
+    with responses.RequestsMock() as mock_responses:
+        mock_responses.add_callback(responses.GET, url, callback=callback, content_type='application/json')
+        mock_responses.add(responses.POST, url, status=200, json={})
+        service = BaseService(service_url=url, authenticator=NoAuthAuthenticator())
+        service.enable_hedging(0.02)
+        assert service.send(service.prepare_request('GET', url='')).get_result() == {'attempt': 2}
+        assert service.get_hedging_policy().get_stats()['hedge_wins'] == 1
+
+        # Requests that are not idempotent, or whose body can only be read once, are not hedged.
+        service.send(service.prepare_request('POST', url=''))
+        service.send(service.prepare_request('GET', url='', data=(chunk for chunk in [b'some data'])))
+        assert service.get_hedging_policy().get_stats()['requests'] == 1
+
+    policy = service.get_hedging_policy()
+    service.disable_hedging()
+    assert service.get_hedging_policy() is None
+    assert policy._executor is None  # pylint: disable=protected-access
+
+
+def test_shared_hedging_policy_is_not_closed():
+    policy = HedgingPolicy(delay=0.02)
+    send, _ = sequence((0.1, 200), (0, 200))
+    policy.call('GET', send)
+    service1 = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    service2 = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    service1.set_hedging_policy(policy)
+    service2.set_hedging_policy(policy)
+
+    # A policy the service didn't create may be used by other services, so it is left open.
+    service1.disable_hedging()
+    service2.enable_hedging(0.02)
+    assert policy._executor is not None  # pylint: disable=protected-access
+    # The policy created by enable_hedging is closed when it's replaced.
+    owned_policy = service2.get_hedging_policy()
+    owned_policy.call('GET', sequence((0.1, 200), (0, 200))[0])
+    service2.set_hedging_policy(policy)
+    assert owned_policy._executor is None  # pylint: disable=protected-access
+    policy.close()
+
+
+def test_hedging_external_config():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-hedging.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    service.configure_service('include_external_config')
+    policy = service.get_hedging_policy()
+    assert policy.delay == 0.25
+    assert policy.percentile == 0.99
+    assert policy.budget.ratio == 0.05
+    del os.environ['IBM_CREDENTIALS_FILE']
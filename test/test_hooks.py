@@ -0,0 +1,160 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import asyncio
+
+import httpx
+import pytest
+import responses
+
+from ibm_cloud_sdk_core import ApiException, AsyncBaseService, BaseService, HookEvent
+from ibm_cloud_sdk_core.authenticators import BearerTokenAuthenticator, NoAuthAuthenticator
+from ibm_cloud_sdk_core.hooks import HOOK_EVENTS
+
+SERVICE_URL = 'https://mockurl'
+
+
+def record_events(service: BaseService) -> list:
+    events = []
+    for event in HOOK_EVENTS:
+        service.add_hook(event, events.append)
+    return events
+
+
+@responses.activate
+def test_hooks_sync():
+    responses.add(responses.POST, SERVICE_URL + '/v1/items', status=200, json={'id': 'abc'})
+    service = BaseService(service_url=SERVICE_URL, authenticator=BearerTokenAuthenticator('token'))
+    events = record_events(service)
+
+    request = service.prepare_request('POST', url='/v1/items', data={'name': 'item'})
+    response = service.send(request)
+    assert response.get_result() == {'id': 'abc'}
+
+    assert [event.name for event in events] == [
+        'pre_prepare',
+        'post_authenticate',
+        'pre_send',
+        'response_received',
+        'post_decode',
+    ]
+    assert all(isinstance(event, HookEvent) and event.method == 'POST' for event in events)
+    assert events[0].url == '/v1/items'
+    assert events[0].request is None
+    assert events[1].url == SERVICE_URL + '/v1/items'
+    assert events[1].request['headers']['Authorization'] == 'Bearer token'
+    assert events[1].duration >= 0
+    assert events[2].size == len(request['data'])
+    assert events[2].duration is None
+    assert events[3].status_code == 200
+    assert events[3].size == len(b'{"id": "abc"}')
+    assert events[3].start == events[2].timestamp
+    assert events[3].elapsed is not None
+    assert events[4].size == events[3].size
+    timestamps = [event.timestamp for event in events]
+    assert timestamps == sorted(timestamps)
+
+
+@responses.activate
+def test_hooks_error():
+    responses.add(responses.GET, SERVICE_URL + '/v1/items', status=404, json={'error': 'not found'})
+    service = BaseService(service_url=SERVICE_URL, authenticator=NoAuthAuthenticator())
+    events = record_events(service)
+
+    with pytest.raises(ApiException):
+        service.send(service.prepare_request('GET', url='/v1/items'))
+    assert [event.name for event in events][-2:] == ['response_received', 'error']
+    assert isinstance(events[-1].error, ApiException)
+    assert events[-1].status_code == 404
+    assert events[-1].duration >= 0
+    # The body of an error response is not decoded.
+    assert 'post_decode' not in [event.name for event in events]
+
+
+@responses.activate
+def test_hooks_lazy_parsing():
+    responses.add(responses.GET, SERVICE_URL + '/v1/items', status=200, json={'id': 'abc'})
+    service = BaseService(service_url=SERVICE_URL, authenticator=NoAuthAuthenticator())
+    service.set_lazy_response_parsing(True)
+    events = []
+    service.add_hook('post_decode', events.append)
+
+    response = service.send(service.prepare_request('GET', url='/v1/items'))
+    assert not events
+    assert response.get_result() == {'id': 'abc'}
+    assert len(events) == 1
+
+
+@responses.activate
+def test_add_and_remove_hooks():
+    responses.add(responses.GET, SERVICE_URL + '/v1/items', status=200, json={})
+    service = BaseService(service_url=SERVICE_URL, authenticator=NoAuthAuthenticator())
+    with pytest.raises(ValueError):
+        service.add_hook('post_send', print)
+
+    def failing_hook(event):
+        raise RuntimeError(event.name)
+
+    events = []
+    service.add_hook('pre_send', failing_hook)
+    service.add_hook('pre_send', events.append)
+    # The exception of a hook doesn't fail the call, nor prevent the next hooks from running.
+    assert service.send(service.prepare_request('GET', url='/v1/items')).get_status_code() == 200
+    assert len(events) == 1
+
+    service.remove_hook('pre_send', events.append)
+    service.remove_hook('pre_send', failing_hook)
+    with pytest.raises(ValueError):
+        service.remove_hook('pre_send', failing_hook)
+    service.send(service.prepare_request('GET', url='/v1/items'))
+    assert len(events) == 1
+    assert not service._hooks  # pylint: disable=protected-access
+
+
+class AnyAsyncService(AsyncBaseService):
+    pass
+
+
+def test_hooks_async():
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == '/v1/missing':
+            return httpx.Response(404, json={})
+        return httpx.Response(200, json={'id': 'abc'})
+
+    service = AnyAsyncService(service_url=SERVICE_URL, authenticator=NoAuthAuthenticator())
+    service.set_async_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    events = record_events(service)
+
+    async def call(path):
+        request = await service.prepare_request('GET', url=path)
+        return await service.send(request)
+
+    assert asyncio.run(call('/v1/items')).get_result() == {'id': 'abc'}
+    assert [event.name for event in events] == [
+        'pre_prepare',
+        'post_authenticate',
+        'pre_send',
+        'response_received',
+        'post_decode',
+    ]
+    assert events[3].size == len(b'{"id":"abc"}')
+
+    events.clear()
+    with pytest.raises(ApiException):
+        asyncio.run(call('/v1/missing'))
+    assert events[-1].name == 'error'
+    assert events[-1].status_code == 404
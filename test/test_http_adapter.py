@@ -1,9 +1,11 @@
 # pylint: disable=missing-docstring
 import logging
 import os
+import ssl
 from ssl import PROTOCOL_TLSv1_1, PROTOCOL_TLSv1_2
 
 import pytest
+import requests
 from requests import exceptions
 
 from ibm_cloud_sdk_core.base_service import BaseService
@@ -78,3 +80,49 @@ def test_tls_v1_2():
     prepped = service.prepare_request('GET', url='/status')
     res = service.send(prepped)
     assert res is not None
+
+
+def test_ssl_context_cache():
+    service1 = BaseService(service_url='https://localhost', authenticator=NoAuthAuthenticator())
+    service2 = BaseService(service_url='https://localhost', authenticator=NoAuthAuthenticator())
+    service3 = BaseService(
+        service_url='https://localhost', authenticator=NoAuthAuthenticator(), disable_ssl_verification=True
+    )
+
+    def get_ssl_context(service):
+        return service.http_adapter.poolmanager.connection_pool_kw.get('ssl_context')
+
+    # Services with the same settings share the same SSL context.
+    assert get_ssl_context(service1) is get_ssl_context(service2)
+    assert get_ssl_context(service1) is not get_ssl_context(service3)
+    assert get_ssl_context(service3).verify_mode == ssl.CERT_NONE
+
+    # Requests with a custom CA bundle use a private context, so the shared one is never modified.
+    request = requests.Request('GET', 'https://localhost/').prepare()
+    _, pool_kwargs = service1.http_adapter.build_connection_pool_key_attributes(request, cert)
+    assert pool_kwargs['ssl_context'] is not get_ssl_context(service1)
+    _, pool_kwargs_again = service1.http_adapter.build_connection_pool_key_attributes(request, cert)
+    assert pool_kwargs_again['ssl_context'] is pool_kwargs['ssl_context']
+    _, pool_kwargs = service1.http_adapter.build_connection_pool_key_attributes(request, False)
+    assert pool_kwargs['ssl_context'] is get_ssl_context(service3)
+
+
+@local_server(3336, PROTOCOL_TLSv1_2, cert, key)
+def test_ssl_context_is_not_modified():
+    service = BaseService(
+        service_url='https://localhost:3336', authenticator=NoAuthAuthenticator(), disable_ssl_verification=True
+    )
+    ssl_context = service.http_adapter.poolmanager.connection_pool_kw.get('ssl_context')
+    assert ssl_context.verify_mode == ssl.CERT_NONE
+
+    # A request with verify=True on an adapter that disables the verification must not
+    # turn on the verification in the SSL context shared with the other adapters.
+    response = service.http_client.get('https://localhost:3336/', verify=True)
+    assert response.status_code == 200
+    assert ssl_context.verify_mode == ssl.CERT_NONE
+    assert not ssl_context.check_hostname
+
+    request = requests.Request('GET', 'https://localhost:3336/').prepare()
+    _, pool_kwargs = service.http_adapter.build_connection_pool_key_attributes(request, True)
+    assert pool_kwargs['ssl_context'] is ssl_context
+    assert pool_kwargs['cert_reqs'] == 'CERT_NONE'
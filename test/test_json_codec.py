@@ -0,0 +1,147 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import dataclasses
+import datetime
+import json
+import math
+import os
+
+import pytest
+import requests
+import responses
+
+from ibm_cloud_sdk_core import BaseService, JsonCodec, OrjsonCodec
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_cloud_sdk_core.json_codec import get_json_codec, set_json_codec
+
+pytest.importorskip('orjson')
+
+DOCUMENT = {'name': 'fóó', 'count': 3, 'ratio': 0.5, 'tags': ['a', 'b'], 'nested': {'ok': True, 'none': None}}
+
+
+@dataclasses.dataclass
+class Point:
+    x: int
+    y: int
+
+
+@pytest.mark.parametrize('codec', [JsonCodec(), OrjsonCodec()])
+def test_codec_round_trip(codec):
+    encoded = codec.dumps(DOCUMENT)
+    assert isinstance(encoded, bytes)
+    assert json.loads(encoded) == DOCUMENT
+    assert codec.loads(encoded) == DOCUMENT
+    assert codec.loads(encoded.decode('utf-8')) == DOCUMENT
+
+
+@pytest.mark.parametrize('codec', [JsonCodec(), OrjsonCodec()])
+def test_codec_json_semantics(codec):
+    # Values that the json package accepts are accepted by every codec.
+    assert codec.loads(codec.dumps({1: 'int key', 'big': 2**70})) == {'1': 'int key', 'big': 2**70}
+    assert codec.loads('{"text": "line\nbreak"}') == {'text': 'line\nbreak'}
+    assert math.isnan(codec.loads('NaN'))
+    with pytest.raises(json.JSONDecodeError):
+        codec.loads('{"invalid": ')
+    with pytest.raises(TypeError):
+        codec.dumps({'unsupported': object()})
+    # orjson serializes these only when the json package doesn't.
+    with pytest.raises(TypeError):
+        codec.dumps({'created_at': datetime.datetime(2026, 1, 1)})
+    with pytest.raises(TypeError):
+        codec.dumps({'point': Point(1, 2)})
+
+
+@responses.activate
+def test_codec_loads_response():
+    responses.add(
+        responses.GET, 'https://test.com/utf8', body='{"name": "fóó"}'.encode(), content_type='application/json'
+    )
+    responses.add(
+        responses.GET,
+        'https://test.com/latin1',
+        body='{"name": "fóó"}'.encode('latin-1'),
+        content_type='application/json; charset=iso-8859-1',
+    )
+    responses.add(responses.GET, 'https://test.com/invalid', body='{"name": ', content_type='application/json')
+    codec = OrjsonCodec()
+    assert codec.loads_response(requests.get('https://test.com/utf8', timeout=None)) == {'name': 'fóó'}
+    assert codec.loads_response(requests.get('https://test.com/latin1', timeout=None)) == {'name': 'fóó'}
+    with pytest.raises(requests.exceptions.JSONDecodeError):
+        codec.loads_response(requests.get('https://test.com/invalid', timeout=None))
+
+
+def test_codec_dumps_output():
+    # orjson is opt-in because its output differs byte-for-byte from the output of the json package.
+    document = {'name': 'fóó', 'tags': ['a', 'b'], 1: None}
+    assert JsonCodec().dumps(document) == b'{"name": "f\\u00f3\\u00f3", "tags": ["a", "b"], "1": null}'
+    assert OrjsonCodec().dumps(document) == '{"name":"fóó","tags":["a","b"],"1":null}'.encode()
+    assert JsonCodec().loads(OrjsonCodec().dumps(document)) == OrjsonCodec().loads(JsonCodec().dumps(document))
+    assert OrjsonCodec().dumps({'nan': math.nan}) == b'{"nan":null}'
+    assert JsonCodec().dumps({'nan': math.nan}) == b'{"nan": NaN}'
+
+
+def test_configure_json_codec():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-json-codec.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    try:
+        service = BaseService(service_url='https://test.com', authenticator=NoAuthAuthenticator())
+        service.configure_service('orjson_service')
+        assert isinstance(service.get_json_codec(), OrjsonCodec)
+        service.configure_service('json_service')
+        assert type(service.get_json_codec()) is JsonCodec  # pylint: disable=unidiomatic-typecheck
+        with pytest.raises(ValueError, match='JSON_CODEC must be one of: json, orjson'):
+            service.configure_service('invalid_service')
+    finally:
+        del os.environ['IBM_CREDENTIALS_FILE']
+
+
+@responses.activate
+def test_service_codec():
+    # The json package is used unless orjson is selected.
+    assert type(get_json_codec()) is JsonCodec  # pylint: disable=unidiomatic-typecheck
+
+    class UpperCaseCodec(JsonCodec):
+        def dumps(self, obj):
+            return super().dumps(obj).upper()
+
+    service = BaseService(service_url='https://test.com', authenticator=NoAuthAuthenticator())
+    assert service.get_json_codec() is get_json_codec()
+    service.set_json_codec(UpperCaseCodec())
+    assert service.prepare_request('POST', url='/', data={'a': 'b'})['data'] == b'{"A": "B"}'
+    service.set_json_codec(None)
+    assert service.get_json_codec() is get_json_codec()
+    with pytest.raises(TypeError):
+        service.set_json_codec(json)
+
+    # The records of streamed responses are parsed by the codec of the service.
+    class TaggingCodec(JsonCodec):
+        def loads(self, data):
+            return dict(super().loads(data), codec='tagging')
+
+    responses.add(responses.GET, 'https://test.com/records', body='{"id": 1}\n', content_type='application/x-ndjson')
+    service.set_json_codec(TaggingCodec())
+    with service.send(service.prepare_request('GET', url='/records'), stream=True) as response:
+        assert list(response.iter_records()) == [{'id': 1, 'codec': 'tagging'}]
+    service.set_json_codec(None)
+
+    default_codec = get_json_codec()
+    try:
+        set_json_codec(UpperCaseCodec())
+        assert service.prepare_request('POST', url='/', data={'a': 'b'})['data'] == b'{"A": "B"}'
+    finally:
+        set_json_codec(default_codec)
@@ -0,0 +1,235 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring,consider-using-with
+import asyncio
+import gc
+import threading
+
+import pytest
+import responses
+from responses import matchers
+
+from ibm_cloud_sdk_core import ApiException, BaseService, DetailedResponse, Pager, AsyncPager
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_cloud_sdk_core.pager import get_next_page_token
+
+
+class ListService(BaseService):
+    def __init__(self) -> None:
+        super().__init__(service_url='https://api.example.com/v1', authenticator=NoAuthAuthenticator())
+
+    def list_things(self, *, limit: int = None, start: str = None) -> DetailedResponse:
+        request = self.prepare_request('GET', '/things', params={'limit': limit, 'start': start})
+        return self.send(request)
+
+
+def page_of(start: int, count: int, total: int) -> dict:
+    result = {'things': [{'id': i} for i in range(start, min(start + count, total))]}
+    if start + count < total:
+        result['next'] = {'href': 'https://api.example.com/v1/things?limit={0}&start={1}'.format(count, start + count)}
+    return result
+
+
+def fake_operation(total: int = 10, count: int = 3, calls: list = None):
+    def operation(*, start: str = None, **params) -> DetailedResponse:
+        if calls is not None:
+            calls.append(dict(params, start=start))
+        return DetailedResponse(response=page_of(int(start or 0), count, total), status_code=200)
+
+    return operation
+
+
+def test_get_next_page_token():
+    assert get_next_page_token({'next': {'href': 'https://x/things?start=abc&limit=2'}}) == 'abc'
+    assert get_next_page_token({'next': 'https://x/things?start=abc'}) == 'abc'
+    assert get_next_page_token({'next_url': '/things?start=abc'}) == 'abc'
+    assert get_next_page_token({'next': {'start': 'abc', 'href': 'https://x/things'}}) == 'abc'
+    assert get_next_page_token({'next': {'href': 'https://x/things?offset=20'}}, 'offset') == '20'
+    assert get_next_page_token({'offset': 10, 'limit': 10, 'total_count': 25}, 'offset') == 20
+    assert get_next_page_token({'offset': 20, 'limit': 10, 'total_count': 25}, 'offset') is None
+    assert get_next_page_token({'things': []}) is None
+
+
+@responses.activate
+def test_paginate_service():
+    for start in range(0, 7, 3):
+        query = {'limit': '3', 'start': str(start)} if start else {'limit': '3'}
+        responses.add(
+            responses.GET,
+            'https://api.example.com/v1/things',
+            json=page_of(start, 3, 7),
+            match=[matchers.query_param_matcher(query)],
+        )
+    service = ListService()
+    pager = service.paginate(service.list_things, 'things', limit=3)
+    assert isinstance(pager, Pager)
+    assert [thing['id'] for thing in pager] == list(range(7))
+    assert not pager.has_next()
+    assert len(responses.calls) == 3
+
+
+@pytest.mark.parametrize('prefetch', [0, 1, 3])
+def test_pages(prefetch):
+    calls = []
+    pager = Pager(fake_operation(calls=calls), 'things', prefetch=prefetch, limit=3)
+    assert pager.get_next() == [{'id': 0}, {'id': 1}, {'id': 2}]
+    assert [thing['id'] for thing in pager.get_all()] == list(range(3, 10))
+    assert not pager.has_next()
+    with pytest.raises(StopIteration):
+        pager.get_next()
+    assert calls == [{'limit': 3, 'start': start} for start in [None, '3', '6', '9']]
+
+
+def test_initial_page_param():
+    pager = Pager(fake_operation(), 'things', start='6', prefetch=0)
+    assert [thing['id'] for thing in pager] == [6, 7, 8, 9]
+
+
+def test_offset_pagination():
+    def operation(*, offset: int = None) -> DetailedResponse:
+        offset = offset or 0
+        result = {'offset': offset, 'limit': 4, 'total_count': 10, 'items': list(range(offset, min(offset + 4, 10)))}
+        return DetailedResponse(response=result)
+
+    assert list(Pager(operation, 'items', page_param='offset')) == list(range(10))
+
+
+def test_prefetch_is_bounded():
+    fetched = threading.Semaphore(0)
+    calls = []
+    operation = fake_operation(total=100, count=1, calls=calls)
+
+    def counting_operation(**params) -> DetailedResponse:
+        result = operation(**params)
+        fetched.release()
+        return result
+
+    with Pager(counting_operation, 'things', prefetch=2) as pager:
+        assert pager.get_next() == [{'id': 0}]
+        # The worker fetches the first page, the next 2 pages, and a fourth one that waits for room in the queue.
+        for _ in range(4):
+            assert fetched.acquire(timeout=5)
+        assert not fetched.acquire(timeout=0.3)
+        assert len(calls) == 4
+    assert not pager.has_next()
+
+
+def pager_threads() -> set:
+    return {thread for thread in threading.enumerate() if thread.name == 'ibm-cloud-sdk-core-pager'}
+
+
+def test_break_stops_prefetch():
+    before = pager_threads()
+    pager = Pager(fake_operation(total=100, count=1), 'things')
+    for thing in pager:
+        assert thing == {'id': 0}
+        break
+    assert not pager.has_next()
+    (worker,) = pager_threads() - before
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_abandoned_pager_stops_prefetch():
+    before = pager_threads()
+    pager = Pager(fake_operation(total=100, count=1), 'things')
+    assert pager.get_next() == [{'id': 0}]
+    (worker,) = pager_threads() - before
+    # The worker doesn't keep the pager alive, and exits once it's collected.
+    del pager
+    gc.collect()
+    worker.join(timeout=5)
+    assert not worker.is_alive()
+
+
+def test_error_is_raised_by_consumer():
+    def operation(*, start: str = None) -> DetailedResponse:
+        if start:
+            raise ApiException(500, message='failed')
+        return DetailedResponse(response=page_of(0, 3, 10))
+
+    pager = Pager(operation, 'things')
+    assert len(pager.get_next()) == 3
+    with pytest.raises(ApiException, match='failed'):
+        pager.get_next()
+    assert not pager.has_next()
+
+
+def test_invalid_prefetch():
+    with pytest.raises(ValueError, match='prefetch must be zero or greater'):
+        Pager(fake_operation(), 'things', prefetch=-1)
+
+
+@pytest.mark.parametrize('prefetch', [0, 2])
+def test_async_pager(prefetch):
+    operation = fake_operation()
+
+    async def async_operation(**params) -> DetailedResponse:
+        await asyncio.sleep(0)
+        return operation(**params)
+
+    async def consume():
+        async with AsyncPager(async_operation, 'things', prefetch=prefetch) as pager:
+            first = await pager.get_next()
+            rest = [thing async for thing in pager]
+        return first + rest
+
+    assert [thing['id'] for thing in asyncio.run(consume())] == list(range(10))
+
+
+def test_async_break_cancels_prefetch():
+    waiting = []
+
+    async def async_operation(*, start: str = None) -> DetailedResponse:
+        await asyncio.sleep(0)
+        return DetailedResponse(response=page_of(int(start or 0), 1, 100))
+
+    async def consume():
+        pager = AsyncPager(async_operation, 'things')
+        async for thing in pager:
+            assert thing == {'id': 0}
+            # Wait for the task to fill the queue and block on the next page.
+            await asyncio.sleep(0.01)
+            waiting.append(pager._task)  # pylint: disable=protected-access
+            break
+        # The loop's iterator is finalized by the event loop.
+        await asyncio.sleep(0.01)
+        assert not pager.has_next()
+        assert waiting[0].cancelled()
+
+    asyncio.run(consume())
+
+
+def test_async_pager_close_cancels_prefetch():
+    started = []
+
+    async def async_operation(*, start: str = None) -> DetailedResponse:
+        started.append(start)
+        if start:
+            await asyncio.sleep(60)
+        return DetailedResponse(response=page_of(int(start or 0), 3, 10))
+
+    async def consume():
+        pager = AsyncPager(async_operation, 'things')
+        await pager.get_next()
+        await asyncio.sleep(0.01)
+        await pager.aclose()
+        return pager
+
+    pager = asyncio.run(consume())
+    assert started == [None, '3']
+    assert not pager.has_next()
@@ -0,0 +1,152 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import asyncio
+import threading
+import time
+from email.utils import formatdate
+
+import pytest
+from urllib3 import HTTPResponse
+
+from ibm_cloud_sdk_core import RateLimiter, RetryPolicy
+from ibm_cloud_sdk_core.rate_limiter import rate_limited_request
+
+URL = 'https://api.example.com/v1/things'
+
+
+def test_invalid_arguments():
+    with pytest.raises(ValueError, match='rate must be greater than 0'):
+        RateLimiter(0)
+    with pytest.raises(ValueError, match="per must be 'host' or 'path'"):
+        RateLimiter(10, per='operation')
+    with pytest.raises(ValueError, match='max_buckets must be at least 1'):
+        RateLimiter(10, max_buckets=0)
+
+
+def test_burst_then_rate():
+    limiter = RateLimiter(20, burst=2)
+    assert limiter.acquire(URL) == 0
+    assert limiter.acquire(URL) == 0
+    # The next requests wait for the bucket to refill, one after the other.
+    assert limiter.acquire(URL) == pytest.approx(0.05, abs=0.01)
+    start = time.monotonic()
+    limiter.acquire(URL)
+    assert time.monotonic() - start == pytest.approx(0.05, abs=0.02)
+
+
+def test_queue_depth():
+    limiter = RateLimiter(10, burst=1)
+    limiter.acquire(URL)
+    threads = [threading.Thread(target=limiter.acquire, args=(URL,)) for _ in range(3)]
+    for thread in threads:
+        thread.start()
+    time.sleep(0.05)
+    assert limiter.get_queue_depth(URL) == 3
+    assert limiter.get_queue_depth() == 3
+    assert limiter.get_queue_depth('https://other.example.com') == 0
+    for thread in threads:
+        thread.join()
+    assert limiter.get_queue_depth() == 0
+
+
+def test_429_halves_rate_and_honors_retry_after():
+    limiter = RateLimiter(100, burst=10)
+    limiter.acquire(URL)
+    limiter.record_response(URL, 429, {'Retry-After': '0.2'})
+    assert limiter.get_rate(URL) == 50
+    assert limiter.acquire(URL) == pytest.approx(0.2, abs=0.02)
+
+    limiter.record_response(URL, 429, {'Retry-After': formatdate(time.time() + 1, usegmt=True)})
+    assert limiter.get_rate(URL) == 25
+    # The wait is the Retry-After delay, plus the token owed by the request before at 25 requests per second.
+    assert 0 < limiter.acquire('https://API.example.com/v1/other') <= 1 + 1 / 25
+
+    # The rate is never reduced below min_rate.
+    limiter = RateLimiter(10, min_rate=4)
+    limiter.record_response(URL, 429, {})
+    limiter.record_response(URL, 429, {})
+    assert limiter.get_rate(URL) == 4
+
+
+def test_rate_recovers_after_success():
+    limiter = RateLimiter(100)
+    limiter.record_response(URL, 429, {'Retry-After': '0'})
+    assert limiter.get_rate(URL) == 50
+    for _ in range(3):
+        limiter.record_response(URL, 200, {})
+    assert limiter.get_rate(URL) == 80
+    for _ in range(3):
+        limiter.record_response(URL, 200, {})
+    assert limiter.get_rate(URL) == 100
+
+
+def test_rate_limit_headers():
+    limiter = RateLimiter(100)
+    limiter.record_response(URL, 200, {'X-RateLimit-Remaining': '50', 'X-RateLimit-Reset': '10'})
+    assert limiter.get_rate(URL) == 5
+    # The reset time can be an epoch timestamp.
+    limiter.record_response(URL, 200, {'X-RateLimit-Remaining': '20', 'X-RateLimit-Reset': str(time.time() + 10)})
+    assert limiter.get_rate(URL) == pytest.approx(2, rel=0.01)
+    limiter.record_response(URL, 200, {'X-RateLimit-Remaining': '0', 'X-RateLimit-Reset': '0.1'})
+    assert limiter.acquire(URL) == pytest.approx(0.1, abs=0.02)
+
+
+def test_per_path():
+    limiter = RateLimiter(10, burst=1, per='path')
+    limiter.acquire(URL)
+    assert limiter.acquire('https://api.example.com/v1/others') == 0
+    limiter.record_response(URL, 429, {'Retry-After': '0'})
+    assert limiter.get_stats() == {
+        'api.example.com/v1/things': {'rate': 5, 'queue_depth': 0},
+        'api.example.com/v1/others': {'rate': 10, 'queue_depth': 0},
+    }
+
+    # Paths are forgotten, least recently used first, so that resource IDs don't grow the buckets without bound.
+    limiter = RateLimiter(10, per='path', max_buckets=2)
+    for i in range(100):
+        limiter.acquire('https://api.example.com/v1/things/{0}'.format(i))
+    limiter.record_response(URL + '/98', 429, {})
+    limiter.acquire(URL + '/100')
+    assert list(limiter.get_stats()) == ['api.example.com/v1/things/98', 'api.example.com/v1/things/100']
+    assert limiter.get_rate(URL + '/98') == 5
+
+
+def test_retries_wait_for_rate_limiter():
+    limiter = RateLimiter(20, burst=1)
+    retry = RetryPolicy(total=2, status_forcelist=[429])
+    limiter.acquire(URL)
+    # urllib3 calls sleep() before each retry.
+    with rate_limited_request(limiter, URL):
+        start = time.monotonic()
+        retry.sleep(HTTPResponse(status=429, headers={'Retry-After': '0'}))
+        # The 429 response halved the rate, and the retry waited for a token.
+        assert limiter.get_rate(URL) == 10
+        assert time.monotonic() - start == pytest.approx(0.1, abs=0.03)
+    # Outside of the block, the retries of other requests don't wait.
+    start = time.monotonic()
+    retry.sleep()
+    assert time.monotonic() - start < 0.02
+
+
+def test_acquire_async():
+    limiter = RateLimiter(20, burst=1)
+
+    async def acquire_all():
+        return await asyncio.gather(*(limiter.acquire_async(URL) for _ in range(3)))
+
+    assert sorted(asyncio.run(acquire_all())) == pytest.approx([0, 0.05, 0.1], abs=0.01)
@@ -0,0 +1,185 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import asyncio
+import io
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+import jwt
+import pytest
+import responses
+
+from ibm_cloud_sdk_core import ApiException, AsyncBaseService, BaseService
+from ibm_cloud_sdk_core.authenticators import IAMAuthenticator, NoAuthAuthenticator
+
+IAM_URL = 'https://iam.cloud.ibm.com/identity/token'
+SERVICE_URL = 'https://mockurl/'
+
+
+def add_iam_response(mock_responses) -> list:
+    """Respond to the token requests with a new token each time, and return the list of tokens."""
+    tokens = []
+
+    def callback(request):  # pylint: disable=unused-argument
+        now = int(time.time())
+        tokens.append(jwt.encode({'iat': now, 'exp': now + 3600, 'n': len(tokens)}, 'secret', algorithm='HS256'))
+        body = {'access_token': tokens[-1], 'refresh_token': 'refresh', 'token_type': 'Bearer', 'expires_in': 3600}
+        return (200, {}, json.dumps(body))
+
+    mock_responses.add_callback(responses.POST, IAM_URL, callback=callback)
+    return tokens
+
+
+def add_service_response(mock_responses, tokens: list, valid_from: int = 1) -> list:
+    """Reject the tokens before tokens[valid_from], and return the list of the request bodies."""
+    bodies = []
+
+    def callback(request):
+        body = request.body.read() if hasattr(request.body, 'read') else request.body
+        bodies.append(body)
+        if request.headers.get('Authorization', '') in ['', *('Bearer ' + token for token in tokens[:valid_from])]:
+            return (401, {}, '{"errors": [{"message": "Unauthorized"}]}')
+        return (200, {}, '{"ok": true}')
+
+    mock_responses.add_callback(responses.POST, SERVICE_URL, callback=callback, content_type='application/json')
+    return bodies
+
+
+def new_service() -> BaseService:
+    service = BaseService(service_url=SERVICE_URL, authenticator=IAMAuthenticator('apikey'))
+    service.set_reauthenticate_on_401()
+    return service
+
+
+@responses.activate
+def test_replay_with_new_token():
+    tokens = add_iam_response(responses)
+    bodies = add_service_response(responses, tokens)
+    service = new_service()
+    data = io.BytesIO(b'some data')
+    response = service.send(service.prepare_request('POST', url='', data=data))
+    assert response.get_result() == {'ok': True}
+    assert len(tokens) == 2
+    # The body was rewound for the replay.
+    assert bodies == [b'some data', b'some data']
+
+
+@responses.activate
+def test_no_replay():
+    tokens = add_iam_response(responses)
+    bodies = add_service_response(responses, tokens)
+    service = new_service()
+    service.set_reauthenticate_on_401(False)
+    with pytest.raises(ApiException) as err:
+        service.send(service.prepare_request('POST', url='', data='{}'))
+    assert err.value.status_code == 401
+
+    # A stream that can't be rewound can't be sent again.
+    service.set_reauthenticate_on_401()
+    read_end, write_end = os.pipe()
+    os.write(write_end, b'some data')
+    os.close(write_end)
+    with open(read_end, 'rb') as pipe:
+        with pytest.raises(ApiException):
+            service.send(service.prepare_request('POST', url='', data=pipe))
+    assert len(tokens) == 1
+    assert len(bodies) == 2
+
+    # Nor can a generator.
+    with pytest.raises(ApiException):
+        service.send(service.prepare_request('POST', url='', data=(chunk for chunk in [b'some ', b'data'])))
+    assert len(tokens) == 1
+    assert len(bodies) == 3
+
+    # The authenticator doesn't fetch tokens.
+    service = BaseService(service_url=SERVICE_URL, authenticator=NoAuthAuthenticator())
+    service.set_reauthenticate_on_401()
+    with pytest.raises(ApiException):
+        service.send(service.prepare_request('POST', url=''))
+    assert len(bodies) == 4
+
+
+@responses.activate
+def test_replay_once_and_limit_invalidations():
+    tokens = add_iam_response(responses)
+    bodies = add_service_response(responses, tokens, valid_from=100)
+    service = new_service()
+    with pytest.raises(ApiException) as err:
+        service.send(service.prepare_request('POST', url=''))
+    assert err.value.status_code == 401
+    assert len(bodies) == 2
+    assert len(tokens) == 2
+
+    # The new token was invalidated too recently, it is not invalidated again.
+    with pytest.raises(ApiException):
+        service.send(service.prepare_request('POST', url=''))
+    assert len(bodies) == 3
+    assert len(tokens) == 2
+
+
+@responses.activate
+def test_concurrent_401_single_refresh():
+    tokens = add_iam_response(responses)
+    bodies = add_service_response(responses, tokens)
+    service = new_service()
+    requests_to_send = [service.prepare_request('POST', url='') for _ in range(8)]
+    with ThreadPoolExecutor(8) as executor:
+        results = list(executor.map(service.send, requests_to_send))
+    assert all(result.get_status_code() == 200 for result in results)
+    assert len(bodies) == 16
+    assert len(tokens) == 2
+
+
+class AnyAsyncService(AsyncBaseService):
+    pass
+
+
+@responses.activate
+def test_async_replay_with_new_token():
+    tokens = add_iam_response(responses)
+    authorizations = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        authorizations.append(request.headers['Authorization'])
+        if request.headers['Authorization'] == 'Bearer ' + tokens[0]:
+            return httpx.Response(401, json={})
+        return httpx.Response(200, json={'ok': True})
+
+    service = AnyAsyncService(service_url=SERVICE_URL, authenticator=IAMAuthenticator('apikey'))
+    service.set_async_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    service.set_reauthenticate_on_401()
+
+    async def call():
+        request = await service.prepare_request('GET', url='')
+        return await service.send(request)
+
+    assert asyncio.run(call()).get_result() == {'ok': True}
+    assert authorizations == ['Bearer ' + token for token in tokens]
+    assert len(tokens) == 2
+
+
+def test_reauthenticate_external_config():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-reauthenticate.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = BaseService(service_url=SERVICE_URL, authenticator=NoAuthAuthenticator())
+    service.configure_service('include_external_config')
+    assert service.reauthenticate_on_401 is True
+    del os.environ['IBM_CREDENTIALS_FILE']
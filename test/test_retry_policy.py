@@ -0,0 +1,132 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring
+import os
+
+import pytest
+import responses
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError
+
+from ibm_cloud_sdk_core import ApiException, BaseService, RetryBudget, RetryPolicy
+from ibm_cloud_sdk_core.authenticators import NoAuthAuthenticator
+from ibm_cloud_sdk_core.retry_policy import compute_backoff
+
+
+def test_compute_backoff():
+    assert compute_backoff('exponential', 1, 1.0, 30.0) == 0
+    assert compute_backoff('exponential', 3, 1.0, 30.0) == 4
+    assert compute_backoff('exponential', 100, 1.0, 30.0) == 30
+    for _ in range(100):
+        assert 0 <= compute_backoff('full_jitter', 3, 1.0, 30.0) <= 4
+        assert 2 <= compute_backoff('equal_jitter', 3, 1.0, 30.0) <= 4
+        assert 1 <= compute_backoff('decorrelated_jitter', 1, 1.0, 30.0) <= 3
+        assert 1 <= compute_backoff('decorrelated_jitter', 2, 1.0, 30.0, previous=5) <= 15
+        assert compute_backoff('decorrelated_jitter', 5, 1.0, 2.0, previous=20) <= 2
+    # The jittered delays are spread out.
+    assert len({compute_backoff('full_jitter', 3, 1.0, 30.0) for _ in range(10)}) > 1
+    with pytest.raises(ValueError, match='Unsupported backoff strategy: linear'):
+        compute_backoff('linear', 1, 1.0, 30.0)
+
+
+def test_retry_budget(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr('ibm_cloud_sdk_core.retry_policy.time.monotonic', lambda: now[0])
+    budget = RetryBudget(0.1, min_retries_per_second=0.1, window=10)
+    assert budget.get_available() == 1
+    for _ in range(20):
+        budget.record_request()
+    assert budget.get_available() == 3
+    assert budget.try_acquire() and budget.try_acquire() and budget.try_acquire()
+    assert not budget.can_retry()
+    assert not budget.try_acquire()
+
+    # The requests and retries leave the window after 10 seconds.
+    now[0] += 10
+    assert budget.get_available() == 1
+
+    with pytest.raises(ValueError):
+        RetryBudget(-1)
+    with pytest.raises(ValueError):
+        RetryBudget(window=0)
+
+
+def test_retry_policy_backoff():
+    assert RetryPolicy().backoff_strategy == 'exponential'
+    retry = RetryPolicy(total=5, backoff_strategy='decorrelated_jitter', backoff_factor=1.0, backoff_max=30.0)
+    assert retry.get_backoff_time() == 0
+    error = ConnectTimeoutError()
+    previous = 1.0
+    for _ in range(4):
+        retry = retry.increment(error=error)
+        assert isinstance(retry, RetryPolicy)
+        assert 1 <= retry.get_backoff_time() <= min(previous * 3, 30)
+        previous = retry.get_backoff_time()
+
+    retry = RetryPolicy(total=2, backoff_strategy='exponential', backoff_factor=1.0, backoff_max=30.0)
+    assert retry.increment(error=error).get_backoff_time() == 0
+    assert retry.increment(error=error).increment(error=error).get_backoff_time() == 2
+
+    with pytest.raises(ValueError):
+        RetryPolicy(backoff_strategy='linear')
+
+
+def test_retry_policy_budget_fails_fast():
+    budget = RetryBudget(0, min_retries_per_second=0.2, window=10)
+    retry = RetryPolicy(total=5, retry_budget=budget, status_forcelist=[503])
+    error = ConnectTimeoutError()
+    retry = retry.increment(error=error)
+    assert retry.is_retry('GET', 503)
+    retry = retry.increment(error=error)
+    with pytest.raises(MaxRetryError) as err:
+        retry.increment(error=error)
+    assert err.value.reason is error
+    assert not retry.is_retry('GET', 503)
+
+
+@responses.activate
+def test_enable_retries_with_budget():
+    url = 'https://mockurl/'
+    responses.add(responses.GET, url, status=503)
+    service = BaseService(service_url=url, authenticator=NoAuthAuthenticator())
+    # The retries don't use jitter unless a jittered strategy is selected.
+    service.enable_retries()
+    assert service.retry_config.backoff_strategy == 'exponential'
+    budget = RetryBudget(0, min_retries_per_second=0.2, window=10)
+    service.enable_retries(max_retries=4, retry_interval=0.01, backoff_strategy='full_jitter', retry_budget=budget)
+    assert service.retry_config.backoff_strategy == 'full_jitter'
+    assert service.http_client.get_adapter('https://').max_retries.retry_budget is budget
+
+    with pytest.raises(ApiException) as err:
+        service.send(service.prepare_request('GET', url=''))
+    assert err.value.status_code == 503
+    # The budget allowed 2 retries, the next failure is returned without retrying.
+    assert len(responses.calls) == 3
+    with pytest.raises(ApiException):
+        service.send(service.prepare_request('GET', url=''))
+    assert len(responses.calls) == 4
+
+
+def test_retry_policy_external_config():
+    file_path = os.path.join(os.path.dirname(__file__), '../resources/ibm-credentials-retry-policy.env')
+    os.environ['IBM_CREDENTIALS_FILE'] = file_path
+    service = BaseService(service_url='https://mockurl/', authenticator=NoAuthAuthenticator())
+    service.configure_service('include_external_config')
+    assert service.retry_config.total == 3
+    assert service.retry_config.backoff_strategy == 'equal_jitter'
+    assert service.retry_config.retry_budget.ratio == 0.2
+    assert service.retry_config.retry_budget.min_retries_per_second == 0.5
+    del os.environ['IBM_CREDENTIALS_FILE']
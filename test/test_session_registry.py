@@ -0,0 +1,75 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring,protected-access
+import requests
+import responses
+from urllib3.util.retry import Retry
+
+from ibm_cloud_sdk_core.http_adapter import SSLHTTPAdapter
+from ibm_cloud_sdk_core.session_registry import SessionRegistry
+
+
+def test_get_session():
+    registry = SessionRegistry()
+    session = registry.get_session('https://iam.cloud.ibm.com/identity/token')
+    assert isinstance(session, requests.Session)
+    assert isinstance(session.get_adapter('https://iam.cloud.ibm.com'), SSLHTTPAdapter)
+
+    # Same origin, same session.
+    assert registry.get_session('https://IAM.cloud.ibm.com') is session
+    # Different host or SSL verification mode, different session.
+    assert registry.get_session('https://iam.test.cloud.ibm.com') is not session
+    other = registry.get_session('https://iam.cloud.ibm.com', disable_ssl_verification=True)
+    assert other is not session
+    assert other.get_adapter('https://iam.cloud.ibm.com')._disable_ssl_verification is True
+
+    registry.close()
+    assert registry.get_session('https://iam.cloud.ibm.com') is not session
+
+
+def test_default_registry():
+    assert SessionRegistry.get_default() is SessionRegistry.get_default()
+
+
+@responses.activate
+def test_session_does_not_store_cookies():
+    responses.add(responses.GET, 'https://iam.cloud.ibm.com/', status=200, headers={'Set-Cookie': 'id=123; Path=/'})
+    session = SessionRegistry().get_session('https://iam.cloud.ibm.com')
+    session.get('https://iam.cloud.ibm.com/')
+    session.get('https://iam.cloud.ibm.com/')
+    assert len(session.cookies) == 0
+    assert 'Cookie' not in responses.calls[1].request.headers
+
+
+def test_session_key_includes_retries_and_pool_settings():
+    registry = SessionRegistry()
+    session = registry.get_session('https://example.com')
+    assert session.get_adapter('https://example.com').max_retries.total == 0
+
+    retries = Retry(total=4, status_forcelist=[429, 500])
+    with_retries = registry.get_session('https://example.com', max_retries=retries)
+    assert with_retries is not session
+    assert with_retries.get_adapter('https://example.com').max_retries is retries
+    # Equal retry policies share a session.
+    assert registry.get_session('https://example.com', max_retries=Retry(total=4, status_forcelist=[500, 429])) is (
+        with_retries
+    )
+
+    bigger = registry.get_session('https://example.com', pool_maxsize=64, pool_block=True)
+    assert bigger is not session
+    assert bigger.get_adapter('https://example.com')._pool_maxsize == 64
+    assert bigger.get_adapter('https://example.com')._pool_block is True
@@ -15,12 +15,16 @@
 # limitations under the License.
 
 # pylint: disable=missing-docstring,protected-access,abstract-class-instantiated
+import asyncio
+import threading
+import time
 from types import SimpleNamespace
 from unittest import mock
 
 import pytest
+import requests
 
-from ibm_cloud_sdk_core import ApiException
+from ibm_cloud_sdk_core import ApiException, DeadlineExceededException, deadline_scope
 from ibm_cloud_sdk_core.token_managers.token_manager import TokenManager
 
 
@@ -42,7 +46,7 @@ def requests_request_spy(*args, **kwargs):
     return SimpleNamespace(status_code=200, request_args=args, request_kwargs=kwargs)
 
 
-@mock.patch('requests.request', side_effect=requests_request_spy)
+@mock.patch('requests.Session.request', side_effect=requests_request_spy)
 def test_request_passes_disable_ssl_verification(request):  # pylint: disable=unused-argument
     mock_token_manager = MockTokenManager(url="https://example.com", disable_ssl_verification=True)
     assert mock_token_manager.request_token().request_kwargs['verify'] is False
@@ -52,13 +56,21 @@ def requests_request_error_mock(*args, **kwargs):  # pylint: disable=unused-argu
     return SimpleNamespace(status_code=300, headers={}, text="")
 
 
-@mock.patch('requests.request', side_effect=requests_request_error_mock)
+@mock.patch('requests.Session.request', side_effect=requests_request_error_mock)
 def test_request_raises_for_non_2xx(request):  # pylint: disable=unused-argument
     mock_token_manager = MockTokenManager(url="https://example.com", disable_ssl_verification=True)
     with pytest.raises(ApiException):
         mock_token_manager.request_token()
 
 
+@mock.patch('requests.Session.request', side_effect=requests_request_spy)
+def test_request_capped_by_deadline(request):  # pylint: disable=unused-argument
+    mock_token_manager = MockTokenManager(url="https://example.com")
+    assert mock_token_manager.request_token().request_kwargs['timeout'] == 60
+    with deadline_scope(5):
+        assert 4 < mock_token_manager.request_token().request_kwargs['timeout'] <= 5
+
+
 def test_set_disable_ssl_verification_success():
     token_manager = MockTokenManager(None)
     assert token_manager.disable_ssl_verification is False
@@ -74,3 +86,224 @@ def test_set_disable_ssl_verification_fail():
         token_manager.set_disable_ssl_verification('True')
     assert str(err.value) == 'status must be a bool'
     assert token_manager.disable_ssl_verification is False
+
+
+class CountingTokenManager(TokenManager):
+    def __init__(self, url: str, *, error: Exception = None):
+        super().__init__(url)
+        self.error = error
+        self.request_count = 0
+        self.request_threads = set()
+
+    def request_token(self) -> dict:
+        self.request_count += 1
+        self.request_threads.add(threading.get_ident())
+        time.sleep(0.1)
+        if self.error:
+            raise self.error
+        return {'access_token': 'token-{0}'.format(self.request_count)}
+
+    def _save_token_info(self, token_response: dict) -> None:
+        self.access_token = token_response['access_token']
+        self.expire_time = self._get_current_time() + 3600
+        self.refresh_time = self.expire_time - 720
+
+
+def test_async_get_token_single_flight():
+    token_manager = CountingTokenManager('https://example.com')
+
+    async def get_tokens():
+        return await asyncio.gather(*(token_manager.async_get_token() for _ in range(20)))
+
+    assert asyncio.run(get_tokens()) == ['token-1'] * 20
+    assert token_manager.request_count == 1
+
+    # The token is cached now.
+    assert asyncio.run(token_manager.async_get_token()) == 'token-1'
+    assert token_manager.request_count == 1
+
+
+def test_async_get_token_background_refresh():
+    token_manager = CountingTokenManager('https://example.com')
+
+    async def refresh():
+        await token_manager.async_get_token()
+        token_manager.refresh_time = 0
+        # The current token is still valid, so it's returned while the refresh runs in the background.
+        token = await token_manager.async_get_token()
+        await token_manager._async_token_task
+        return token
+
+    assert asyncio.run(refresh()) == 'token-1'
+    assert token_manager.access_token == 'token-2'
+    assert token_manager.request_count == 2
+
+
+def test_async_get_token_error():
+    token_manager = CountingTokenManager('https://example.com', error=ApiException(500, message='IAM is down'))
+
+    async def get_tokens():
+        return await asyncio.gather(*(token_manager.async_get_token() for _ in range(5)), return_exceptions=True)
+
+    results = asyncio.run(get_tokens())
+    assert all(isinstance(result, ApiException) for result in results)
+    assert token_manager.request_count == 1
+
+    # The next caller issues a new request.
+    token_manager.error = None
+    assert asyncio.run(token_manager.async_get_token()) == 'token-2'
+
+
+def test_paced_request_token_wakes_waiters():
+    token_manager = CountingTokenManager('https://example.com')
+    durations = []
+
+    def get_token():
+        start = time.monotonic()
+        assert token_manager.get_token() == 'token-1'
+        durations.append(time.monotonic() - start)
+
+    threads = [threading.Thread(target=get_token) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert token_manager.request_count == 1
+    # Waiting threads are woken up when the token is stored instead of polling every 0.5 seconds.
+    assert max(durations) < 0.4
+    assert token_manager.request_time == 0
+
+
+def test_paced_request_token_propagates_error():
+    token_manager = CountingTokenManager('https://example.com', error=ApiException(500, message='IAM is down'))
+    errors = []
+
+    def get_token():
+        try:
+            token_manager.get_token()
+        except ApiException as err:
+            errors.append(err)
+
+    threads = [threading.Thread(target=get_token) for _ in range(10)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(errors) == 10
+    assert token_manager.request_count == 1
+    assert token_manager.request_time == 0
+
+    # The next caller becomes the active requester again.
+    token_manager.error = None
+    assert token_manager.get_token() == 'token-2'
+
+
+class ShortLivedTokenManager(CountingTokenManager):
+    BACKGROUND_REFRESH_MIN_INTERVAL = 0.05
+
+    def _save_token_info(self, token_response: dict) -> None:
+        self.access_token = token_response['access_token']
+        self.expire_time = time.time() + 60
+        self.refresh_time = time.time() + 0.3
+
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_background_refresh():
+    token_manager = ShortLivedTokenManager('https://example.com')
+    token_manager.enable_background_refresh()
+    assert token_manager.is_background_refresh_enabled()
+    try:
+        # The first token is fetched right away, then refreshed without any get_token() call.
+        assert wait_for(lambda: token_manager.access_token == 'token-1')
+        assert wait_for(lambda: token_manager.request_count >= 3)
+
+        # Callers only read the cached token, even when it's due for a refresh.
+        token_manager.refresh_time = 0
+        assert token_manager.get_token().startswith('token-')
+        assert threading.get_ident() not in token_manager.request_threads
+    finally:
+        token_manager.disable_background_refresh()
+    assert not token_manager.is_background_refresh_enabled()
+
+    # No refreshes happen after it's been disabled.
+    time.sleep(0.5)
+    request_count = token_manager.request_count
+    time.sleep(0.5)
+    assert token_manager.request_count == request_count
+
+
+class FailingShortLivedTokenManager(ShortLivedTokenManager):
+    BACKGROUND_REFRESH_RETRY_INTERVAL = 0.1
+
+
+def test_background_refresh_error():
+    token_manager = FailingShortLivedTokenManager('https://example.com', error=ApiException(500, message='down'))
+    token_manager.enable_background_refresh()
+    try:
+        # Failed fetches are retried.
+        assert wait_for(lambda: token_manager.request_count >= 2)
+        token_manager.error = None
+        assert wait_for(lambda: token_manager.access_token is not None)
+    finally:
+        token_manager.disable_background_refresh()
+
+
+def test_http_client():
+    token_manager = MockTokenManager('https://iam.cloud.ibm.com')
+    other_token_manager = MockTokenManager('https://iam.cloud.ibm.com')
+    # Token managers that talk to the same host share a pooled session.
+    assert isinstance(token_manager.get_http_client(), requests.Session)
+    assert token_manager.get_http_client() is other_token_manager.get_http_client()
+    assert token_manager.get_http_client() is not MockTokenManager('https://other.example.com').get_http_client()
+
+    http_client = requests.Session()
+    token_manager.set_http_client(http_client)
+    assert token_manager.get_http_client() is http_client
+    token_manager.set_http_client(None)
+    assert token_manager.get_http_client() is other_token_manager.get_http_client()
+
+    with pytest.raises(TypeError):
+        token_manager.set_http_client('bad_argument_type')
+
+
+def test_async_get_token_deadline():
+    token_manager = CountingTokenManager('https://example.com')
+
+    async def get_token():
+        with deadline_scope(0.02):
+            with pytest.raises(DeadlineExceededException):
+                await token_manager.async_get_token()
+        # The token request is shared, it was not cancelled with the first caller.
+        return await token_manager.async_get_token()
+
+    assert asyncio.run(get_token()) == 'token-1'
+    assert token_manager.request_count == 1
+
+
+def test_invalidate_token():
+    token_manager = CountingTokenManager('https://example.com')
+    assert token_manager.get_token() == 'token-1'
+    # Another token than the stored one, or the same token twice, doesn't cause a token request.
+    assert token_manager.invalidate_token('token-0')
+    assert token_manager.get_token() == 'token-1'
+    assert token_manager.invalidate_token('token-1')
+    assert token_manager.invalidate_token('token-1')
+    assert token_manager.get_token() == 'token-2'
+    assert token_manager.request_count == 2
+
+    # The new token can't be invalidated right away.
+    assert not token_manager.invalidate_token('token-2')
+    assert token_manager.get_token() == 'token-2'
+    token_manager._invalidated_at -= TokenManager.TOKEN_INVALIDATION_MIN_INTERVAL  # pylint: disable=protected-access
+    assert token_manager.invalidate_token('token-2')
+    assert token_manager.get_token() == 'token-3'
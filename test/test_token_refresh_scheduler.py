@@ -0,0 +1,116 @@
+# coding: utf-8
+
+# Copyright 2026 IBM All Rights Reserved.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+# pylint: disable=missing-docstring,protected-access
+import threading
+import time
+
+import pytest
+
+from ibm_cloud_sdk_core import ApiException, TokenRefreshScheduler
+from ibm_cloud_sdk_core.token_managers.token_manager import TokenManager
+
+
+class ShortLivedTokenManager(TokenManager):
+    BACKGROUND_REFRESH_MIN_INTERVAL = 0.05
+    BACKGROUND_REFRESH_RETRY_INTERVAL = 0.1
+
+    def __init__(self, url: str, *, fail: bool = False):
+        super().__init__(url)
+        self.fail = fail
+        self.request_count = 0
+
+    def request_token(self) -> dict:
+        self.request_count += 1
+        if self.fail:
+            raise ApiException(500, message='IAM is down')
+        return {'access_token': 'token-{0}'.format(self.request_count)}
+
+    def _save_token_info(self, token_response: dict) -> None:
+        self.access_token = token_response['access_token']
+        self.expire_time = time.time() + 60
+        self.refresh_time = time.time() + 0.2
+
+
+def wait_for(condition, timeout: float = 5) -> bool:
+    deadline = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def test_scheduler_refreshes_many_token_managers():
+    scheduler = TokenRefreshScheduler(max_workers=2)
+    token_managers = [ShortLivedTokenManager('https://example.com') for _ in range(20)]
+    try:
+        thread_count = threading.active_count()
+        for token_manager in token_managers:
+            token_manager.enable_background_refresh(scheduler)
+        # One scheduler thread and two workers, no matter how many token managers are registered.
+        assert threading.active_count() - thread_count <= 3
+
+        assert wait_for(lambda: all(tm.request_count >= 3 for tm in token_managers))
+        stats = scheduler.get_stats()
+        assert stats['registered'] == 20
+        assert stats['refresh_count'] >= 60
+        assert stats['failure_count'] == 0
+        assert stats['max_refresh_lag'] >= stats['last_refresh_lag'] >= 0
+
+        for token_manager in token_managers:
+            token_manager.disable_background_refresh()
+        assert scheduler.get_stats()['registered'] == 0
+        time.sleep(0.3)
+        request_counts = [tm.request_count for tm in token_managers]
+        time.sleep(0.3)
+        assert [tm.request_count for tm in token_managers] == request_counts
+    finally:
+        scheduler.shutdown()
+
+
+def test_scheduler_retries_failed_refresh():
+    scheduler = TokenRefreshScheduler(max_workers=1)
+    token_manager = ShortLivedTokenManager('https://example.com', fail=True)
+    try:
+        token_manager.enable_background_refresh(scheduler)
+        assert scheduler.is_registered(token_manager)
+        assert wait_for(lambda: scheduler.get_stats()['failure_count'] >= 2)
+        token_manager.fail = False
+        assert wait_for(lambda: token_manager.access_token is not None)
+    finally:
+        scheduler.shutdown()
+
+    with pytest.raises(RuntimeError):
+        scheduler.register(ShortLivedTokenManager('https://example.com'))
+
+
+def test_scheduler_drops_collected_token_managers():
+    scheduler = TokenRefreshScheduler(max_workers=1)
+    try:
+        token_manager = ShortLivedTokenManager('https://example.com')
+        token_manager.enable_background_refresh(scheduler)
+        assert wait_for(lambda: token_manager.access_token is not None)
+        del token_manager
+        assert wait_for(lambda: scheduler.get_stats()['registered'] == 0)
+    finally:
+        scheduler.shutdown()
+
+
+def test_default_scheduler():
+    assert TokenRefreshScheduler.get_default() is TokenRefreshScheduler.get_default()
+    with pytest.raises(ValueError):
+        TokenRefreshScheduler(max_workers=0)
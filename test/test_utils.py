@@ -1,4 +1,4 @@
-# pylint: disable=missing-docstring
+# pylint: disable=missing-docstring,protected-access
 # coding: utf-8
 
 # Copyright 2019, 2024 IBM All Rights Reserved.
@@ -16,6 +16,8 @@
 # limitations under the License.
 
 import datetime
+import gzip
+import io
 import logging
 import os
 from typing import Optional
@@ -335,3 +337,52 @@ def test_gzip_stream_open_string():
 def test_gzip_stream_open_bytes():
     stream = GzipStream(source=b'foobar')
     assert stream is not None
+
+
+def test_gzip_stream_read():
+    data = b''.join(i.to_bytes(4, 'big') for i in range(100000))
+    stream = GzipStream(source=io.BytesIO(data), chunk_size=1000)
+    chunks = []
+    while True:
+        chunk = stream.read(777)
+        if not chunk:
+            break
+        assert len(chunk) <= 777
+        chunks.append(chunk)
+    assert len(chunks) > 1
+    assert gzip.decompress(b''.join(chunks)) == data
+
+    assert gzip.decompress(GzipStream(source='foobar').read()) == b'foobar'
+    assert gzip.decompress(GzipStream(source=b'').read()) == b''
+
+    cr_token_file = os.path.join(os.path.dirname(__file__), '../resources/cr-token.txt')
+    with open(cr_token_file, 'r', encoding='utf-8') as f:
+        expected = f.read().encode()
+    with open(cr_token_file, 'r', encoding='utf-8') as f:
+        assert gzip.decompress(GzipStream(source=f, chunk_size=7).read()) == expected
+
+
+def test_gzip_stream_readinto():
+    data = os.urandom(2 * 1024 * 1024)
+    stream = GzipStream(source=io.BytesIO(data), chunk_size=4096)
+    buffer = bytearray(1000)
+    compressed = bytearray()
+    while True:
+        size = stream.readinto(buffer)
+        if size == 0:
+            break
+        compressed += buffer[:size]
+        # Only the output of the current chunk is buffered, no matter how large the source is.
+        assert len(stream._buffer) <= 64 * 1024
+    assert gzip.decompress(compressed) == data
+
+    # The stream can also be wrapped in a buffered reader.
+    assert gzip.decompress(io.BufferedReader(GzipStream(source=data)).read()) == data
+
+
+def test_gzip_stream_close():
+    source = io.BytesIO(b'foobar')
+    stream = GzipStream(source=source)
+    stream.close()
+    assert source.closed
+    assert stream.closed